@@ -7,6 +7,8 @@ A Python package for unit and dimension handling, unit conversion, units arithem
 support for custom units definition.
 """
 
+__version__ = "1.2.0"
+
 from .base import (
     LENGTH,
     MASS,
@@ -38,6 +40,9 @@ from .base import (
     ATTO,
     _UnitType,
     OrderUnit,
+    UNIT_STYLES,
+    set_printoptions,
+    get_printoptions,
 )
 
 from .units import (
@@ -68,50 +73,6 @@ from .units import (
     AMPERE,
     MOLE,
     CANDELA,
-    NEWTON,
-    POUND_FORCE,
-    POUNDAL,
-    DYNE,
-    PASCAL,
-    PSI,
-    mmHg,
-    inHg,
-    BAR,
-    ATM,
-    POUND_PER_SQUARE_FOOT,
-    JOULE,
-    BRITISH_THERMAL_UNIT,
-    CALORIE,
-    WATT_HOUR,
-    ELECTRON_VOLT,
-    KILOGRAM_PER_CUBIC_METER,
-    GRAM_PER_CUBIC_CENTIMETER,
-    GRAM_PER_CUBIC_MILLILITER,
-    POUND_PER_CUBIC_FOOT,
-    POUND_PER_CUBIC_INCH,
-    SLUG_PER_CUBIC_FOOT,
-    WATT,
-    HORSEPOWER,
-    BTU_PER_HOUR,
-    VOLT,
-    FARAD,
-    HENRY,
-    WEBER,
-    OHMS,
-    TESLA,
-    SIEMENS,
-    LUX,
-    BECQUEREL,
-    CURIE,
-    GRAY,
-    RAD,
-    SIEVERT,
-    REM,
-    METER_PER_SECOND,
-    MILE_PER_HOUR,
-    KM_PER_HOUR,
-    FOOT_PER_SECOND,
-    KNOT,
 )
 
 from .dimensions import (
@@ -135,14 +96,6 @@ from .dimensions import (
     Energy,
     Density,
     Power,
-    Voltage,
-    Capacitance,
-    Inductance,
-    MagneticFlux,
-    Resistance,
-    Conductance,
-    MageneticFieldStrength,
-    Illuminance,
     Radioactivity,
     AbsorbedDose,
     DoseEquivalent,
@@ -155,4 +108,34 @@ from .exceptions import (
     NotIterableError,
     SequenceOperationErrorr,
     OperationNotAvailable,
+    SnapshotError,
+    UnitParseError,
 )
+
+from . import stream
+from .parsing import parse_unit
+from . import units, dimensions
+
+
+def __getattr__(name: str):
+    # the derived unit families (and the quantities of the table-less ones) are
+    # loaded on first access, e.g. `from mudu import NEWTON`
+    if name in units._LAZY_UNITS and name.startswith("_") is False:
+        value = getattr(units, name)
+    elif name in dimensions._GENERIC_UNIT2_QUANTITIES:
+        value = getattr(dimensions, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    lazy = {name for name in units._LAZY_UNITS if name.startswith("_") is False}
+    lazy.update(dimensions._GENERIC_UNIT2_QUANTITIES)
+    return sorted(set(globals()) | lazy)
+
+
+# `from mudu import *` also exports the lazily loaded names (and loads them)
+__all__ = [name for name in __dir__() if name.startswith("_") is False]
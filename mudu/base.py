@@ -6,24 +6,295 @@ mudu.base
 base module for mudu.
 """
 
-from typing import Self, Sequence
-from dataclasses import dataclass
+from typing import Callable, Self, Sequence
+from dataclasses import dataclass, field
+import collections
+import fractions
+import functools
 import math
+import operator
+import weakref
+
+import numpy as np
+
+# symbols of the base dimensions, in the order of the exponents of a `_DimensionVector`
+_BASE_DIMENSION_SYMBOLS = ("L", "M", "T", "Ɵ", "I", "N", "J", "α", "Ω")
+
+# rendered dimension strings, by exponents
+_RENDERED_DIMENSIONS = {}
+
+
+# styles of the rendered unit strings, see `set_printoptions`
+UNIT_STYLES = ("default", "compact", "plain", "caret", "unicode", "latex")
+
+_SUPERSCRIPTS = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
+
+# product separator of each unit style
+_PRODUCT_SEPARATORS = {"plain": "*", "caret": "*", "unicode": "·", "latex": r"\,"}
+
+
+@dataclass
+class _PrintOptionsType:
+    """Internal class for the display options of units and quantities.
+
+    Attributes
+    ----------
+    unit_style: str
+        One of `UNIT_STYLES`: `compact` (`kgm/s^2`), `plain` (`kg*m/s**2`), `caret`
+        (`kg*m/s^2`), `unicode` (`kg·m/s²`) or `latex` (for a LaTeX math
+        environment). `default` prints units `compact` and quantities `plain`.
+    threshold: int
+        Number of values of a quantity array above which it is summarized.
+    edgeitems: int
+        Number of values shown at each end of a summarized quantity array.
+    """
+
+    unit_style: str = "default"
+    threshold: int = 1000
+    edgeitems: int = 3
+
+
+_PRINT_OPTIONS = _PrintOptionsType()
+
+
+def set_printoptions(
+    unit_style: str = None, threshold: int = None, edgeitems: int = None
+) -> None:
+    """Sets the display options of units and quantities, those not given are kept.
+    See `_PrintOptionsType` for the options.
+    """
+
+    if unit_style is not None:
+        if unit_style not in UNIT_STYLES:
+            raise ValueError(f"unit_style must be one of {UNIT_STYLES}")
+        _PRINT_OPTIONS.unit_style = unit_style
+    if threshold is not None:
+        _PRINT_OPTIONS.threshold = threshold
+    if edgeitems is not None:
+        _PRINT_OPTIONS.edgeitems = edgeitems
+
+
+def get_printoptions() -> dict:
+    """The display options of units and quantities."""
+
+    return dict(vars(_PRINT_OPTIONS))
+
+
+def _render_power(symbol: str, exponent, style: str = "plain") -> str:
+
+    if style == "latex":
+        symbol = rf"\mathrm{{{symbol}}}"
+        return symbol if exponent == 1 else f"{symbol}^{{{exponent}}}"
+    if exponent == 1:
+        return symbol
+    if style == "unicode" and isinstance(exponent, int) is True:
+        return symbol + str(exponent).translate(_SUPERSCRIPTS)
+    if isinstance(exponent, fractions.Fraction) is True:
+        exponent = f"({exponent})"
+    return f"{symbol}**{exponent}" if style == "plain" else f"{symbol}^{exponent}"
+
+
+def _render_product(powers, style: str = "plain") -> str:
+    """Render `(symbol, exponent)` pairs as a product, in the form `kg*m/s**2`
+    (`sympy`'s string form, without `sympy`) for the `plain` style."""
+
+    if style == "compact":
+        return _render_product(powers).replace("**", "^").replace("*", "")
+
+    powers = sorted((str(symbol), exponent) for symbol, exponent in powers if exponent)
+    separator = _PRODUCT_SEPARATORS[style]
+    numerator = [_render_power(s, e, style) for s, e in powers if e > 0]
+    numerator = separator.join(numerator) or "1"
+    denominator = [_render_power(s, -e, style) for s, e in powers if e < 0]
+    if not denominator:
+        return numerator
+    if style == "latex":
+        return rf"\frac{{{numerator}}}{{{separator.join(denominator)}}}"
+    if len(denominator) == 1:
+        return f"{numerator}/{denominator[0]}"
+    return f"{numerator}/({separator.join(denominator)})"
+
+
+def _as_exponent(x) -> int | fractions.Fraction:
+    """Normalise a dimension exponent to an `int`, or a `Fraction` when it is not
+    a whole number (e.g. after a square root)."""
+
+    if isinstance(x, int) is True:
+        return x
+    x = fractions.Fraction(x).limit_denominator(1000)
+    return x.numerator if x.denominator == 1 else x
+
+
+class _DimensionVector(tuple):
+    """Internal base class for dimensions, stored as the integer (or rational)
+    exponents of the base dimensions `L M T Ɵ I N J α Ω` (length, mass, time,
+    temperature, electric current, amount of substance, luminous intensity,
+    plane angle and solid angle).
+
+    Multiplication, division and powers of dimensions are vector addition,
+    subtraction and scaling, and comparing two dimensions is a tuple comparison.
+    `sympy` is not needed, it is only imported by `as_sympy`.
+
+    Attributes
+    ----------
+    base: _DimensionVector
+        Class method to create the dimension of the base dimension at `index`.
+    from_sympy: _DimensionVector
+        Class method to create a dimension from a `sympy` expression of the base
+        dimension symbols, e.g. `L/T**2`.
+    is_dimensionless: bool
+        All the exponents are zero.
+    as_sympy: sympy.Expr
+        The dimension as a `sympy` expression of the base dimension symbols.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, exponents: Sequence = ()):
+        exponents = tuple(_as_exponent(x) for x in exponents)
+        return super().__new__(
+            cls, exponents + (0,) * (len(_BASE_DIMENSION_SYMBOLS) - len(exponents))
+        )
+
+    @classmethod
+    def base(cls, index: int) -> Self:
+        return cls((0,) * index + (1,))
+
+    @classmethod
+    def from_sympy(cls, expr) -> Self:
+        exponents = [0] * len(_BASE_DIMENSION_SYMBOLS)
+        for symbol, exponent in expr.as_powers_dict().items():
+            if symbol == 1:
+                continue
+            exponents[_BASE_DIMENSION_SYMBOLS.index(str(symbol))] += exponent
+        return cls(exponents)
+
+    @property
+    def is_dimensionless(self) -> bool:
+        return not any(self)
+
+    def __mul__(self, x: Self) -> Self:
+        if isinstance(x, _DimensionVector) is True:
+            return _DimensionVector(a + b for a, b in zip(self, x))
+        return NotImplemented
+
+    def __truediv__(self, x: Self) -> Self:
+        if isinstance(x, _DimensionVector) is True:
+            return _DimensionVector(a - b for a, b in zip(self, x))
+        return NotImplemented
+
+    def __rtruediv__(self, x) -> Self:
+        if x == 1:
+            return self**-1
+        return NotImplemented
+
+    def __pow__(self, x) -> Self:
+        if isinstance(x, (int, float, fractions.Fraction)) is False:
+            return NotImplemented
+        x = _as_exponent(x)
+        return _DimensionVector(a * x for a in self)
+
+    def as_sympy(self):
+        return _sympy_product(zip(_BASE_DIMENSION_SYMBOLS, self))
+
+    def __repr__(self):
+        rendered = _RENDERED_DIMENSIONS.get(self)
+        if rendered is None:
+            rendered = _render_product(zip(_BASE_DIMENSION_SYMBOLS, self))
+            _RENDERED_DIMENSIONS[self] = rendered
+        return rendered
+
+    __str__ = __repr__
+
+
+class _UnitSymbol(tuple):
+    """Internal base class for unit symbols, stored as `(symbol, exponent)` pairs
+    sorted by symbol, e.g. `(("m", 1), ("s", -2))` for `m/s**2`.
+
+    Products, quotients and powers of unit symbols combine the exponents of equal
+    symbols, as `sympy` would, without `sympy`; `as_sympy` imports it on demand.
+
+    Attributes
+    ----------
+    of: _UnitSymbol
+        Class method to create the symbol of a named unit, e.g. `"km/h"`.
+    as_sympy: sympy.Expr
+        The unit symbol as a `sympy` expression.
+    render: str
+        The unit symbol as a string, in one of the `UNIT_STYLES`.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, powers=()):
+        exponents = {}
+        for symbol, exponent in powers:
+            exponents[symbol] = exponents.get(symbol, 0) + exponent
+        return super().__new__(
+            cls,
+            sorted((s, _as_exponent(e)) for s, e in exponents.items() if e != 0),
+        )
+
+    @classmethod
+    def of(cls, symbol) -> Self:
+        if isinstance(symbol, _UnitSymbol) is True:
+            return symbol
+        return super().__new__(cls, ((str(symbol), 1),))
+
+    def as_sympy(self):
+        return _sympy_product(self)
+
+    def render(self, style: str = "plain") -> str:
+        return _render_product(self, style)
+
+    def __mul__(self, x: Self) -> Self:
+        if isinstance(x, _UnitSymbol) is True:
+            return _UnitSymbol(self + x)
+        return NotImplemented
+
+    def __truediv__(self, x: Self) -> Self:
+        if isinstance(x, _UnitSymbol) is True:
+            return _UnitSymbol(self + x**-1)
+        return NotImplemented
+
+    def __pow__(self, x) -> Self:
+        if isinstance(x, (int, float, fractions.Fraction)) is False:
+            return NotImplemented
+        x = _as_exponent(x)
+        return _UnitSymbol((symbol, exponent * x) for symbol, exponent in self)
+
+    def __repr__(self):
+        return _render_product(self)
+
+    __str__ = __repr__
+
+
+def _sympy_product(powers):
+    """`sympy` product of `(symbol, exponent)` pairs, `sympy` is imported here only."""
+
+    import sympy
+
+    return sympy.Mul(
+        *(
+            sympy.Symbol(str(symbol)) ** sympy.nsimplify(exponent)
+            for symbol, exponent in powers
+            if exponent != 0
+        )
+    )
 
-import sympy as sym
 
 # ==================
 # Fundamental units
 # ==================
-LENGTH = sym.Symbol("L")
-MASS = sym.Symbol("M")
-TIME = sym.Symbol("T")
-PLANE_ANGLE = sym.Symbol("Ɵ")
-SOLID_ANGLE = sym.Symbol("Ɵ")
-THERMODYNAMIC_TEMPERATURE = sym.Symbol("Ɵ")
-ELECTRIC_CURRENT = sym.Symbol("I")
-AMOUNT_OF_SUBSTANCE = sym.Symbol("N")
-LUMINOUS_INTENSITY = sym.Symbol("J")
+LENGTH = _DimensionVector.base(0)
+MASS = _DimensionVector.base(1)
+TIME = _DimensionVector.base(2)
+THERMODYNAMIC_TEMPERATURE = _DimensionVector.base(3)
+ELECTRIC_CURRENT = _DimensionVector.base(4)
+AMOUNT_OF_SUBSTANCE = _DimensionVector.base(5)
+LUMINOUS_INTENSITY = _DimensionVector.base(6)
+PLANE_ANGLE = _DimensionVector.base(7)
+SOLID_ANGLE = _DimensionVector.base(8)
 
 # ==============
 # Derived units
@@ -80,6 +351,167 @@ class _OrderType:
     value: float
 
 
+# ============================
+# utility conversion function
+# ============================
+_basic_unit_converter = lambda x, y, invert=False: x * y if invert is False else x / y
+
+
+def _as_fraction(x) -> fractions.Fraction:
+    """Exact value of a conversion factor, as it is written (`1.8` is `9/5`)."""
+
+    if isinstance(x, float) is True:
+        return fractions.Fraction(repr(x))
+    return fractions.Fraction(x)
+
+
+def _chain_converters(x, converters: tuple):
+    """Apply a chain of `_ConverterType` to `x`, first to last."""
+
+    for converter in converters:
+        x = converter.apply(x)
+    return x
+
+
+@dataclass(frozen=True)
+class _ConverterType:
+    """Internal base class for conversion standards.
+
+    An affine conversion standard converts a value as `x * scale + offset`, so it can
+    be inverted, composed and applied to a whole `np.ndarray` without calling back
+    into python per element. Conversion standards that are not affine pass a
+    `function` (and its `inverse_function`) instead.
+
+    Attributes
+    ----------
+    scale: float
+        Multiplier of the conversion e.g. `0.0254` from inch to meter
+    offset: float
+        Value added after scaling e.g. `-273.15` from kelvin to celsius
+    function: Callable
+        Escape hatch for a conversion that is not affine, called as `function(x=...)`
+    inverse_function: Callable
+        Inverse of `function`
+    is_affine: bool
+        Whether the conversion is `x * scale + offset`
+    invert: _ConverterType
+        The conversion the other way round.
+    compose: _ConverterType
+        This conversion followed by another.
+    apply: int | float | np.ndarray
+        Convert a scalar or a whole array.
+
+    - **Usage example**
+
+        .. code-block:: python
+
+            from mudu import Length, METER
+            from mudu.base import _UnitType, _ConverterType
+
+            ME_UNIT = _UnitType(_dimension=LENGTH, _unit_name="me_unit", _unit_symbol="m_u")
+
+            # 1 me_unit is 0.001 meter
+            Length._conversion_standards.extend(((ME_UNIT, METER), _ConverterType(scale=0.001)))
+    """
+
+    scale: float = 1
+    offset: float = 0
+    function: Callable = None
+    inverse_function: Callable = None
+    # exact (scale, offset), so that composing chains does not accumulate rounding
+    _exact: tuple = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self._exact is None and self.function is None:
+            object.__setattr__(
+                self, "_exact", (_as_fraction(self.scale), _as_fraction(self.offset))
+            )
+
+    @classmethod
+    def _from_exact(cls, scale: fractions.Fraction, offset: fractions.Fraction) -> Self:
+        return cls(scale=float(scale), offset=float(offset), _exact=(scale, offset))
+
+    @classmethod
+    def from_callable(cls, converter: Callable) -> Self:
+        """Internal alternate constructor, for conversion standards given as a
+        `functools.partial` of `_basic_unit_converter` or as a callable with the
+        `(x, invert=False)` signature.
+        """
+
+        if isinstance(converter, _ConverterType) is True:
+            return converter
+
+        if (
+            isinstance(converter, functools.partial) is True
+            and converter.func is _basic_unit_converter
+        ):
+            return cls(scale=converter.keywords["y"])
+
+        return cls(
+            function=converter,
+            inverse_function=functools.partial(converter, invert=True),
+        )
+
+    @property
+    def is_affine(self) -> bool:
+        return self.function is None
+
+    def __call__(self, x, invert=False):
+        # same signature as the callables conversion standards used to be
+        return self.invert().apply(x) if invert is True else self.apply(x)
+
+    def invert(self) -> Self:
+
+        if self.is_affine is True:
+            scale, offset = self._exact
+            return _ConverterType._from_exact(1 / scale, -offset / scale)
+        return _ConverterType(
+            function=self.inverse_function, inverse_function=self.function
+        )
+
+    def compose(self, other: Self) -> Self:
+        """Return the conversion that applies `self` and then `other`."""
+
+        if self.is_affine is True and other.is_affine is True:
+            (scale, offset), (other_scale, other_offset) = self._exact, other._exact
+            return _ConverterType._from_exact(
+                scale * other_scale, offset * other_scale + other_offset
+            )
+        return _ConverterType(
+            function=functools.partial(_chain_converters, converters=(self, other)),
+            inverse_function=functools.partial(
+                _chain_converters, converters=(other.invert(), self.invert())
+            ),
+        )
+
+    def apply(self, x, out=None):
+        """Convert `x`, a scalar or a whole `np.ndarray`, in one pass. When `out` is
+        given the result is written into it, and no new array is allocated.
+        """
+
+        if self.is_affine is False:
+            value = self.function(x=x)
+            if out is None:
+                return value
+            out[...] = value
+            return out
+
+        if out is None:
+            if self.offset == 0:
+                return x * self.scale
+            return x * self.scale + self.offset
+
+        out = np.multiply(x, self.scale, out=out)
+        if self.offset != 0:
+            np.add(out, self.offset, out=out)
+        return out
+
+
+# bumped whenever a conversion table gains or replaces standards, so that what is
+# derived from the units of every table (e.g. the tables of `parse_unit`) is rebuilt
+_TABLES_GENERATION = 0
+
+
 @dataclass
 class _ConversionTableType:
     """Internal base class definition for conversion table for dimension objects.
@@ -89,15 +521,169 @@ class _ConversionTableType:
     dimension: str
         Conversion table contains units of dimension. Dimension could be `LENGTH TIME MASS` e.t.c.
     conversion_table: Sequence
-        `tuple` containing the conversion units and a lambda calculating the conversion. e.g.
-        `((INCH, METER), functools.partial(_basic_unit_converter, y=0.0254))`
+        `tuple` containing the conversion units and a `_ConverterType` defining the conversion. e.g.
+        `((INCH, METER), _ConverterType(scale=0.0254))`
     extend: None
         Extend an existing conversion table with more conversion standards.
+    units: tuple
+        Units of the table, indexed by their unit code.
+    has_unit: bool
+        Check whether a unit is in the table.
+    lookup: tuple | None
+        Find the conversion standard between two units, through an index keyed by
+        the identity of the units.
+    path: list | None
+        Find the shortest chain of conversion standards between two units.
 
     """
 
     dimension: str
     conversion_table: Sequence
+    # (id(from), id(to)) -> (from, to, _ConverterType); built lazily
+    _index: dict = field(default=None, init=False, repr=False, compare=False)
+    # id(unit) -> [(neighbour, _ConverterType), ...]; built with the index
+    _graph: dict = field(default=None, init=False, repr=False, compare=False)
+    # id(unit) -> (unit, table unit it is equal to)
+    _aliases: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (id(from), id(to)) -> (from, to, resolved converter, hops); filled by `convert_to`
+    _resolved: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # units of the table in order of first appearance, the position is the unit code
+    _units: list = field(default=None, init=False, repr=False, compare=False)
+    # id(to) -> (to, scales, offsets) per unit code; filled by `mudu.conversion`
+    _factor_tables: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # the standards added with `extend`, in order; stored by `mudu.snapshot`
+    _extensions: list = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def _index_standard(self, seq: Sequence) -> None:
+        """Add a conversion standard, and its implied inverse, to the index and to
+        the conversion graph."""
+
+        (_from, to), converter = seq
+        converter = _ConverterType.from_callable(converter)
+        inverse = converter.invert()
+        for unit in (_from, to):
+            # (a multiple prefix unit may already have a code, see `_code_multiple`)
+            if id(unit) not in self._graph and all(u is not unit for u in self._units):
+                self._units.append(unit)
+        self._index[(id(_from), id(to))] = (_from, to, converter)
+        self._index[(id(to), id(_from))] = (to, _from, inverse)
+        self._graph.setdefault(id(_from), []).append((to, converter))
+        self._graph.setdefault(id(to), []).append((_from, inverse))
+
+    def _build_index(self) -> None:
+        self._index, self._graph, self._units = {}, {}, []
+        for seq in self.conversion_table:
+            self._index_standard(seq)
+
+    def _node(self, unit):
+        """Return the unit of the table that `unit` is (or is equal to)."""
+
+        if id(unit) in self._graph:
+            return unit
+
+        alias = self._aliases.get(id(unit))
+        if alias is not None:
+            return alias[1]
+
+        for _from, to, _ in tuple(self._index.values()):
+            if _from == unit:
+                # the alias holds the unit, which keeps its id valid
+                self._aliases[id(unit)] = (unit, _from)
+                return _from
+        return None
+
+    def units(self) -> tuple:
+        """Units of the table in a stable order, the position of a unit is its code.
+        Extending the table, or coding a multiple prefix unit (`_code_multiple`), only
+        appends new units."""
+
+        if self._index is None:
+            self._build_index()
+        return tuple(self._units)
+
+    def _code_multiple(self, unit) -> int | None:
+        """Unit code of a multiple prefix unit (e.g. kPa) of a unit of the table,
+        appended after the units on first use; None if `unit` is not one."""
+
+        if unit._base is None or self.has_unit(unit._base) is False:
+            return None
+        for code, coded in enumerate(self._units):
+            if coded is unit:
+                return code
+        self._units.append(unit)
+        return len(self._units) - 1
+
+    def has_unit(self, unit) -> bool:
+        """Check whether `unit` (or a unit equal to it) is in the table."""
+
+        if self._index is None:
+            self._build_index()
+        return self._node(unit) is not None
+
+    def lookup(self, _from, to) -> tuple | None:
+        """Find the conversion standard between `_from` and `to`.
+
+        The index is built on first use. Units that are equal to, but not the same
+        object as, a unit in the table are found by comparison once and then
+        aliased under their own identity.
+
+        return: the `_ConverterType` from `_from` to `to`, or `None` if no standard
+        is defined.
+        """
+
+        if self._index is None:
+            self._build_index()
+
+        _from, to = self._node(_from), self._node(to)
+        if _from is None or to is None:
+            return None
+
+        entry = self._index.get((id(_from), id(to)))
+        if entry is None:
+            return None
+        return entry[2]
+
+    def path(self, _from, to) -> list | None:
+        """Find the shortest chain of conversion standards from `_from` to `to`,
+        by a breadth-first search over the table, where every standard also
+        implies its inverse.
+
+        return: a list of `_ConverterType` steps, or `None` if `to` cannot be
+        reached from `_from`.
+        """
+
+        if self._index is None:
+            self._build_index()
+
+        _from, to = self._node(_from), self._node(to)
+        if _from is None or to is None:
+            return None
+
+        previous = {id(_from): None}
+        queue = collections.deque((_from,))
+        while queue:
+            unit = queue.popleft()
+            if unit is to:
+                steps = []
+                while previous[id(unit)] is not None:
+                    unit, converter = previous[id(unit)]
+                    steps.append(converter)
+                return steps[::-1]
+
+            for neighbour, converter in self._graph[id(unit)]:
+                if id(neighbour) not in previous:
+                    previous[id(neighbour)] = (unit, converter)
+                    queue.append(neighbour)
+
+        return None
 
     def extend(self, seq: Sequence) -> None:
         """Convieniece method to extend the built-in conversion standard to
@@ -108,16 +694,14 @@ class _ConversionTableType:
         seq: Sequence
             tuple that contains:
                 a tuple of the units
-                and a callable that defines the conversion operation.
+                and a `_ConverterType` (or a callable with the `(x, invert=False)`
+                signature) that defines the conversion operation.
         - **Usage example**
 
             .. code-block:: python
 
-                import functools
-
                 from mudu import Length, METER
-                from mudu.base import _UnitType
-                from mudu.units import _basic_unit_converter
+                from mudu.base import _UnitType, _ConverterType
 
                 # define a new unit type
                 ME_UNIT = _UnitType(
@@ -127,13 +711,33 @@ class _ConversionTableType:
                     )
 
                 # create a conversion standard with METER
-                seq = ((ME_UNIT, METER), functools.partial(_basic_unit_converter, y=0.001))
+                seq = ((ME_UNIT, METER), _ConverterType(scale=0.001))
 
                 # extend the conversion table
                 Length._conversion_standards.extend(seq)
         """
 
-        self.conversion_table.extend((seq,))
+        global _TABLES_GENERATION
+
+        if isinstance(self.conversion_table, tuple) is True:
+            self.conversion_table = self.conversion_table + (seq,)
+        else:
+            self.conversion_table.extend((seq,))
+        self._extensions.append(seq)
+        _TABLES_GENERATION += 1
+
+        (_from, to), _ = seq
+        if self._index is not None:
+            self._index_standard(seq)
+
+        self._factor_tables.clear()
+
+        # drop only the resolved conversions the new standard can change: those
+        # between the newly related units, and multi-hop ones it may shorten
+        for key, (unit, to_unit, _, hops) in tuple(self._resolved.items()):
+            units = (unit._base or unit, to_unit._base or to_unit)
+            if hops > 1 or any(u == _from or u == to for u in units):
+                del self._resolved[key]
 
 
 @dataclass
@@ -142,13 +746,14 @@ class _UnitType:
 
     Attributes
     ----------
-    _dimension: str
-        The unit dimension, say, `LENGTH`, `MASS`, `TIME `
+    _dimension: _DimensionVector
+        The unit dimension, say, `LENGTH`, `MASS`, `TIME `. A `sympy` expression of
+        the base dimension symbols is converted to a `_DimensionVector`.
     _unit_name: str
         The unit name e.g.  `meter`
     _unit_symbol: str
         Symbolic representation of the unit, usually passed as a
-        string, then converted to a `sympy.Symbol` object
+        string, then converted to a `_UnitSymbol` object
     _order: _OrderType
         Multiple prefix, if unit is a multiple prefix
         of a  `_UnitType`.
@@ -158,10 +763,17 @@ class _UnitType:
         unit `METER`.
     _quantity: str
         The quantity the unit represents, say Force, Energy.
+    _factors: tuple
+        `(unit, exponent)` factors of a unit produced by unit algebra, e.g.
+        `METER / SECOND**2`. Such units are interned: equal ones are the same object.
+        The factors decompose into the reference units of the base dimensions, which
+        is how units without a conversion standard between them are converted.
     create_unit: _UnitType
         Class method to create a `_UnitType` object.
     is_unit_type: bool
         Internal method to validate that an object is an instance of `_UnitType`
+    render: str
+        The unit symbol as a string, in one of the `UNIT_STYLES`.
 
     - **Usage example**
 
@@ -183,12 +795,18 @@ class _UnitType:
     on _ConversionTableType or read the full documentation at <https://github.com/techkaduna/mudu>_.
     """
 
-    _dimension: str
+    _dimension: _DimensionVector
     _unit_name: str
-    _unit_symbol: str | sym.Symbol
+    _unit_symbol: str | _UnitSymbol
     _quantity: str = GENERIC_QUANTITY
     _order: _OrderType = None
     _base: Self = None
+    # `(unit, exponent)` factors of a unit generated by unit algebra
+    _factors: tuple = field(default=None, repr=False)
+    # scale to the reference (base) units of its dimension, computed on first use
+    _reference_scale: float = field(default=None, init=False, repr=False)
+    # unit style -> rendered symbol, computed on first use
+    _rendered: dict = field(default_factory=dict, init=False, repr=False)
 
     @classmethod
     def create_unit(cls, **kwargs):
@@ -202,20 +820,54 @@ class _UnitType:
         return cls(**kwargs)
 
     def __post_init__(self):
-        if isinstance(self._unit_symbol, str) is True:
-            self._unit_symbol = sym.Symbol(self._unit_symbol)
+        if isinstance(self._unit_symbol, _UnitSymbol) is False:
+            self._unit_symbol = _UnitSymbol.of(self._unit_symbol)
+        if isinstance(self._dimension, _DimensionVector) is False:
+            # a `sympy` expression of the base dimension symbols
+            self._dimension = _DimensionVector.from_sympy(self._dimension)
+
+    def render(self, style: str = None) -> str:
+        """The unit symbol as a string, in one of the `UNIT_STYLES` (by default the
+        one set with `set_printoptions`); rendered once per unit and style."""
+
+        style = _PRINT_OPTIONS.unit_style if style is None else style
+        if style == "default":
+            style = "compact"
+        rendered = self._rendered.get(style)
+        if rendered is None:
+            rendered = self._rendered[style] = self._unit_symbol.render(style)
+        return rendered
 
     def __repr__(self):
-        return str(self._unit_symbol).replace("**", "^").replace("*", "")  # sorry :)
+        return self.render()
+
+    def __eq__(self, x):
+
+        if self is x:
+            return True
+        if isinstance(x, _UnitType) is False:
+            return NotImplemented
+        if self._factors is not None or x._factors is not None:
+            # generated units are interned, so equal ones are usually the same
+            # object; copies (e.g. unpickled in another process) compare by factors
+            if self._factors is None or x._factors is None:
+                return False
+            return len(self._factors) == len(x._factors) and all(
+                factor in x._factors for factor in self._factors
+            )
+        return (
+            self._dimension,
+            self._unit_name,
+            self._unit_symbol,
+            self._quantity,
+            self._order,
+            self._base,
+        ) == (x._dimension, x._unit_name, x._unit_symbol, x._quantity, x._order, x._base)
 
     def __mul__(self, x: Self):
 
         if isinstance(x, _UnitType) is True:
-            return _UnitType.create_unit(
-                _dimension=self._dimension * x._dimension,
-                _unit_name=GENERIC_DIMENSION,
-                _unit_symbol=self._unit_symbol * x._unit_symbol,
-            )
+            return _unit_algebra(operator.mul, self, x)
 
         elif isinstance(x, int | float):
             return self
@@ -233,11 +885,7 @@ class _UnitType:
     def __truediv__(self, x):
 
         if isinstance(x, _UnitType) is True:
-            return _UnitType.create_unit(
-                _dimension=self._dimension / x._dimension,
-                _unit_name=GENERIC_DIMENSION,
-                _unit_symbol=self._unit_symbol / x._unit_symbol,
-            )
+            return _unit_algebra(operator.truediv, self, x)
 
         elif isinstance(x, int | float):
             return self
@@ -248,11 +896,7 @@ class _UnitType:
     def __rtruediv__(self, x):
 
         if isinstance(x, (int, float)) is True:
-            return _UnitType.create_unit(
-                _dimension=self._dimension**-1,
-                _unit_name=GENERIC_DIMENSION,
-                _unit_symbol=1 / self._unit_symbol,
-            )
+            return _unit_algebra(operator.pow, self, exponent=-1)
 
     def __pow__(self, x):
 
@@ -260,11 +904,147 @@ class _UnitType:
             raise TypeError(
                 "_UnitType can only be raise to the power of an integer (or float)"
             )
-        return _UnitType.create_unit(
-            _dimension=self._dimension**x,
+        return _unit_algebra(operator.pow, self, exponent=x)
+
+
+# =========================== UNIT REGISTRY ===================================================================
+# Units generated by unit algebra are hash-consed: there is only one `_UnitType` per
+# canonical key, so equal units are the same object. The registry holds them weakly,
+# a generated unit that is no longer used anywhere is dropped.
+_UNIT_REGISTRY = weakref.WeakValueDictionary()
+
+
+def _factors_of(unit: _UnitType) -> tuple:
+    """The `(unit, exponent)` factors of a unit; a defined unit is its own factor."""
+
+    return unit._factors if unit._factors is not None else ((unit, 1),)
+
+
+def _combine_factors(*groups: tuple) -> tuple:
+    """Combine groups of `(factors, power)` into one tuple of `(unit, exponent)`,
+    dropping the units whose exponents cancel out."""
+
+    exponents = {}
+    for factors, power in groups:
+        for unit, exponent in factors:
+            entry = exponents.setdefault(id(unit), [unit, 0])
+            entry[1] += exponent * power
+
+    return tuple(
+        (unit, _as_exponent(exponent))
+        for unit, exponent in exponents.values()
+        if exponent != 0
+    )
+
+
+class _UnitAlgebraCache:
+    """Internal bounded LRU memo of unit algebra results, keyed by
+    `(operator, left unit, right unit, exponent)`, so that repeated operations such
+    as `METER / SECOND**2` return the resulting unit without recombining factors.
+
+    Attributes
+    ----------
+    maxsize: int
+        Maximum number of results kept, the least recently used are dropped first.
+    hits: int
+        Number of operations answered from the memo.
+    misses: int
+        Number of operations that had to be computed.
+    cache_info: _UnitAlgebraCacheInfo
+        Hits, misses, maxsize and current size of the memo.
+    cache_clear: None
+        Empty the memo and reset the counters.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def get(self, key: tuple) -> _UnitType | None:
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: tuple, operands: tuple, result: _UnitType) -> None:
+
+        # the entry holds the operands, which keeps the ids in the key valid
+        self._entries[key] = (operands, result)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def cache_info(self):
+        return _UnitAlgebraCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._entries)
+        )
+
+    def cache_clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+_UnitAlgebraCacheInfo = collections.namedtuple(
+    "_UnitAlgebraCacheInfo", ("hits", "misses", "maxsize", "currsize")
+)
+
+_UNIT_ALGEBRA_CACHE = _UnitAlgebraCache()
+
+
+def _unit_algebra(
+    _operator: Callable, left: _UnitType, right: _UnitType = None, exponent=None
+) -> _UnitType:
+    """Multiply, divide or raise units to a power, through the unit algebra memo."""
+
+    key = (_operator, id(left), id(right), exponent)
+    result = _UNIT_ALGEBRA_CACHE.get(key)
+    if result is None:
+        if _operator is operator.pow:
+            factors = _combine_factors((_factors_of(left), exponent))
+        else:
+            power = 1 if _operator is operator.mul else -1
+            factors = _combine_factors((_factors_of(left), 1), (_factors_of(right), power))
+
+        result = _intern_unit(factors)
+        _UNIT_ALGEBRA_CACHE.put(key, (left, right), result)
+
+    return result
+
+
+def _intern_unit(factors: tuple) -> _UnitType:
+    """Return the canonical `_UnitType` of a product of unit factors.
+
+    The canonical key is the (sorted) identity and exponent of every factor, which
+    also determines the dimension vector of the unit. The key does not outlive the
+    unit, which holds its factors and so keeps their identities valid.
+    """
+
+    if len(factors) == 1 and factors[0][1] == 1:
+        return factors[0][0]
+
+    key = tuple(sorted((id(unit), exponent) for unit, exponent in factors))
+    unit = _UNIT_REGISTRY.get(key)
+    if unit is None:
+        dimension, symbol = _DimensionVector(), _UnitSymbol()
+        for factor, exponent in factors:
+            dimension = dimension * factor._dimension**exponent
+            symbol = symbol * factor._unit_symbol**exponent
+
+        unit = _UnitType.create_unit(
+            _dimension=dimension,
             _unit_name=GENERIC_DIMENSION,
-            _unit_symbol=self._unit_symbol**x,
+            _unit_symbol=symbol,
+            _factors=factors,
         )
+        _UNIT_REGISTRY[key] = unit
+
+    return unit
 
 
 # ============================ ORDERS ==========================================================================
@@ -300,52 +1080,65 @@ class _OrderUnitType:
     `OrderUnit`, which is an instance of `_OrderUnit`, was used instead.
     """
 
+    # (id(order), id(unit)) -> multiple prefix unit, held weakly
+    _units = weakref.WeakValueDictionary()
+
     def __call__(self, _order: _OrderType, unit: _UnitType):
-        return _UnitType(
-            _dimension=unit._dimension,
-            _quantity=unit._quantity,
-            _unit_name=f"{_order.name}{unit._unit_name}",
-            _unit_symbol=f"{_order.symbol}{unit._unit_symbol}",
-            _order=_order,
-            _base=unit,
-        )
+
+        key = (id(_order), id(unit))
+        order_unit = self._units.get(key)
+        if order_unit is None:
+            order_unit = _UnitType(
+                _dimension=unit._dimension,
+                _quantity=unit._quantity,
+                _unit_name=f"{_order.name}{unit._unit_name}",
+                _unit_symbol=f"{_order.symbol}{unit._unit_symbol}",
+                _order=_order,
+                _base=unit,
+            )
+            self._units[key] = order_unit
+
+        return order_unit
 
 
 OrderUnit = _OrderUnitType()
 
 
-class _SetOnce:
+def _reject_set(name: str, instance, value) -> None:
+    raise ValueError(f"cannot set {name} after it has been set")
+
+
+class _SetOnce(property):
     """Internal base class descriptor for setting attributes only once.
 
+    The attribute is stored in the `__slots__` entry `_<name>_slot` of the class,
+    so instances need no `__dict__`. It is set once, through `initialize`, while
+    the object is being constructed; setting it afterwards raises a `ValueError`.
+    Reading it is a plain slot read.
+
     Attributes
     ----------
     name: str
         Attribute identifier
     expected_types: obj | Sequence
         Attribute expected type(s)
+    slot: str
+        Name of the `__slots__` entry the attribute is stored in
+    initialize: None
+        Type check and store the attribute of an object being constructed.
 
     """
 
     def __init__(self, name: str, expected_types) -> None:
         self.name = name
         self.expected_types = expected_types
+        self.slot = f"_{name}_slot"
+        super().__init__(
+            operator.attrgetter(self.slot), functools.partial(_reject_set, name)
+        )
 
-    def __get__(self, instance, cls):
-
-        if instance is None:
-            return self
-
-        else:
-            return instance.__dict__[self.name]
-
-    def __set__(self, instance, value):
-
-        try:
-            getattr(instance, self.name)
-            raise ValueError(f"cannot set {self.name} after it has been set")
+    def initialize(self, instance, value) -> None:
 
-        except KeyError:
-            # attribute does not exist; now set attribute
-            if isinstance(value, self.expected_types) is False:
-                raise TypeError(f"{self.name} must be of type {self.expected_types}")
-            instance.__dict__[self.name] = value
+        if isinstance(value, self.expected_types) is False:
+            raise TypeError(f"{self.name} must be of type {self.expected_types}")
+        setattr(instance, self.slot, value)
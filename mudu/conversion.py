@@ -0,0 +1,206 @@
+"""
+=========================
+mudu.conversion
+=========================
+
+mudu module, conversion of plain values without quantity objects.
+
+`compile_converter` resolves the conversion between two units once, into a small
+picklable callable for hot loops and process-pool workers.
+
+Mixed-unit columns are converted with unit codes: the units of a conversion table
+(e.g. `_PRESSURE_CONVERSION_TABLE`) are indexed by `_ConversionTableType.units`, and
+a column of values with one unit code per row is converted to a single unit in one
+vectorized gather-multiply-add.
+
+- **Usage example**
+
+    .. code-block:: python
+
+        from mudu import Pressure, PSI, BAR, inHg, PASCAL
+        from mudu.conversion import unit_codes, convert_mixed
+
+        table = Pressure._conversion_standards
+        codes = unit_codes([PSI, BAR, inHg], table)
+        pascals = convert_mixed([14.7, 1.0, 29.92], codes, table, PASCAL)
+
+        from mudu import FEET, METER
+        from mudu.conversion import compile_converter
+
+        feet_to_meter = compile_converter(FEET, METER)
+        feet_to_meter(3.0), feet_to_meter(altitudes, out=buffer)
+
+For more information, read the documenation using
+
+.. code-block:: shell
+    mudu --doc
+
+in your cli
+
+"""
+
+from collections import abc
+
+import numpy as np
+
+from .base import _UnitType, _ConversionTableType, _ConverterType
+from .dimensions import _resolve_conversion, _resolve_units
+from . import exceptions
+
+
+def unit_codes(
+    units: abc.Sequence[_UnitType], conversion_standards: _ConversionTableType
+) -> np.ndarray:
+    """Unit codes of `units`, their positions in `conversion_standards.units()`. A
+    multiple prefix unit of a unit of the table (e.g. kPa) is given the next code.
+
+    return: np.ndarray of `np.intp` codes.
+    """
+
+    index = {id(unit): code for code, unit in enumerate(conversion_standards.units())}
+
+    def code_of(unit):
+        code = index.get(id(unit))
+        if code is None:
+            node = conversion_standards._node(unit)
+            if node is not None:
+                code = index[id(node)]
+            else:
+                code = conversion_standards._code_multiple(unit)
+            if code is None:
+                raise exceptions.ConversionError(
+                    f"{unit._unit_name} is not a unit of the {conversion_standards.dimension} conversion table"
+                )
+            index[id(unit)] = code
+        return code
+
+    return np.fromiter(map(code_of, units), dtype=np.intp, count=len(units))
+
+
+def _factor_table(
+    conversion_standards: _ConversionTableType, to_unit: _UnitType
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scale and offset of the conversion of every unit code to `to_unit`; resolved
+    once per target unit and cached on the table."""
+
+    units = conversion_standards.units()
+    cached = conversion_standards._factor_tables.get(id(to_unit))
+    if cached is not None and len(cached[1]) == len(units):
+        return cached[1], cached[2]
+
+    scales, offsets = np.empty(len(units)), np.empty(len(units))
+    for code, unit in enumerate(units):
+        converter = _resolve_conversion(conversion_standards, unit, to_unit)
+        if converter.is_affine is False:
+            raise exceptions.ConversionError(
+                f"the conversion from {unit._unit_name} to {to_unit._unit_name} is not a scale and offset"
+            )
+        scales[code], offsets[code] = converter.scale, converter.offset
+
+    conversion_standards._factor_tables[id(to_unit)] = (to_unit, scales, offsets)
+    return scales, offsets
+
+
+def convert_mixed(
+    values: abc.Sequence | np.ndarray,
+    codes: abc.Sequence[int] | np.ndarray,
+    conversion_standards: _ConversionTableType,
+    to_unit: _UnitType,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """Converts values of mixed units to `to_unit`.
+
+    Parameters
+    ----------
+    values: Sequence | np.ndarray
+        The values, row `i` is in the unit of code `codes[i]`.
+    codes: Sequence[int] | np.ndarray
+        Unit codes of the rows, see `unit_codes`.
+    conversion_standards: _ConversionTableType
+        The conversion table the unit codes index.
+    to_unit: _UnitType
+        The unit to convert to.
+    out: np.ndarray
+        Optional `float64` buffer the converted values are written into.
+
+    return: np.ndarray of the converted values.
+    """
+
+    scales, offsets = _factor_table(conversion_standards, to_unit)
+    codes = np.asarray(codes, dtype=np.intp)
+    out = np.multiply(np.asarray(values, dtype=np.float64), scales[codes], out=out)
+    if offsets.any():
+        np.add(out, offsets[codes], out=out)
+    return out
+
+
+class _CompiledConverterType:
+    """Internal class for a conversion resolved once between two units.
+
+    Calling it converts a float, an `np.ndarray` (optionally into an `out` buffer) or
+    a Python sequence (into a new `float64` `np.ndarray`), with none of the dispatch
+    of `convert_to`. Affine conversions only hold their scale and offset, so they can
+    be pickled and sent to process-pool workers.
+
+    Attributes
+    ----------
+    scale: float
+        Multiplier of the conversion.
+    offset: float
+        Added after the multiplication.
+    converter: _ConverterType | None
+        The conversion, when it is not affine (not a scale and offset).
+    """
+
+    __slots__ = ("scale", "offset", "converter")
+
+    def __init__(
+        self, scale: float = 1.0, offset: float = 0.0, converter: _ConverterType = None
+    ) -> None:
+        self.scale = scale
+        self.offset = offset
+        self.converter = converter
+
+    def __reduce__(self):
+        return (type(self), (self.scale, self.offset, self.converter))
+
+    def __repr__(self):
+        if self.converter is not None:
+            return f"{type(self).__name__}({self.converter!r})"
+        return f"{type(self).__name__}(scale={self.scale!r}, offset={self.offset!r})"
+
+    def __call__(self, x, out: np.ndarray = None):
+
+        if self.converter is not None:
+            if isinstance(x, (int, float, np.ndarray)) is False:
+                x = np.asarray(x, dtype=np.float64)
+            return self.converter.apply(x, out=out)
+
+        if out is None and isinstance(x, (int, float)) is True:
+            return x * self.scale + self.offset
+
+        if isinstance(x, np.ndarray) is False:
+            x = np.asarray(x, dtype=np.float64)
+        out = np.multiply(x, self.scale, out=out)
+        if self.offset != 0:
+            np.add(out, self.offset, out=out)
+        return out
+
+
+def compile_converter(
+    from_unit: _UnitType, to_unit: _UnitType
+) -> _CompiledConverterType:
+    """Resolves the conversion from `from_unit` to `to_unit` once.
+
+    return: _CompiledConverterType, a callable `(x, out=None)` converting values.
+    Raises `exceptions.ConversionError` if the units cannot be converted.
+    """
+
+    try:
+        converter = _resolve_units(from_unit, to_unit)
+    except Exception as e:
+        # as raised by `convert_to` for the same units
+        raise exceptions.ConversionError(str(e))
+    if converter.is_affine is True:
+        return _CompiledConverterType(float(converter.scale), float(converter.offset))
+    return _CompiledConverterType(converter=converter)
@@ -14,19 +14,26 @@ in your cli
 
 """
 
+import math
+import numbers
 import operator
 from collections import abc, Counter
 from typing import Any, Callable, Self
 import functools
 
-import sympy as sym
 import numpy as np
+from numpy.lib.array_utils import normalize_axis_index
 
 from .base import (
     GENERIC_QUANTITY,
     _SetOnce,
+    _UnitAlgebraCache,
     _UnitType,
     _ConversionTableType,
+    _ConverterType,
+    _DimensionVector,
+    _UnitSymbol,
+    _PRINT_OPTIONS,
     LENGTH,
     MASS,
     TIME,
@@ -49,146 +56,510 @@ from .units import (
     KELVIN,
     SECOND,
     STERADIAN,
+    RADIAN,
     AMPERE,
     MOLE,
     CANDELA,
-    VOLT,
-    FARAD,
-    HENRY,
-    WEBER,
-    OHMS,
-    SIEMENS,
-    TESLA,
-    LUX,
     _LENGTH_CONVERSION_TABLE,
     _MASS_CONVERSION_TABLE,
     _TIME_CONVERSION_TABLE,
     _ANGLE_CONVERSION_TABLE,
     _TEMPERATURE_CONVERSION_TABLE,
-    _FORCE_CONVERSION_TABLE,
-    _PRESSURE_CONVERSION_TABLE,
-    _ENERGY_CONVERSION_TABLE,
-    _DENSITY_CONVERSION_TABLE,
-    _POWER_CONVERSION_TABLE,
-    _RADIOACTIVITY_CONVERSION_TABLE,
-    _ABSORBED_DOSE_CONVERSION_TABLE,
-    _DOSE_EQUIVALENT_TABLE,
-    _SPEED_CONVERSION_TABLE,
+    _CONVERSION_TABLES,
+    _REFERENCE_UNITS,
+    _UNIT_DEFINITIONS,
 )
+from . import base, units
 from . import exceptions
 
 
-def _unit_conversion(self, _to):
-    """Converts from one unit to another, provided that there is a conversion standard
-    defined for the units involved.
+def _as_value_array(value) -> np.ndarray:
+    """Coerce a sequence value into a single contiguous `float64` buffer.
+
+    Sequence quantities hold one numeric `np.ndarray` and one `_UnitType`,
+    rather than an object array of per-element quantities. A 0-d array keeps its
+    shape, and quantities are not accepted as elements (their units would be lost).
+    """
+
+    if isinstance(value, np.ndarray) is False and any(
+        isinstance(x, _DimensionUnitBase) for x in value
+    ):
+        raise TypeError(
+            "the values of a sequence quantity must be numbers, not quantities"
+        )
+    return np.asarray(value, dtype=np.float64, order="C")
+
+
+def _as_operand(x: Any) -> int | float | np.ndarray | None:
+    """Coerce a plain number operand of an arithmetic operator. Real numbers (numpy
+    scalars included) are made `int` or `float`, and arrays, lists and tuples
+    `float64` arrays so that they broadcast against the value buffer; None for any
+    other object."""
+
+    if isinstance(x, (int, float)) is True:
+        return x
+    if isinstance(x, numbers.Real) is True:
+        return x.item() if isinstance(x, np.generic) is True else float(x)
+    if isinstance(x, (np.ndarray, list, tuple)) is True:
+        return _as_value_array(x)
+    return None
+
+
+def _trusted_value(value: int | float | np.ndarray) -> int | float | np.ndarray:
+    """The value of a quantity created from the result of an operation. Results in
+    another dtype (e.g. of `float32` memory-mapped values) are made `float64`, while
+    memory-mapped values and their views keep the dtype of the file."""
+
+    if value.__class__ is np.ndarray and value.dtype != np.float64:
+        return value.astype(np.float64)
+    return value
+
+
+def _array_value(value: int | float | np.ndarray) -> np.ndarray:
+    """`value` as an array, a memory-mapped value stays mapped (in its own dtype)."""
+
+    if isinstance(value, np.memmap) is True:
+        return value
+    return np.asarray(value, dtype=np.float64)
+
+
+def _reject_mapped(value: int | float | np.ndarray, operation: str) -> None:
+    if isinstance(value, np.memmap) is True:
+        raise exceptions.OperationNotAvailable(
+            f"{operation} needs the whole value in memory and is not available for a "
+            "memory-mapped quantity, wrap `np.array(quantity.value)` in a new "
+            "quantity first"
+        )
+
+
+def _format_quantity(quantity) -> str:
+    """`value unit` string of a quantity. An array value is summarized numpy-style
+    past the `threshold` of `set_printoptions`, so printing it stays cheap; the unit
+    string is rendered once per unit and style."""
+
+    value = quantity.value
+    if isinstance(value, np.ndarray) is True:
+        value = np.array2string(
+            value,
+            threshold=_PRINT_OPTIONS.threshold,
+            edgeitems=_PRINT_OPTIONS.edgeitems,
+        )
+    style = _PRINT_OPTIONS.unit_style
+    if style == "default":
+        # quantities print their symbol as `sympy` did
+        style = "plain"
+    return f"{value} {quantity.unit_type.render(style)}"
+
+
+def _is_bool_result(value) -> bool:
+    """Check whether an operator result is a boolean (or boolean array)."""
+
+    if isinstance(value, (bool, np.bool_)) is True:
+        return True
+    return isinstance(value, np.ndarray) and value.dtype == bool
+
+
+class _UnitFamilyTable:
+    """Internal descriptor for the `_conversion_standards` of a quantity class whose
+    unit family is loaded lazily by `mudu.units`: the family is loaded on first access
+    and its conversion table then replaces the descriptor on the class.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __set_name__(self, owner: type, attribute: str) -> None:
+        self.owner, self.attribute = owner, attribute
+
+    def __get__(self, instance, owner: type = None) -> _ConversionTableType:
+        conversion_standards = getattr(units, self.name)
+        setattr(self.owner, self.attribute, conversion_standards)
+        return conversion_standards
+
+
+# number of values converted or reduced at a time for memory-mapped (`np.memmap`)
+# quantities, so that only a bounded window of the mapped pages is resident at once
+_CHUNK_SIZE = 1 << 20
+
+
+def _row_chunks(value: np.ndarray):
+    """Consecutive blocks of whole rows (along the first axis) of an array, views of
+    about `_CHUNK_SIZE` values each (at least one row)."""
+
+    if value.ndim == 0:
+        return (value.reshape(1),)
+    rows = max(_CHUNK_SIZE // max(math.prod(value.shape[1:]), 1), 1)
+    return (value[start : start + rows] for start in range(0, len(value), rows))
+
+
+def _apply_chunked(
+    converter: _ConverterType, value: np.ndarray, out: np.ndarray = None
+) -> np.ndarray:
+    """Converts a memory-mapped value chunk by chunk into `out` (a new `float64` array
+    when not given, or e.g. a writable `np.memmap`)."""
+
+    if out is None:
+        out = np.empty(value.shape, dtype=np.float64)
+    for source, target in zip(_row_chunks(value), _row_chunks(out)):
+        converter.apply(source, out=target)
+    return out
+
+
+def _reduce_chunked(ufunc: np.ufunc, value: np.ndarray, axis: int | None = None):
+    """Reduces a memory-mapped value chunk by chunk along `axis` (all axes when None),
+    accumulating in `float64`."""
+
+    if axis is None:
+        partials = [
+            ufunc.reduce(chunk, axis=None, dtype=np.float64)
+            for chunk in _row_chunks(value)
+        ]
+        return ufunc.reduce(np.array(partials)).item()
+
+    axis = normalize_axis_index(axis, value.ndim)
+    partials = (
+        ufunc.reduce(chunk, axis=axis, dtype=np.float64) for chunk in _row_chunks(value)
+    )
+    if axis == 0:
+        return functools.reduce(ufunc, partials)
+    return np.concatenate(list(partials))
+
+
+def _accumulate_chunked(
+    ufunc: np.ufunc, value: np.ndarray, axis: int | None = None
+) -> np.ndarray:
+    """Accumulates (e.g. `cumsum`) a memory-mapped value chunk by chunk along `axis`
+    (the flattened value when None) into a new `float64` array."""
+
+    flat = axis is None
+    if flat is True:
+        axis, out = 0, np.empty(value.size, dtype=np.float64)
+    else:
+        axis = normalize_axis_index(axis, value.ndim)
+        out = np.empty(value.shape, dtype=np.float64)
+
+    position = 0
+    for chunk in _row_chunks(value):
+        if flat is True:
+            chunk = chunk.reshape(-1)
+        target = out[position : position + len(chunk)]
+        ufunc.accumulate(chunk, axis=axis, dtype=np.float64, out=target)
+        if axis == 0 and position > 0:
+            # carry the accumulation of the previous chunks
+            ufunc(target, out[position - 1], out=target)
+        position += len(chunk)
+    return out
+
+
+def _var_chunked(value: np.ndarray, axis: int | None = None, ddof: int = 0):
+    """Variance of a memory-mapped value along `axis` (all axes when None), merging
+    the mean and the sum of squared deviations of every chunk (Chan et al.)."""
+
+    if axis is not None:
+        axis = normalize_axis_index(axis, value.ndim)
+        if axis != 0:
+            return np.concatenate(
+                [
+                    np.var(chunk, axis=axis, ddof=ddof, dtype=np.float64)
+                    for chunk in _row_chunks(value)
+                ]
+            )
+
+    count, mean, squares = 0, 0.0, 0.0
+    for chunk in _row_chunks(value):
+        if axis is None:
+            chunk = chunk.reshape(-1)
+        size = len(chunk)
+        chunk_mean = np.mean(chunk, axis=0, dtype=np.float64)
+        chunk_squares = np.add.reduce((chunk - chunk_mean) ** 2, axis=0)
+        delta = chunk_mean - mean
+        total = count + size
+        mean = mean + delta * size / total
+        squares = squares + chunk_squares + delta**2 * count * size / total
+        count = total
+
+    variance = squares / (count - ddof)
+    return float(variance) if axis is None else variance
+
+
+def _two_sum(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """`a + b` and its exact rounding error (Knuth's TwoSum), elementwise."""
+
+    total = a + b
+    b_part = total - a
+    return total, (a - (total - b_part)) + (b - b_part)
+
+
+def _compensated_sum(value, axis: int | None = None):
+    """Compensated sum of `value` (along `axis`).
+
+    `np.add.reduce` already sums contiguous runs pairwise, this is for long series
+    where even the pairwise rounding error matters. The series is added block by
+    block (`_CHUNK_SIZE` terms per step, so a memory-mapped value is read in
+    chunks) into running sums that keep their exact rounding errors, which are then
+    folded pairwise the same way.
+    """
+
+    value = np.moveaxis(np.reshape(value, -1) if axis is None else value, axis or 0, -1)
+    terms = value.shape[-1]
+    width = max(min(terms, _CHUNK_SIZE // max(math.prod(value.shape[:-1]), 1)), 1)
+
+    total = np.zeros(value.shape[:-1] + (width,))
+    error = np.zeros_like(total)
+    for start in range(0, terms, width):
+        block = np.asarray(value[..., start : start + width], dtype=np.float64)
+        size = block.shape[-1]
+        total[..., :size], block_error = _two_sum(total[..., :size], block)
+        error[..., :size] += block_error
+
+    while total.shape[-1] > 1:
+        if total.shape[-1] % 2 == 1:
+            pad = [(0, 0)] * (total.ndim - 1) + [(0, 1)]
+            total, error = np.pad(total, pad), np.pad(error, pad)
+        total, pair_error = _two_sum(total[..., 0::2], total[..., 1::2])
+        error = error[..., 0::2] + error[..., 1::2] + pair_error
+
+    result = total[..., 0] + error[..., 0]
+    return result.item() if axis is None else result
+
+
+def _resolve_conversion(
+    conversion_standards: _ConversionTableType, unit_type: _UnitType, _to: _UnitType
+) -> _ConverterType:
+    """Resolves the conversion from `unit_type` to `_to` once, into a `_ConverterType`
+    that converts a scalar or a whole `np.ndarray`.
 
     Parameters
     ----------
+    conversion_standards: _ConversionTableType
+        The conversion table of the quantity being converted.
     unit_type: _UnitType
+        The unit to be converted from.
+    _to: _UnitType
         The _UnitType instance to be converted to.
 
-    return: _DimensionType object with the `unit_type` as the unit.
+    return: _ConverterType
     """
 
-    @property
-    def __value_not_seq(self):
-        """value is not a sequence"""
-        return isinstance(self.value, (int, float))
+    key = (id(unit_type), id(_to))
+    cached = conversion_standards._resolved.get(key)
+    if cached is not None:
+        return cached[2]
 
-    if self._conversion_standards is None:
-        raise exceptions.ConversionError("this quantity has no conversion unit defined")
+    if unit_type._dimension != _to._dimension:
+        raise exceptions.DimensionError(
+            f"Cannot convert {unit_type._dimension} dimension to {_to._dimension} dimension."
+        )
 
-    if isinstance(_to, _UnitType) is True:
+    # check if self a derived (quantity) unit
+    base_unit = unit_type._base
+    if base_unit is None:
+        base_unit = unit_type
 
-        new_value = object()
-        try:
-            if self.dimension != _to._dimension:
-                raise exceptions.DimensionError(
-                    f"Cannot convert {self.dimension} dimension to {_to._dimension} dimension."
+    # check if to is also a derived (quantity) unit
+    to_base_unit = _to._base
+    if to_base_unit is None:
+        to_base_unit = _to
+
+    # check if self is a multiple of other unit
+    _order = unit_type._order
+    if _order is None:
+        _multiple = 1
+    else:
+        _multiple = _order.value
+
+    # check if to is a multiple of other unit
+    to_order = _to._order
+    if to_order is None:
+        to_multiple = 1
+    else:
+        to_multiple = to_order.value
+
+    # converting between the same unit and multiple prefix
+    if _to is unit_type:
+        steps = []
+
+    # converting between the same unit but different multiple prefix
+    elif to_base_unit is base_unit or to_base_unit == base_unit:
+        steps = []
+
+    else:
+        # conversion between different units with or without multiple prefix,
+        # directly or through other units of the table
+        steps = conversion_standards.path(base_unit, to_base_unit)
+        if steps is None:
+            # e.g. a composite unit from unit algebra, converted through the base
+            # units it decomposes into; extending the table drops the entry (hops > 1)
+            resolved = _decomposed_conversion(unit_type, _to)
+            conversion_standards._resolved[key] = (unit_type, _to, resolved, 2)
+            return resolved
+
+    # compose the prefixes and the chain into one conversion; affine chains
+    # (all the built-in ones) fold into a single scale and offset
+    resolved = _ConverterType(scale=_multiple)
+    for step in steps:
+        resolved = resolved.compose(step)
+    resolved = resolved.compose(_ConverterType(scale=1 / to_multiple))
+
+    # the entry holds both units, which keeps their ids valid
+    conversion_standards._resolved[key] = (unit_type, _to, resolved, len(steps))
+    return resolved
+
+
+def _conversion_table_of(unit_type: _UnitType) -> _ConversionTableType:
+    """The conversion table that defines `unit_type`, or the unit it is a multiple of."""
+
+    base_unit = unit_type._base
+    if base_unit is None:
+        base_unit = unit_type
+
+    for conversion_standards in _CONVERSION_TABLES:
+        if conversion_standards.has_unit(base_unit) is True:
+            return conversion_standards
+
+    raise exceptions.ConversionError(
+        f"no conversion standard defined for {unit_type._unit_name}"
+    )
+
+
+def _resolve_units(unit_type: _UnitType, _to: _UnitType) -> _ConverterType:
+    """Resolves the conversion between two units, without a quantity, through the
+    conversion table that defines them; the result is cached like for `convert_to`.
+    Units of no table (e.g. composite units) are converted by decomposition.
+    """
+
+    if unit_type is _to:
+        return _ConverterType()
+
+    # pairs already known to have no table skip the search of every table
+    key = (id(unit_type), id(_to), base._TABLES_GENERATION)
+    converter = _DECOMPOSED_CONVERSIONS.get(key)
+    if converter is not None:
+        return converter
+
+    try:
+        conversion_standards = _conversion_table_of(unit_type)
+    except exceptions.ConversionError:
+        return _decomposed_conversion(unit_type, _to)
+    return _resolve_conversion(conversion_standards, unit_type, _to)
+
+
+def _reference_scale(unit_type: _UnitType) -> float:
+    """Scale of `unit_type` to the product of the reference units (`_REFERENCE_UNITS`)
+    of its dimension, e.g. `0.3048` for `FEET`, `1000` for `NEWTON` (g·m/s²).
+
+    A composite unit multiplies the scales of its `_factors`, a multiple that of its
+    base unit. A unit of a base dimension is converted to the reference unit through
+    its table, any other unit to the named unit of its table that has a definition in
+    `_UNIT_DEFINITIONS`. The scale is computed once and kept on the unit.
+    """
+
+    if unit_type._reference_scale is not None:
+        return unit_type._reference_scale
+
+    if unit_type._factors is not None:
+        scale = math.prod(
+            _reference_scale(unit) ** exponent for unit, exponent in unit_type._factors
+        )
+
+    elif unit_type._base is not None and unit_type._order is not None:
+        scale = unit_type._order.value * _reference_scale(unit_type._base)
+
+    else:
+        reference = next(
+            (u for u in _REFERENCE_UNITS if u._dimension == unit_type._dimension), None
+        )
+        if reference is unit_type:
+            scale = 1
+        else:
+            conversion_standards = _conversion_table_of(unit_type)
+            if reference is None:
+                reference, definition = next(
+                    (
+                        (unit, definition)
+                        for unit, definition in _UNIT_DEFINITIONS
+                        if conversion_standards.has_unit(unit) is True
+                    ),
+                    (None, None),
                 )
+                if reference is None:
+                    raise exceptions.ConversionError(
+                        f"{unit_type._unit_name} has no definition in base units"
+                    )
+                reference_scale = _reference_scale(definition)
+            else:
+                reference_scale = 1
 
-            elif self.dimension == _to._dimension:
-                # check conversion table and do the needful
-                _from, to, value = None, None, None
+            converter = _resolve_conversion(conversion_standards, unit_type, reference)
+            if converter.is_affine is False or converter.offset != 0:
+                raise exceptions.ConversionError(
+                    f"{unit_type._unit_name} has an offset, it cannot be decomposed into base units"
+                )
+            scale = converter.scale * reference_scale
 
-                # check if self a derived (quantity) unit
-                base_unit = self.unit_type._base
-                if base_unit is not None:
-                    base_unit = base_unit
-                else:
-                    base_unit = self.unit_type
+    unit_type._reference_scale = scale
+    return scale
 
-                # check if to is also a derived (quantity) unit
-                to_base_unit = _to._base
-                if to_base_unit is not None:
-                    to_base_unit = to_base_unit
-                else:
-                    to_base_unit = _to
 
-                # check if self is a multiple of other unit
-                _order = self.unit_type._order
-                if _order is None:
-                    _multiple = 1
-                else:
-                    _multiple = _order.value
+# (id(from), id(to), generation of the tables) -> conversion by decomposition, for
+# units without a table; extending a table may give them one
+_DECOMPOSED_CONVERSIONS = _UnitAlgebraCache()
 
-                # check if to is a multiple of other unit
-                to_order = _to._order
-                if to_order is None:
-                    to_multiple = 1
-                else:
-                    to_multiple = to_order.value
-
-                # converting between the same unit and multiple prefix
-                if _to == self.unit_type:
-                    return self.create_unit(unit=self.unit_type, value=self.value)
-
-                # converting between the same unit but different multiple prefix
-                elif to_base_unit == base_unit:
-                    if __value_not_seq is True:
-                        value = (self.value * _multiple) / to_multiple
-                    else:
-                        value = [
-                            (i.value * _multiple) / to_multiple
-                            for i in iter(self.value)
-                        ]
-                    return self.create_unit(unit=base_unit, value=value)
-
-                # conversion between different units with or without
-                for _conv_std in self._conversion_standards.conversion_table:
-                    (_from, to), value = _conv_std
-
-                    if (base_unit, to_base_unit) == (
-                        _from,
-                        to,
-                    ):
-                        if __value_not_seq is True:
-                            new_value = value(x=(self.value * _multiple)) / to_multiple
-                        else:
-                            new_value = [
-                                value(x=(i.value * _multiple)) / to_multiple
-                                for i in iter(self.value)
-                            ]
-
-                    elif (base_unit, to_base_unit) == (
-                        to,
-                        _from,
-                    ):
-                        if __value_not_seq is True:
-                            new_value = (
-                                value(x=(_multiple * self.value), invert=True)
-                                / to_multiple
-                            )
-                        else:
-                            new_value = [
-                                value(x=(_multiple * i.value), invert=True)
-                                / to_multiple
-                                for i in iter(self.value)
-                            ]
-
-                    continue
-
-                return self.create_unit(unit=_to, value=new_value)
+
+def _decomposed_conversion(unit_type: _UnitType, _to: _UnitType) -> _ConverterType:
+    """Converts between two units of the same dimension through the base units they
+    decompose into, e.g. slug/ft³ to kg/m³; no conversion standard is needed."""
+
+    key = (id(unit_type), id(_to), base._TABLES_GENERATION)
+    converter = _DECOMPOSED_CONVERSIONS.get(key)
+    if converter is not None:
+        return converter
+
+    if unit_type._dimension != _to._dimension:
+        raise exceptions.DimensionError(
+            f"Cannot convert {unit_type._dimension} dimension to {_to._dimension} dimension."
+        )
+
+    scale = _reference_scale(unit_type) / _reference_scale(_to)
+    converter = _ConverterType(scale=scale)
+    _DECOMPOSED_CONVERSIONS.put(key, (unit_type, _to), converter)
+    return converter
+
+
+def _unit_conversion(self, _to, out: np.ndarray = None):
+    """Converts the value of a quantity from its unit to another, provided that there
+    is a conversion standard defined for the units involved.
+
+    The conversion is resolved once into a scale and offset, and then applied to the
+    whole value at once, whether the value is a scalar or a numeric `np.ndarray`.
+
+    Parameters
+    ----------
+    self: _DimensionUnitBase
+        The quantity to be converted.
+    _to: _UnitType
+        The _UnitType instance to be converted to.
+    out: np.ndarray
+        Optional buffer the converted values are written into.
+
+    return: the converted value (int | float | np.ndarray).
+    """
+
+    if isinstance(_to, _UnitType) is True:
+
+        try:
+            if self._conversion_standards is None:
+                # a quantity without a table, e.g. a `DerivedQuantity` from unit algebra
+                converter = _resolve_units(self.unit_type, _to)
+            else:
+                converter = _resolve_conversion(
+                    self._conversion_standards, self.unit_type, _to
+                )
+            if out is None and _to is self.unit_type:
+                return self.value
+            if isinstance(self.value, np.memmap) is True:
+                return _apply_chunked(converter, self.value, out=out)
+            return converter.apply(self.value, out=out)
 
         except Exception as e:
             raise exceptions.ConversionError(str(e))
@@ -198,6 +569,35 @@ def _unit_conversion(self, _to):
         )
 
 
+# operators returning a boolean (mask) rather than a quantity
+_COMPARISON_OPERATORS = frozenset(
+    (operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne)
+)
+
+
+def _operand_values(self, x, convert_smaller: bool = False) -> tuple:
+    """Values of two quantities of the same dimension, in a common unit.
+
+    By default `x` is converted to the unit of `self`, as arithmetic results are in the
+    unit of `self`. Comparisons only return a mask, so with `convert_smaller` the
+    operand with fewer values (typically a scalar threshold) is converted instead, once.
+
+    return: tuple[int | float | np.ndarray, int | float | np.ndarray]
+    """
+
+    if x.unit_type is self.unit_type or x.unit_type == self.unit_type:
+        return self.value, x.value
+
+    if (
+        convert_smaller is True
+        and self._conversion_standards is not None
+        and np.size(self.value) < np.size(x.value)
+    ):
+        return _unit_conversion(self, x.unit_type), x.value
+
+    return self.value, _unit_conversion(x, self.unit_type)
+
+
 class _DimensionUnitBase:
     """
     Base class for all dimensions model.
@@ -207,8 +607,8 @@ class _DimensionUnitBase:
     _conversion_standards: _ConversionTableType
         Conversion table definition of conversion standards for converting
         from one unit to another provided that the units are of the same dimension.
-    _dimension: str
-        The dimension represented by the dimension model e.g. `METER`, `LENGTH`, `TIME`
+    _dimension: _DimensionVector
+        The dimension represented by the dimension model e.g. `LENGTH`, `TIME`
     _check_and_convert: _DimensionUnitBase | int | float | bool
         Performs an arithemetic or boolean operation on a `_DimensionUnitBase` child object.
         Makes sure of unit homogeniety by implicitly converting units where required before
@@ -216,10 +616,42 @@ class _DimensionUnitBase:
     convert_to: _DimensionUnitBase | bool
         Converts from one unit to another, provided that there is a conversion standard
         defined for the units involved.
+    _set_once: None
+        Initializes the `_SetOnce` attributes of an object being constructed.
+    __array_ufunc__: _DimensionUnitBase | np.ndarray | NotImplemented
+        NumPy ufunc protocol, applies the dimension rule of the ufunc (see `_UFUNC_RULES`)
+        to the values of the operands and returns a quantity backed by a native buffer.
+    __array_function__: Any
+        NumPy function protocol, dispatches to the unit aware implementations
+        registered in `_HANDLED_FUNCTIONS`.
+    shape, ndim: tuple, int
+        Shape and number of dimensions of the value, `()` and `0` for scalars.
+    __getitem__, reshape, transpose, T: _DimensionUnitBase
+        Indexing and reshaping of quantity arrays. Basic slices, `reshape` and
+        `transpose` return views sharing the value buffer (and unit) of the quantity,
+        fancy indexing returns a copy.
+    from_array, from_buffer, linspace, arange, full, zeros: _DimensionUnitBase
+        Bulk constructors, building one quantity array around a single native buffer.
+        `unit` is the unit (unit definition for `DerivedQuantity`) of the quantity.
+    clip: _DimensionUnitBase
+        Values limited to the `min` and `max` quantities, converted once to the unit of
+        the quantity. Comparisons return boolean masks, usable as `q[mask]`.
+    sum, mean, min, max, cumsum, percentile, std: _DimensionUnitBase
+        Reductions along `axis` (all axes by default), in the unit of the quantity.
+        The `nan` prefixed NumPy functions (`np.nansum`, `np.nanmean`, ...) skip NaNs.
     """
 
+    # quantities are stored in slots, there is no per-instance `__dict__`;
+    # the `_SetOnce` attributes of a child class read their `_<name>_slot` entry
+    __slots__ = ("_value_slot", "_unit_type_slot", "_symbol_slot", "_dimension_slot")
+
     _conversion_standards: _ConversionTableType = None
-    _dimension: str = None
+    _dimension: _DimensionVector = None
+
+    def _set_once(self, **attributes) -> None:
+        cls = type(self)
+        for name, value in attributes.items():
+            getattr(cls, name).initialize(self, value)
 
     def __repr__(self):
         return ""
@@ -284,6 +716,148 @@ class _DimensionUnitBase:
     def __eq__(self, x):
         return self._check_and_convert(x, _operator=operator.eq)
 
+    def __ne__(self, x):
+        return self._check_and_convert(x, _operator=operator.ne)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return _apply_ufunc(ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+
+        handler = _HANDLED_FUNCTIONS.get(func)
+        if handler is None or not all(
+            issubclass(t, (_DimensionUnitBase, np.ndarray)) for t in types
+        ):
+            return NotImplemented
+        return handler(*args, **kwargs)
+
+    @classmethod
+    def from_array(cls, array, unit: _UnitType, copy: bool | None = False) -> Self:
+        """Wraps an existing array. With `copy=False` (the default) the quantity shares
+        the buffer of `array`, which must then already be a contiguous `float64` array,
+        otherwise a `ValueError` is raised; `copy=None` copies only if needed.
+        """
+
+        value = np.asarray(array, dtype=np.float64, copy=copy)
+        if copy is False and value.flags.c_contiguous is False:
+            raise ValueError("a copy is needed to make the array a contiguous buffer")
+        return cls(value, unit)
+
+    @classmethod
+    def from_buffer(
+        cls, buffer, unit: _UnitType, count: int = -1, offset: int = 0
+    ) -> Self:
+        """Wraps an object exposing the buffer protocol (`bytes`, `bytearray`,
+        `memoryview`, ...) of native `float64` values, without copying.
+        """
+
+        value = np.frombuffer(buffer, dtype=np.float64, count=count, offset=offset)
+        return cls(value, unit)
+
+    @classmethod
+    def linspace(
+        cls, start: float, stop: float, num: int, unit: _UnitType, endpoint: bool = True
+    ) -> Self:
+        return cls(np.linspace(start, stop, num, endpoint=endpoint), unit)
+
+    @classmethod
+    def arange(cls, start: float, stop: float, step: float, unit: _UnitType) -> Self:
+        return cls(np.arange(start, stop, step, dtype=np.float64), unit)
+
+    @classmethod
+    def full(cls, shape: int | tuple, fill_value: float, unit: _UnitType) -> Self:
+        return cls(np.full(shape, fill_value, dtype=np.float64), unit)
+
+    @classmethod
+    def zeros(cls, shape: int | tuple, unit: _UnitType) -> Self:
+        return cls(np.zeros(shape, dtype=np.float64), unit)
+
+    @property
+    def shape(self) -> tuple:
+        return np.shape(self.value)
+
+    @property
+    def ndim(self) -> int:
+        return np.ndim(self.value)
+
+    def __getitem__(self, key) -> Self:
+
+        if isinstance(self.value, np.ndarray) is False:
+            raise exceptions.NotIterableError(
+                "indexing is only supported for sequence value entries"
+            )
+        return _as_quantity(self.value[key], self.unit_type, self)
+
+    def reshape(self, *shape) -> Self:
+        value = _array_value(self.value).reshape(*shape)
+        return _as_quantity(value, self.unit_type, self)
+
+    def transpose(self, *axes) -> Self:
+        value = _array_value(self.value).transpose(*axes)
+        return _as_quantity(value, self.unit_type, self)
+
+    @property
+    def T(self) -> Self:
+        return self.transpose()
+
+    def clip(self, min=None, max=None) -> Self:
+        return _clip(self, min, max)
+
+    def sum(self, axis: int | None = None, compensated: bool = False) -> Self:
+        """Sum of the values along `axis`. Contiguous runs are summed pairwise, pass
+        `compensated=True` for a compensated sum that keeps their rounding errors."""
+
+        if compensated is True:
+            value = _compensated_sum(self.value, axis)
+        elif isinstance(self.value, np.memmap) is True:
+            value = _reduce_chunked(np.add, self.value, axis)
+        else:
+            value = np.add.reduce(self.value, axis=axis)
+        return _as_quantity(value, self.unit_type, self)
+
+    def mean(self, axis: int | None = None, compensated: bool = False) -> Self:
+        count = np.size(self.value) if axis is None else np.shape(self.value)[axis]
+        if compensated is True:
+            value = _compensated_sum(self.value, axis) / count
+        elif isinstance(self.value, np.memmap) is True:
+            value = _reduce_chunked(np.add, self.value, axis) / count
+        else:
+            value = np.mean(self.value, axis=axis)
+        return _as_quantity(value, self.unit_type, self)
+
+    def min(self, axis: int | None = None) -> Self:
+        if isinstance(self.value, np.memmap) is True:
+            return _as_quantity(
+                _reduce_chunked(np.minimum, self.value, axis), self.unit_type, self
+            )
+        return _as_quantity(np.min(self.value, axis=axis), self.unit_type, self)
+
+    def max(self, axis: int | None = None) -> Self:
+        if isinstance(self.value, np.memmap) is True:
+            return _as_quantity(
+                _reduce_chunked(np.maximum, self.value, axis), self.unit_type, self
+            )
+        return _as_quantity(np.max(self.value, axis=axis), self.unit_type, self)
+
+    def cumsum(self, axis: int | None = None) -> Self:
+        if isinstance(self.value, np.memmap) is True:
+            value = _accumulate_chunked(np.add, self.value, axis)
+        else:
+            value = np.cumsum(self.value, axis=axis)
+        return _as_quantity(value, self.unit_type, self)
+
+    def percentile(self, q, axis: int | None = None, method: str = "linear") -> Self:
+        _reject_mapped(self.value, "percentile")
+        value = np.percentile(self.value, q, axis=axis, method=method)
+        return _as_quantity(value, self.unit_type, self)
+
+    def std(self, axis: int | None = None, ddof: int = 0) -> Self:
+        if isinstance(self.value, np.memmap) is True:
+            value = np.sqrt(_var_chunked(self.value, axis, ddof))
+        else:
+            value = np.std(self.value, axis=axis, ddof=ddof)
+        return _as_quantity(value, self.unit_type, self)
+
     def _check_and_convert(
         self, x: Any, _operator: Callable
     ) -> Self | bool | (int | float):
@@ -303,7 +877,7 @@ class _DimensionUnitBase:
 
         pass
 
-    def convert_to(self, _to: _UnitType):
+    def convert_to(self, _to: _UnitType, out: np.ndarray = None):
         """Converts from one unit to another, provided that there is a conversion standard
         defined for the units involved.
 
@@ -311,6 +885,8 @@ class _DimensionUnitBase:
         ----------
         unit_type: _UnitType
             The _UnitType instance to be converted to.
+        out: np.ndarray
+            Optional buffer the converted values are written into.
 
         return: _DimensionUnitBase object with the `unit_type` as the unit.
         """
@@ -330,21 +906,26 @@ class DerivedQuantity(_DimensionUnitBase):
         Same as in `_DimensionUnitBase`
     _dimension: str
         Same as in  `DimensionUnitBase`
-    value: _SetOnce[int | float]
-        Scalar value of the quantity
+    value: _SetOnce[int | float | np.ndarray]
+        Scalar value of the quantity, or a `float64` `np.ndarray` for sequence quantities
     unit_type: _UnitType
         unit definition of the quantity
-    symbol: sympy.Symbol
-        Symbolic representation of the quantity unit
+    symbol: _UnitSymbol
+        Symbolic representation of the quantity unit, `symbol.as_sympy()` for `sympy`
     create_unit: DerivedQuantity
         Internal class method for creating a new DerivedQuantity object instance
         with the same argument signature as init.
+    _create_trusted: DerivedQuantity
+        Internal class method for creating a new DerivedQuantity object instance
+        from a value and unit definition already known to be valid, without validation.
     _check_and_convert: x: Any, operator: Callable
         same as the base class  ((_DimensionUnitBase))
     convert_to: _to
         same as the base class (_DimensionUnitBase)
     """
 
+    __slots__ = ("_quantity_slot",)
+
     _conversion_standards: _ConversionTableType = None
 
     value = _SetOnce(
@@ -352,13 +933,13 @@ class DerivedQuantity(_DimensionUnitBase):
         (
             int,
             float,
-            abc.Sequence,
             np.ndarray,
         ),
     )
     unit_type = _SetOnce("unit_type", _UnitType)
-    symbol = _SetOnce("symbol", sym.Basic)
+    symbol = _SetOnce("symbol", _UnitSymbol)
     quantity: str = _SetOnce("quantity", str)
+    dimension = _SetOnce("dimension", _DimensionVector)
 
     @classmethod
     def create_unit(cls, **kwargs):
@@ -368,33 +949,51 @@ class DerivedQuantity(_DimensionUnitBase):
 
         return cls(**kwargs)
 
+    @classmethod
+    def _create_trusted(
+        cls,
+        value: int | float | np.ndarray,
+        unit_definition: _UnitType,
+        quantity: str = GENERIC_QUANTITY,
+    ) -> Self:
+        """Internal class method to create a new DerivedQuantity object from the
+        result of an operation. The caller guarantees that `value` is a scalar or a
+        numeric `np.ndarray` (made `float64` unless memory-mapped) and that
+        `unit_definition` is a unit of `quantity`; none of the checks of init are
+        repeated.
+        """
+
+        self = object.__new__(cls)
+        self._value_slot = _trusted_value(value)
+        self._unit_type_slot = unit_definition
+        self._symbol_slot = unit_definition._unit_symbol
+        self._quantity_slot = quantity
+        self._dimension_slot = unit_definition._dimension
+        return self
+
     def __init__(
         self,
-        value: int | float,
+        value: int | float | abc.Sequence | np.ndarray,
         unit_definition: _UnitType,
         quantity: str = GENERIC_QUANTITY,
     ):
 
-        self.unit_type = unit_definition
-        self.symbol = unit_definition._unit_symbol
-        self.quantity = quantity
-        self.dimension = unit_definition._dimension
-
-        if self.quantity is not GENERIC_QUANTITY:
-            if self.unit_type._quantity != self.quantity:
+        if quantity is not GENERIC_QUANTITY:
+            if unit_definition._quantity != quantity:
                 raise exceptions.DimensionError(
-                    f"{self.unit_type._unit_name} is not a unit of {self._dimension}"
+                    f"{unit_definition._unit_name} is not a unit of {self._dimension}"
                 )
 
         if isinstance(value, (abc.Sequence, np.ndarray)):
-            self.value = np.array(
-                [
-                    self.create_unit(unit_definition=unit_definition, value=i)
-                    for i in value
-                ]
-            )
-        elif isinstance(value, (int, float)):
-            self.value = value
+            value = _as_value_array(value)
+
+        self._set_once(
+            unit_type=unit_definition,
+            symbol=unit_definition._unit_symbol,
+            quantity=quantity,
+            dimension=unit_definition._dimension,
+            value=value,
+        )
 
     @property
     def __value_not_seq(self):
@@ -403,18 +1002,9 @@ class DerivedQuantity(_DimensionUnitBase):
 
     def __repr__(self):
 
-        return (
-            f"{self.value} {self.symbol}"
-            if self.__value_not_seq is True
-            else f"{self.value}"
-        )
+        return _format_quantity(self)
 
-    def __str__(self):
-
-        if self.__value_not_seq is True:
-            return f"{self.value} {self.symbol}"
-        else:
-            return f"{self.value}"
+    __str__ = __repr__
 
     def __len__(self):
 
@@ -424,7 +1014,12 @@ class DerivedQuantity(_DimensionUnitBase):
 
     def __iter__(self):
         if self.__value_not_seq is False:
-            return iter(self.value)
+            # a 1-D value yields scalar quantities, higher dimensions yield
+            # quantity views of the rows
+            items = self.value.tolist() if self.value.ndim == 1 else self.value
+            return (
+                self._create_trusted(i, self.unit_type, self.quantity) for i in items
+            )
         else:
             return iter([self.value])
         # raise exceptions.NotIterableError(f"Iteration is only supported for sequence value entries")
@@ -434,171 +1029,79 @@ class DerivedQuantity(_DimensionUnitBase):
         if self.__value_not_seq is True:
             value = round(self.value, y)
         else:
-            value = [round(i, y).value for i in iter(self.value)]
+            value = np.round(self.value, y)
 
-        return self.create_unit(value=value, unit_definition=self.unit_type)
+        return self._create_trusted(value, self.unit_type, self.quantity)
 
     def __mul__(self, x):
 
         if isinstance(x, (DerivedQuantity, _DimensionType)) is True:
 
-            if self.__value_not_seq is True:
-                if isinstance(x.value, (int, float)):
-                    value = self.value * x.value
-                else:  # x is a sequence
-                    value = [i.value * self.value for i in iter(x.value)]
-            else:  # self.value is sequence
-                value = [i.value * x.value for i in iter(self.value)]
-
             unit_definition = self.unit_type * x.unit_type
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=unit_definition
+            return DerivedQuantity._create_trusted(
+                self.value * x.value, unit_definition
             )
 
-        elif isinstance(x, (int, float)) is True:
-            value = (
-                self.value * x
-                if self.__value_not_seq
-                else [i.value * x for i in iter(self.value)]
-            )
-
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=self.unit_type
-            )
+        operand = _as_operand(x)
+        if operand is None:
+            return NotImplemented
+        return DerivedQuantity._create_trusted(self.value * operand, self.unit_type)
 
     def __truediv__(self, x):
 
         if isinstance(x, DerivedQuantity) is True:
 
-            if self.unit_type._dimension == x.unit_type._dimension:  # e.g Force / Force
-
-                if self.unit_type == x.unit_type:
-                    if self.__value_not_seq is True:
-                        return self.value / x.value  # return a scalar
-                    else:
-                        return np.array([i.value / x.value for i in iter(self.value)])
-
-                else:
-                    if self.__value_not_seq is True:
-                        value = self.value / x.value
-                    else:
-                        value = [i.value / x.value for i in iter(self.value)]
-
-                    unit_definition = self.unit_type / x.unit_type
-                    return DerivedQuantity.create_unit(
-                        value=value, unit_definition=unit_definition
-                    )
-            else:
-
-                if self.__value_not_seq is True:
-                    value = self.value / x.value
-                else:
-                    value = [i.value / x.value for i in iter(self.value)]
-
-                unit_definition = self.unit_type / x.unit_type
-                return DerivedQuantity.create_unit(
-                    value=value, unit_definition=unit_definition
-                )
-
-        elif isinstance(x, _DimensionType) is True:
-
-            if self.__value_not_seq is True:
-                value = self.value / x.value
-            else:
-                value = [i.value / x.value for i in iter(self.value)]
+            if (
+                self.unit_type._dimension == x.unit_type._dimension
+                and self.unit_type == x.unit_type
+            ):  # e.g Force / Force
+                return self.value / x.value  # return a scalar (or a numeric array)
 
             unit_definition = self.unit_type / x.unit_type
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=unit_definition
+            return DerivedQuantity._create_trusted(
+                self.value / x.value, unit_definition
             )
 
-        elif isinstance(x, (int, float)) is True:
+        elif isinstance(x, _DimensionType) is True:
 
-            value = (
-                [i.value / x for i in iter(self.value)]
-                if self.__value_not_seq is False
-                else self.value / x
+            unit_definition = self.unit_type / x.unit_type
+            return DerivedQuantity._create_trusted(
+                self.value / x.value, unit_definition
             )
 
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=self.unit_type
-            )
+        operand = _as_operand(x)
+        if operand is None:
+            return NotImplemented
+        return DerivedQuantity._create_trusted(self.value / operand, self.unit_type)
 
     def __rtruediv__(self, x):
 
-        if isinstance(x, DerivedQuantity) is True:
-
-            if self.unit_type._dimension == x.unit_type._dimension:  # e.g Force / Force
-
-                if self.unit_type != x.unit_type:
-                    # e.g. Newton * Dyne -> coerce to Newton
-                    pass
-                elif self.unit_type == x.unit_type:
-                    return (
-                        [x.value / i.value for i in iter(self.value)]
-                        if self.__value_not_seq is False
-                        else x.value / self.value
-                    )  # return a scalar
-                else:
-                    value = (
-                        x.value / self.value
-                        if self.__value_not_seq is True
-                        else [x.value / i.value for i in iter(self.value)]
-                    )
-                    unit_definition = x.unit_type / self.unit_type
-
-                    return DerivedQuantity.create_unit(
-                        value=value, unit_definition=unit_definition
-                    )
-            else:
-                # e.g. Force * Area
-                value = (
-                    x.value / self.value
-                    if self.__value_not_seq is True
-                    else [x.value / i.value for i in iter(self.value)]
-                )
-                unit_definition = x.unit_type / self.unit_type
+        if isinstance(x, (DerivedQuantity, _DimensionType)) is True:
 
-                return DerivedQuantity.create_unit(
-                    value=value, unit_definition=unit_definition
-                )
+            if (
+                self.unit_type._dimension == x.unit_type._dimension
+                and self.unit_type == x.unit_type
+            ):
+                return x.value / self.value  # return a scalar (or a numeric array)
 
-        elif isinstance(x, _DimensionType) is True:
-
-            value = (
-                x.value / self.value
-                if self.__value is True
-                else [x.value / i.value for i in iter(self.value)]
-            )
             unit_definition = x.unit_type / self.unit_type
-
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=unit_definition
+            return DerivedQuantity._create_trusted(
+                x.value / self.value, unit_definition
             )
 
-        elif isinstance(x, (int, float)) is True:
-            value = (
-                x / self.value
-                if self.__value_not_seq is True
-                else [x / i.value for i in iter(self.value)]
-            )
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=x / self.unit_type
-            )
+        operand = _as_operand(x)
+        if operand is None:
+            return NotImplemented
+        return DerivedQuantity._create_trusted(
+            operand / self.value, self.unit_type**-1
+        )
 
     def __pow__(self, x):
 
         if isinstance(x, (int, float)) is True:
-            value = (
-                self.value**x
-                if self.__value_not_seq is True
-                else [i.value**x for i in iter(self.value)]
-            )
             unit_definition = self.unit_type**x
 
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=unit_definition
-            )
+            return DerivedQuantity._create_trusted(self.value**x, unit_definition)
         else:
             raise exceptions.DimensionError(
                 f"cannot operate on {self.unit_type._dimension} and {type(x)}"
@@ -616,7 +1119,7 @@ class DerivedQuantity(_DimensionUnitBase):
         _operator: Callable
             Operator representing operation to be performed
 
-        return: DerivedQuantity | bool | int | float
+        return: DerivedQuantity | bool | np.ndarray | int | float
         """
 
         if isinstance(x, DerivedQuantity):
@@ -630,35 +1133,23 @@ class DerivedQuantity(_DimensionUnitBase):
             elif self.unit_type._dimension == x.unit_type._dimension:
                 # the operand represent the same quantity say Force and Force
 
-                if self.unit_type != x.unit_type:
-                    # the operands have rep same quantity but are of different units, e.g. Newton and Dyne
-
-                    _equivalent_obj = x.convert_to(self.unit_type)
-                    _value = _equivalent_obj.value
-                    del _equivalent_obj
-                else:
-                    _value = x.value
-
-                new_value = _operator(self.value, _value)
+                # the operands may rep same quantity in different units, e.g. N and dyn
+                # one side is converted once, as a whole buffer
+                self_value, x_value = _operand_values(
+                    self, x, convert_smaller=_operator in _COMPARISON_OPERATORS
+                )
+                new_value = _operator(self_value, x_value)
 
-                if isinstance(new_value, bool) is True:
+                if _is_bool_result(new_value) is True:
                     return new_value
 
                 else:
-                    return DerivedQuantity.create_unit(
-                        value=new_value,
-                        unit_definition=self.unit_type,
-                    )
+                    return DerivedQuantity._create_trusted(new_value, self.unit_type)
 
         elif isinstance(x, (int, float)) is True:
             # explicit is better than implicit afterall
-            new_value = _operator(self.value, x)
-
-            if isinstance(new_value, bool) is True:
-                return new_value
-
-            else:
-                return new_value  # should be scalar or dimensionless
+            # should be boolean, scalar or dimensionless
+            return _operator(self.value, x)
 
         else:
             # all sort of dimensional inhomogeniety
@@ -666,7 +1157,7 @@ class DerivedQuantity(_DimensionUnitBase):
                 f"cannot operate on {self.unit_type._dimension} and {x.unit_type._dimension} dimensions."
             )
 
-    def convert_to(self, _to) -> Self | None:
+    def convert_to(self, _to, out: np.ndarray = None) -> Self | None:
         """Converts from one unit to another, provided that there is a conversion standard
         defined for the units involved.
 
@@ -674,117 +1165,15 @@ class DerivedQuantity(_DimensionUnitBase):
         ----------
         unit_type: _UnitType
             The _UnitType instance to be converted to.
+        out: np.ndarray
+            Optional `float64` buffer, of the same shape as the value, the converted
+            values are written into; no new buffer is allocated.
 
-        return: _DimensionType object with the `unit_type` as the unit.
+        return: DerivedQuantity object with the `unit_type` as the unit.
         """
 
-        if self._conversion_standards is None:
-            raise exceptions.ConversionError(
-                "this quantity has no conversion unit defined"
-            )
-
-        if isinstance(_to, _UnitType) is True:
-
-            new_value = object()
-            try:
-                if self.dimension != _to._dimension:
-                    raise exceptions.DimensionError(
-                        f"Cannot convert {self.dimension} dimension to {_to._dimension} dimension."
-                    )
-
-                elif self.dimension == _to._dimension:
-                    # check conversion table and do the needful
-                    _from, to, value = None, None, None
-
-                    # check if self a derived (quantity) unit
-                    base_unit = self.unit_type._base
-                    if base_unit is not None:
-                        base_unit = base_unit
-                    else:
-                        base_unit = self.unit_type
-
-                    # check if to is also a derived (quantity) unit
-                    to_base_unit = _to._base
-                    if to_base_unit is not None:
-                        to_base_unit = to_base_unit
-                    else:
-                        to_base_unit = _to
-
-                    # check if self is a multiple of other unit
-                    _order = self.unit_type._order
-                    if _order is None:
-                        _multiple = 1
-                    else:
-                        _multiple = _order.value
-
-                    # check if to is a multiple of other unit
-                    to_order = _to._order
-                    if to_order is None:
-                        to_multiple = 1
-                    else:
-                        to_multiple = to_order.value
-
-                    # converting between the same unit and multiple prefix
-                    if _to == self.unit_type:
-                        return self.create_unit(
-                            unit_definition=self.unit_type, value=self.value
-                        )
-
-                    # converting between the same unit but different multiple prefix
-                    elif to_base_unit == base_unit:
-                        if self.__value_not_seq is True:
-                            value = (self.value * _multiple) / to_multiple
-                        else:
-                            value = [
-                                (i.value * _multiple) / to_multiple
-                                for i in iter(self.value)
-                            ]
-                        return self.create_unit(unit_definition=base_unit, value=value)
-
-                    # conversion between different units with or without
-                    for _conv_std in self._conversion_standards.conversion_table:
-                        (_from, to), value = _conv_std
-
-                        if (base_unit, to_base_unit) == (
-                            _from,
-                            to,
-                        ):
-                            if self.__value_not_seq is True:
-                                new_value = (
-                                    value(x=(self.value * _multiple)) / to_multiple
-                                )
-                            else:
-                                new_value = [
-                                    value(x=(i.value * _multiple)) / to_multiple
-                                    for i in iter(self.value)
-                                ]
-
-                        elif (base_unit, to_base_unit) == (
-                            to,
-                            _from,
-                        ):
-                            if self.__value_not_seq is True:
-                                new_value = (
-                                    value(x=(_multiple * self.value), invert=True)
-                                    / to_multiple
-                                )
-                            else:
-                                new_value = [
-                                    value(x=(_multiple * i.value), invert=True)
-                                    / to_multiple
-                                    for i in iter(self.value)
-                                ]
-
-                        continue
-
-                    return self.create_unit(unit_definition=_to, value=new_value)
-
-            except Exception as e:
-                raise exceptions.ConversionError(str(e))
-        else:
-            raise exceptions.ConversionError(
-                f"conversion can only be made to a valid unit type"
-            )
+        value = _unit_conversion(self, _to, out=out)
+        return self._create_trusted(value, _to, self.quantity)
 
 
 # _DimensionType for fundamental quantities
@@ -800,56 +1189,77 @@ class _DimensionType(_DimensionUnitBase):
         Same as in `_DimensionUnitBase`
     _dimension: str
         Same as in  `DimensionUnitBase`
-    value: _SetOnce[int | float]
-        Scalar value of the quantity
+    value: _SetOnce[int | float | np.ndarray]
+        Scalar value of the quantity, or a `float64` `np.ndarray` for sequence quantities
     unit_type: _UnitType
         unit definition of the quantity
-    symbol: sympy.Symbol
-        Symbolic representation of the quantity unit
+    symbol: _UnitSymbol
+        Symbolic representation of the quantity unit, `symbol.as_sympy()` for `sympy`
     create_unit: _DimensiionType
         Internal class method for creating a new DerivedQuantity object instance
         with the same argument signature as init.
+    _create_trusted: _DimensionType
+        Internal class method for creating a new _DimensionType object instance
+        from a value and unit already known to be valid, without validation.
     _check_and_convert: x: Any, operator: Callable
         same as the base class  (_DimensionUnitBase)
     convert_to: _to
         same as the base class (_DimensionUnitBase)
     """
 
+    __slots__ = ("_unit_slot",)
+
     _conversion_standards: _ConversionTableType = None
     _dimension = None
     _base_unit_standard = None
 
-    dimension = _SetOnce("dimension", sym.Basic)
+    dimension = _SetOnce("dimension", _DimensionVector)
     unit_type = _SetOnce("unit_type", _UnitType)
     unit = _SetOnce("unit", str)
-    symbol = _SetOnce("symbol", sym.Basic)
-    value = _SetOnce("value", (int, float, abc.Sequence, np.ndarray))
+    symbol = _SetOnce("symbol", _UnitSymbol)
+    value = _SetOnce("value", (int, float, np.ndarray))
 
     @classmethod
     def create_unit(cls, **kwargs):
         return cls(**kwargs)
 
+    @classmethod
+    def _create_trusted(cls, value: int | float | np.ndarray, unit: _UnitType) -> Self:
+        """Internal class method to create a new _DimensionType object from the
+        result of an operation. The caller guarantees that `value` is a scalar or a
+        numeric `np.ndarray` (made `float64` unless memory-mapped) and that `unit`
+        is a unit of the class dimension; none of the checks of init are repeated.
+        """
+
+        self = object.__new__(cls)
+        self._value_slot = _trusted_value(value)
+        self._unit_type_slot = unit
+        self._dimension_slot = unit._dimension
+        self._unit_slot = unit._unit_name
+        self._symbol_slot = unit._unit_symbol
+        return self
+
     def __init__(
         self,
         unit: _UnitType,
-        value: int | float | abc.Sequence,
+        value: int | float | abc.Sequence | np.ndarray,
     ) -> None:
 
-        self.unit_type = unit
-        self.dimension = unit._dimension
-
-        if self._dimension != self.dimension:
+        if self._dimension != unit._dimension:
             raise exceptions.DimensionError(
                 f"{unit._unit_name} is not a unit of {self._dimension}"
             )
 
-        self.unit = unit._unit_name
-        self.symbol = unit._unit_symbol
+        if isinstance(value, (abc.Sequence, np.ndarray)):
+            value = _as_value_array(value)
 
-        if isinstance(value, abc.Sequence):
-            self.value = np.array([self.create_unit(unit=unit, value=i) for i in value])
-        elif isinstance(value, (int, float)):
-            self.value = value
+        self._set_once(
+            unit_type=unit,
+            dimension=unit._dimension,
+            unit=unit._unit_name,
+            symbol=unit._unit_symbol,
+            value=value,
+        )
 
     @property
     def __value_not_seq(self):
@@ -858,27 +1268,20 @@ class _DimensionType(_DimensionUnitBase):
 
     def __repr__(self):
 
-        return (
-            f"{self.value} {self.symbol}"
-            if self.__value_not_seq is True
-            else f"{self.value}"
-        )
-
-    def __str__(self):
+        return _format_quantity(self)
 
-        return (
-            f"{self.value} {self.symbol}"
-            if self.__value_not_seq is True
-            else f"{self.value}"
-        )
+    __str__ = __repr__
 
     def __len__(self):
 
-        return 1 if self.value is True else len(self.value)
+        return 1 if self.__value_not_seq is True else len(self.value)
 
     def __iter__(self):
         if self.__value_not_seq is False:
-            return iter(self.value)
+            # a 1-D value yields scalar quantities, higher dimensions yield
+            # quantity views of the rows
+            items = self.value.tolist() if self.value.ndim == 1 else self.value
+            return (self._create_trusted(i, self.unit_type) for i in items)
         else:
             return iter([self.value])
 
@@ -889,42 +1292,25 @@ class _DimensionType(_DimensionUnitBase):
         value = (
             round(self.value, y)
             if self.__value_not_seq is True
-            else [round(i, y).value for i in iter(self.value)]
+            else np.round(self.value, y)
         )
 
-        return self.create_unit(value=value, unit=self.unit_type)
+        return self._create_trusted(value, self.unit_type)
 
     def __mul__(self, x):
 
-        # multiplication of unit by a non-unit (scalar)
-        if isinstance(x, (int, float)) is True:
-
-            value = value = (
-                self.value * x
-                if self.__value_not_seq is True
-                else [(i.__mul__(x)).value for i in iter(self.value)]
-            )
-
-            return self.create_unit(unit=self.unit_type, value=value)
-
         # multiplication by a derived quantity
-        elif isinstance(x, DerivedQuantity) is True:
+        if isinstance(x, DerivedQuantity) is True:
 
-            value = (
-                self.value * x.value
-                if self.__value_not_seq is True
-                else [(i.value) * (x.value) for i in iter(self.value)]
-            )
             unit_definition = self.unit_type * x.unit_type
 
-            return DerivedQuantity(value=value, unit_definition=unit_definition)
+            return DerivedQuantity._create_trusted(
+                self.value * x.value, unit_definition
+            )
 
         elif isinstance(x, _DimensionType) is True:
             # multiplication by _DimensionType
 
-            # if self.unit_type._dimension == x.unit_type._dimension:
-            # they are of the same dimension, e.g. LENGTH * LENGTH
-
             # are they of the same dimension
             is_same_dimension = self.dimension == x.dimension
 
@@ -944,37 +1330,19 @@ class _DimensionType(_DimensionUnitBase):
                 else (x.value, x.unit_type)
             )
 
-            if self.__value_not_seq is True:
-                # self.value is an int | float
-                if isinstance(x.value, (int, float)):
-                    # x is an int or float
-                    value = self.value * equiv
-                else:
-                    # assumes that self.value is not a sequence
-                    value = [i.value * self.value for i in iter(equiv)]
-            else:
-                # self.value is a sequence
-                # assuming equiv is not an sequence which can be untrue
-                value = [i.value * equiv for i in iter(self.value)]
-
             unit_definition = self.unit_type * x_unit
-            return DerivedQuantity(value=value, unit_definition=unit_definition)
-
-    def __truediv__(self, x):
+            return DerivedQuantity._create_trusted(self.value * equiv, unit_definition)
 
-        # unit divided by a scalar return an instance of _DimensionType
-        if isinstance(x, (int, float)) is True:
-
-            value = (
-                self.value / x
-                if self.__value_not_seq is True
-                else [i.value / x for i in iter(self.value)]
-            )
+        # multiplication of unit by a non-unit (scalar or array)
+        operand = _as_operand(x)
+        if operand is None:
+            return NotImplemented
+        return self._create_trusted(self.value * operand, self.unit_type)
 
-            return self.create_unit(value=value, unit=self.unit_type)
+    def __truediv__(self, x):
 
         # unit divided by another unit (or same unit object)
-        elif isinstance(x, _DimensionType) is True:
+        if isinstance(x, _DimensionType) is True:
 
             # return dimensionless number (float) if they have the same dimension ( e.g. length/length)
             is_same_dimension = self.dimension == x.dimension
@@ -992,58 +1360,43 @@ class _DimensionType(_DimensionUnitBase):
                 else (x.value, x.unit_type)
             )
 
-            if self.__value_not_seq is True:
-                # self.value is int | float
-                if isinstance(x.value, (int, float)):
-                    value = self.value / x.value
-                else:
-                    value = [i.value / self.value for i in iter(equiv)]
-            else:
-                value = [i.value * equiv for i in iter(self.value)]
+            value = self.value / equiv
 
             if x_unit in (self.unit_type, None):
-                return value if isinstance(value, (int, float)) else np.array(value)
+                return value
             else:
-                return DerivedQuantity(
-                    value=value, unit_definition=self.unit_type / x_unit
-                )
+                return DerivedQuantity._create_trusted(value, self.unit_type / x_unit)
 
         elif isinstance(x, DerivedQuantity):
 
-            value = (
-                self.value / x.value
-                if self.__value_not_seq is True
-                else [i.value / x.value for i in iter(self.value)]
-            )
             unit_definition = self.unit_type / x.unit_type
 
-            return DerivedQuantity(value=value, unit_definition=unit_definition)
+            return DerivedQuantity._create_trusted(
+                self.value / x.value, unit_definition
+            )
+
+        # unit divided by a scalar (or array) return an instance of _DimensionType
+        operand = _as_operand(x)
+        if operand is None:
+            return NotImplemented
+        return self._create_trusted(self.value / operand, self.unit_type)
 
     def __rtruediv__(self, x):
 
         # scalar is divided by unit return an instance of derived quantity
-        if isinstance(x, (int, float)) is True:
-            value = (
-                x / self.value
-                if self.__value_not_seq is True
-                else [x / i.value for i in iter(self.value)]
-            )
-
-            return DerivedQuantity(value=value, unit_definition=x / self.unit_type)
+        operand = _as_operand(x)
+        if operand is None:
+            return NotImplemented
+        return DerivedQuantity._create_trusted(
+            operand / self.value, self.unit_type**-1
+        )
 
     def __pow__(self, x):
 
         if isinstance(x, (int, float)) is True:
-            value = (
-                self.value**x
-                if self.__value_not_seq is True
-                else [i.value**x for i in iter(self.value)]
-            )
             unit_definition = self.unit_type**x
 
-            return DerivedQuantity.create_unit(
-                value=value, unit_definition=unit_definition
-            )
+            return DerivedQuantity._create_trusted(self.value**x, unit_definition)
         else:
             raise exceptions.DimensionError(
                 f"cannot operate on {self.unit_type._dimension} and {type(x)}"
@@ -1065,28 +1418,22 @@ class _DimensionType(_DimensionUnitBase):
         _operator: Callable
             Operator representing operation to be performed
 
-        return: _DimensionType | bool | int | float
+        return: _DimensionType | bool | np.ndarray | int | float
         """
 
         if isinstance(x, _DimensionType) is True and self.dimension == x.dimension:
             # If its a fundamental quantity and they are of the same dimension
             # explicit is better than implicit afterall
-            if x.unit_type != self.unit_type:
-                _equivalent = x.convert_to(self.unit_type).value
-                value = _operator(self.value, _equivalent)
-                del _equivalent
-
-            elif x.unit_type == self.unit_type:
-                value = _operator(self.value, x.value)
+            # one side is converted once, as a whole buffer
+            self_value, x_value = _operand_values(
+                self, x, convert_smaller=_operator in _COMPARISON_OPERATORS
+            )
+            value = _operator(self_value, x_value)
 
-            if isinstance(value, np.ndarray) is True:
-                if value.dtype == bool:
-                    return value
-                else:
-                    value = [int(i) for i in iter(value)]
-                    return self.create_unit(value=value, unit=self.unit_type)
-            else:
+            if _is_bool_result(value) is True:
                 return value
+            else:
+                return self._create_trusted(value, self.unit_type)
 
         elif isinstance(x, (int, float)):
             value = _operator(self.value, x)
@@ -1097,7 +1444,7 @@ class _DimensionType(_DimensionUnitBase):
                 f"cannot operate on {self.dimension} and {x.unit_type._dimension} dimensions."
             )
 
-    def convert_to(self, _to) -> Self | None:
+    def convert_to(self, _to, out: np.ndarray = None) -> Self | None:
         """Converts from one unit to another, provided that there is a conversion standard
         defined for the units involved.
 
@@ -1105,120 +1452,22 @@ class _DimensionType(_DimensionUnitBase):
         ----------
         unit_type: _UnitType
             The _UnitType instance to be converted to.
+        out: np.ndarray
+            Optional `float64` buffer, of the same shape as the value, the converted
+            values are written into; no new buffer is allocated.
 
         return: _DimensionType object with the `unit_type` as the unit.
         """
 
-        if self._conversion_standards is None:
-            raise exceptions.ConversionError(
-                "this quantity has no conversion unit defined"
-            )
-
-        if isinstance(_to, _UnitType) is True:
-
-            new_value = object()
-            try:
-                if self.dimension != _to._dimension:
-                    raise exceptions.DimensionError(
-                        f"Cannot convert {self.dimension} dimension to {_to._dimension} dimension."
-                    )
-
-                elif self.dimension == _to._dimension:
-                    # check conversion table and do the needful
-                    _from, to, value = None, None, None
-
-                    # check if self a derived (quantity) unit
-                    base_unit = self.unit_type._base
-                    if base_unit is not None:
-                        base_unit = base_unit
-                    else:
-                        base_unit = self.unit_type
-
-                    # check if to is also a derived (quantity) unit
-                    to_base_unit = _to._base
-                    if to_base_unit is not None:
-                        to_base_unit = to_base_unit
-                    else:
-                        to_base_unit = _to
-
-                    # check if self is a multiple of other unit
-                    _order = self.unit_type._order
-                    if _order is None:
-                        _multiple = 1
-                    else:
-                        _multiple = _order.value
-
-                    # check if to is a multiple of other unit
-                    to_order = _to._order
-                    if to_order is None:
-                        to_multiple = 1
-                    else:
-                        to_multiple = to_order.value
-
-                    # converting between the same unit and multiple prefix
-                    if _to == self.unit_type:
-                        return self.create_unit(unit=self.unit_type, value=self.value)
-
-                    # converting between the same unit but different multiple prefix
-                    elif to_base_unit == base_unit:
-                        if self.__value_not_seq is True:
-                            value = (self.value * _multiple) / to_multiple
-                        else:
-                            value = [
-                                (i.value * _multiple) / to_multiple
-                                for i in iter(self.value)
-                            ]
-                        return self.create_unit(unit=base_unit, value=value)
-
-                    # conversion between different units with or without
-                    for _conv_std in self._conversion_standards.conversion_table:
-                        (_from, to), value = _conv_std
-
-                        if (base_unit, to_base_unit) == (
-                            _from,
-                            to,
-                        ):
-                            if self.__value_not_seq is True:
-                                new_value = (
-                                    value(x=(self.value * _multiple)) / to_multiple
-                                )
-                            else:
-                                new_value = [
-                                    value(x=(i.value * _multiple)) / to_multiple
-                                    for i in iter(self.value)
-                                ]
-
-                        elif (base_unit, to_base_unit) == (
-                            to,
-                            _from,
-                        ):
-                            if self.__value_not_seq is True:
-                                new_value = (
-                                    value(x=(_multiple * self.value), invert=True)
-                                    / to_multiple
-                                )
-                            else:
-                                new_value = [
-                                    value(x=(_multiple * i.value), invert=True)
-                                    / to_multiple
-                                    for i in iter(self.value)
-                                ]
-
-                        continue
-
-                    return self.create_unit(unit=_to, value=new_value)
-
-            except Exception as e:
-                raise exceptions.ConversionError(str(e))
-        else:
-            raise exceptions.ConversionError(
-                f"conversion can only be made to a valid unit type"
-            )
+        value = _unit_conversion(self, _to, out=out)
+        return self._create_trusted(value, _to)
 
 
 # ==========================================================================================
 # Length dimension class
 class Length(_DimensionType):
+    __slots__ = ()
+
     _conversion_standards = _LENGTH_CONVERSION_TABLE
     _dimension = LENGTH
     _base_unit_standard = METER
@@ -1230,6 +1479,8 @@ class Length(_DimensionType):
 # =========================================================================================
 # Mass dimension class
 class Mass(_DimensionType):
+    __slots__ = ()
+
     _conversion_standards = _MASS_CONVERSION_TABLE
     _dimension = MASS
     _base_unit_standard = GRAM
@@ -1241,6 +1492,8 @@ class Mass(_DimensionType):
 # ========================================================================================
 # Time dimension class
 class Time(_DimensionType):
+    __slots__ = ()
+
     _conversion_standards = _TIME_CONVERSION_TABLE
     _dimension = TIME
     _base_unit_standard = SECOND
@@ -1252,6 +1505,8 @@ class Time(_DimensionType):
 # ========================================================================================
 # Thermodynamic units
 class Temperature(_DimensionType):
+    __slots__ = ()
+
     _conversion_standards = _TEMPERATURE_CONVERSION_TABLE
     _dimension = THERMODYNAMIC_TEMPERATURE
     _base_unit_standard = KELVIN
@@ -1263,6 +1518,8 @@ class Temperature(_DimensionType):
 # ========================================================================================
 # Angle unit
 class Angle(_DimensionType):
+    __slots__ = ()
+
     _conversion_standards = _ANGLE_CONVERSION_TABLE
     _dimension = PLANE_ANGLE
 
@@ -1272,10 +1529,18 @@ class Angle(_DimensionType):
 
 # ====== Generic Unit Class========================================================
 class GenericUnit(_DimensionType):
+    __slots__ = ("_dimension",)
+
     def __init__(self, value, unit):
         self._dimension = unit._dimension
         super().__init__(unit=unit, value=value)
 
+    @classmethod
+    def _create_trusted(cls, value: int | float | np.ndarray, unit: _UnitType) -> Self:
+        self = super()._create_trusted(value, unit)
+        self._dimension = unit._dimension
+        return self
+
 
 # Solid Angle in steradian
 SolidAngle = functools.partial(GenericUnit, unit=STERADIAN)
@@ -1294,7 +1559,9 @@ LuminousIntensity = functools.partial(GenericUnit, CANDELA)
 # =========================================================================================
 # Force
 class Force(DerivedQuantity):
-    _conversion_standards = _FORCE_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_FORCE_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=FORCE)
@@ -1303,7 +1570,9 @@ class Force(DerivedQuantity):
 # ============================================================================================
 # Speed and Velocity
 class Speed(DerivedQuantity):
-    _conversion_standards = _SPEED_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_SPEED_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=SPEED)
@@ -1312,7 +1581,9 @@ class Speed(DerivedQuantity):
 # ============================================================================================
 # Pressure
 class Pressure(DerivedQuantity):
-    _conversion_standards = _PRESSURE_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_PRESSURE_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=PRESSURE)
@@ -1321,7 +1592,9 @@ class Pressure(DerivedQuantity):
 # ============================================================================================
 # Energy
 class Energy(DerivedQuantity):
-    _conversion_standards = _ENERGY_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_ENERGY_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=ENERGY)
@@ -1330,7 +1603,9 @@ class Energy(DerivedQuantity):
 # ============================================================================================
 # Density
 class Density(DerivedQuantity):
-    _conversion_standards = _DENSITY_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_DENSITY_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=DENSITY)
@@ -1339,7 +1614,9 @@ class Density(DerivedQuantity):
 # ============================================================================================
 # Power
 class Power(DerivedQuantity):
-    _conversion_standards = _POWER_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_POWER_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=POWER)
@@ -1348,7 +1625,9 @@ class Power(DerivedQuantity):
 # ============================================================================================
 # Radioactivity
 class Radioactivity(DerivedQuantity):
-    _conversion_standards = _RADIOACTIVITY_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_RADIOACTIVITY_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=RADIOACTIVITY)
@@ -1357,7 +1636,9 @@ class Radioactivity(DerivedQuantity):
 # ============================================================================================
 # Absorbeddose
 class AbsorbedDose(DerivedQuantity):
-    _conversion_standards = _ABSORBED_DOSE_CONVERSION_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_ABSORBED_DOSE_CONVERSION_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=ABSORBED_DOSE)
@@ -1366,7 +1647,9 @@ class AbsorbedDose(DerivedQuantity):
 # ============================================================================================
 # Dose Equivalent
 class DoseEquivalent(DerivedQuantity):
-    _conversion_standards = _DOSE_EQUIVALENT_TABLE
+    __slots__ = ()
+
+    _conversion_standards = _UnitFamilyTable("_DOSE_EQUIVALENT_TABLE")
 
     def __init__(self, value, unit_definition):
         super().__init__(value, unit_definition, quantity=DOSE_EQUIVALENT)
@@ -1374,6 +1657,8 @@ class DoseEquivalent(DerivedQuantity):
 
 # ======================Generic Unit 2 =======================================================
 class GenericUnit2(DerivedQuantity):
+    __slots__ = ()
+
     def __init__(self, value, unit_definition):
         super().__init__(
             unit_definition=unit_definition,
@@ -1382,29 +1667,31 @@ class GenericUnit2(DerivedQuantity):
         )
 
 
-# Voltage and Potential Difference
-Voltage = functools.partial(GenericUnit2, unit_definition=VOLT)
-
-# Capacitance
-Capacitance = functools.partial(GenericUnit2, unit_definition=FARAD)
-
-# Inductance
-Inductance = functools.partial(GenericUnit2, unit_definition=HENRY)
+# quantities of the table-less unit families, created with their unit family on
+# first access through the module `__getattr__`
+_GENERIC_UNIT2_QUANTITIES = {
+    "Voltage": "VOLT",
+    "Capacitance": "FARAD",
+    "Inductance": "HENRY",
+    "MagneticFlux": "WEBER",
+    "Resistance": "OHMS",
+    "Conductance": "SIEMENS",
+    "MageneticFieldStrength": "TESLA",
+    "Illuminance": "LUX",
+}
 
-# Magenetic Flux
-MagneticFlux = functools.partial(GenericUnit2, unit_definition=WEBER)
 
-# Resistance
-Resistance = functools.partial(GenericUnit2, unit_definition=OHMS)
+def __getattr__(name: str):
 
-# Conductance
-Conductance = functools.partial(GenericUnit2, unit_definition=SIEMENS)
+    unit_name = _GENERIC_UNIT2_QUANTITIES.get(name)
+    if unit_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Magentic Field Strength
-MageneticFieldStrength = functools.partial(GenericUnit2, unit_definition=TESLA)
-
-# Illuminance
-Illuminance = functools.partial(GenericUnit2, unit_definition=LUX)
+    unit_definition = getattr(units, unit_name)
+    quantity = globals()[name] = functools.partial(
+        GenericUnit2, unit_definition=unit_definition
+    )
+    return quantity
 
 
 class custom_unit(DerivedQuantity):
@@ -1479,3 +1766,370 @@ class custom_unit(DerivedQuantity):
         raise NotImplementedError(
             "custom_unit is an experimental feature and has not been completely implemented yet"
         )
+
+
+# ==========================================================================================
+# NumPy dispatch
+# Each ufunc maps to a dimension rule; a rule takes the ufunc operands and returns
+# the operand values to apply the ufunc to and the unit of the result (None when
+# the result is a plain number or array). Mixed units are converted once, as a
+# whole buffer, before the ufunc runs.
+
+# fundamental quantities are returned as their own class, everything else as
+# a DerivedQuantity
+_FUNDAMENTAL_QUANTITY_TYPES = {
+    LENGTH: Length,
+    MASS: Mass,
+    TIME: Time,
+    THERMODYNAMIC_TEMPERATURE: Temperature,
+    PLANE_ANGLE: Angle,
+}
+
+
+def _first_quantity(inputs) -> _DimensionUnitBase:
+    return next(x for x in inputs if isinstance(x, _DimensionUnitBase))
+
+
+def _same_unit_rule(inputs) -> tuple:
+    """Operands must share a dimension; they are converted to the unit of the first
+    quantity operand, e.g. `np.add`, `np.maximum`."""
+
+    first = _first_quantity(inputs)
+    unit_type = first.unit_type
+    values = []
+    for x in inputs:
+        if isinstance(x, _DimensionUnitBase) is False:
+            raise exceptions.DimensionError(
+                f"cannot operate on {unit_type._dimension} and {type(x)}"
+            )
+        elif x.unit_type._dimension != unit_type._dimension:
+            raise exceptions.DimensionError(
+                f"cannot operate on {unit_type._dimension} and {x.unit_type._dimension} dimensions."
+            )
+        elif x.unit_type is unit_type or x.unit_type == unit_type:
+            values.append(x.value)
+        else:
+            values.append(_unit_conversion(x, unit_type))
+
+    return tuple(values), unit_type
+
+
+def _comparison_rule(inputs) -> tuple:
+    """Comparisons convert the smaller operand (e.g. a scalar threshold) only."""
+
+    left, right = inputs
+    if (
+        isinstance(left, _DimensionUnitBase) is False
+        or isinstance(right, _DimensionUnitBase) is False
+        or left.unit_type._dimension != right.unit_type._dimension
+    ):
+        # raises the dimension error
+        return _same_unit_rule(inputs)
+    return _operand_values(left, right, convert_smaller=True), None
+
+
+def _unit_of(x) -> _UnitType | int:
+    return x.unit_type if isinstance(x, _DimensionUnitBase) else 1
+
+
+def _value_of(x):
+    return x.value if isinstance(x, _DimensionUnitBase) else x
+
+
+def _multiply_rule(inputs) -> tuple:
+    left, right = inputs
+    return (_value_of(left), _value_of(right)), _unit_of(left) * _unit_of(right)
+
+
+def _divide_rule(inputs) -> tuple:
+    left, right = inputs
+    right_unit = _unit_of(right)
+    unit_type = (
+        _unit_of(left) / right_unit
+        if isinstance(left, _DimensionUnitBase)
+        else right_unit**-1
+    )
+    return (_value_of(left), _value_of(right)), unit_type
+
+
+def _power_rule(inputs) -> tuple:
+    base, exponent = inputs
+    if isinstance(exponent, _DimensionUnitBase) is True or np.ndim(exponent) != 0:
+        raise exceptions.DimensionError(
+            f"a quantity can only be raised to a scalar power, not {type(exponent)}"
+        )
+    return (base.value, exponent), base.unit_type ** float(exponent)
+
+
+def _exponent_rule(exponent: int | float) -> Callable:
+    """Unary ufuncs equivalent to raising the unit to `exponent`, e.g. `np.sqrt`."""
+
+    def rule(inputs) -> tuple:
+        (x,) = inputs
+        return (x.value,), x.unit_type**exponent
+
+    return rule
+
+
+def _preserve_unit_rule(inputs) -> tuple:
+    (x,) = inputs
+    return (x.value,), x.unit_type
+
+
+def _strip_unit_rule(inputs) -> tuple:
+    return tuple(_value_of(x) for x in inputs), None
+
+
+def _angle_rule(inputs) -> tuple:
+    """Trigonometric ufuncs take an `Angle`, converted to radians once."""
+
+    (x,) = inputs
+    if x.unit_type._dimension != PLANE_ANGLE:
+        raise exceptions.DimensionError(
+            f"trigonometric functions require an Angle, not a quantity of {x.unit_type._dimension}"
+        )
+    value = x.value if x.unit_type is RADIAN else _unit_conversion(x, RADIAN)
+    return (value,), None
+
+
+def _arctan2_rule(inputs) -> tuple:
+    values, _ = _same_unit_rule(inputs)
+    return values, RADIAN
+
+
+_UFUNC_RULES = {
+    np.add: _same_unit_rule,
+    np.subtract: _same_unit_rule,
+    np.maximum: _same_unit_rule,
+    np.minimum: _same_unit_rule,
+    np.fmax: _same_unit_rule,
+    np.fmin: _same_unit_rule,
+    np.hypot: _same_unit_rule,
+    np.fmod: _same_unit_rule,
+    np.remainder: _same_unit_rule,
+    np.copysign: _same_unit_rule,
+    np.less: _comparison_rule,
+    np.less_equal: _comparison_rule,
+    np.greater: _comparison_rule,
+    np.greater_equal: _comparison_rule,
+    np.equal: _comparison_rule,
+    np.not_equal: _comparison_rule,
+    np.multiply: _multiply_rule,
+    np.divide: _divide_rule,
+    np.power: _power_rule,
+    np.sqrt: _exponent_rule(0.5),
+    np.cbrt: _exponent_rule(1 / 3),
+    np.square: _exponent_rule(2),
+    np.reciprocal: _exponent_rule(-1),
+    np.negative: _preserve_unit_rule,
+    np.positive: _preserve_unit_rule,
+    np.absolute: _preserve_unit_rule,
+    np.fabs: _preserve_unit_rule,
+    np.rint: _preserve_unit_rule,
+    np.floor: _preserve_unit_rule,
+    np.ceil: _preserve_unit_rule,
+    np.trunc: _preserve_unit_rule,
+    np.conjugate: _preserve_unit_rule,
+    np.sign: _strip_unit_rule,
+    np.signbit: _strip_unit_rule,
+    np.isnan: _strip_unit_rule,
+    np.isinf: _strip_unit_rule,
+    np.isfinite: _strip_unit_rule,
+    np.sin: _angle_rule,
+    np.cos: _angle_rule,
+    np.tan: _angle_rule,
+    np.arctan2: _arctan2_rule,
+}
+
+# ufuncs whose `reduce` and `accumulate` keep the unit of the operand
+_UNIT_PRESERVING_REDUCTIONS = frozenset(
+    (np.add, np.maximum, np.minimum, np.fmax, np.fmin)
+)
+
+
+def _as_quantity(value, unit_type: _UnitType | None, like: _DimensionUnitBase = None):
+    """Wraps the result of a ufunc into a quantity of `unit_type`, reusing the class of
+    `like` when the unit is unchanged. Boolean and dimensionless results are returned as is.
+    """
+
+    if (
+        unit_type is None
+        or _is_bool_result(value) is True
+        or unit_type._dimension.is_dimensionless is True
+    ):
+        return value
+
+    if isinstance(value, np.generic) is True:
+        value = value.item()
+
+    if like is not None and like.unit_type is unit_type:
+        if isinstance(like, DerivedQuantity) is True:
+            return type(like)._create_trusted(value, unit_type, like.quantity)
+        return type(like)._create_trusted(value, unit_type)
+
+    quantity_type = _FUNDAMENTAL_QUANTITY_TYPES.get(unit_type._dimension)
+    if quantity_type is not None:
+        return quantity_type._create_trusted(value, unit_type)
+    return DerivedQuantity._create_trusted(value, unit_type)
+
+
+def _apply_ufunc(ufunc: np.ufunc, method: str, inputs: tuple, kwargs: dict):
+    """Implements `_DimensionUnitBase.__array_ufunc__`."""
+
+    out = kwargs.get("out", ())
+    if any(isinstance(x, _DimensionUnitBase) for x in out) is True:
+        # writing into the buffer of a quantity could silently change its unit
+        return NotImplemented
+
+    if method == "__call__":
+        rule = _UFUNC_RULES.get(ufunc)
+        if rule is None:
+            return NotImplemented
+        values, unit_type = rule(inputs)
+        like = _first_quantity(inputs)
+
+    elif method in ("reduce", "accumulate") and ufunc in _UNIT_PRESERVING_REDUCTIONS:
+        like = inputs[0]
+        values, unit_type = (like.value,), like.unit_type
+
+    else:
+        return NotImplemented
+
+    result = getattr(ufunc, method)(*values, **kwargs)
+
+    if ufunc.nout > 1:
+        return tuple(_as_quantity(r, unit_type, like) for r in result)
+    return _as_quantity(result, unit_type, like)
+
+
+# NumPy functions (`__array_function__`) with a unit aware implementation
+_HANDLED_FUNCTIONS = {}
+
+
+def _implements(np_function: Callable) -> Callable:
+    """Registers a unit aware implementation of a NumPy function."""
+
+    def decorator(func: Callable) -> Callable:
+        _HANDLED_FUNCTIONS[np_function] = func
+        return func
+
+    return decorator
+
+
+@_implements(np.round)
+@_implements(np.around)
+def _round(x: _DimensionUnitBase, decimals: int = 0, out=None):
+    if out is not None:
+        return NotImplemented
+    return round(x, decimals)
+
+
+@_implements(np.isclose)
+def _isclose(a, b, rtol: float = 1e-05, atol: float = 1e-08, equal_nan: bool = False):
+    # `atol` is in the unit of `a`
+    (a_value, b_value), _ = _same_unit_rule((a, b))
+    return np.isclose(a_value, b_value, rtol=rtol, atol=atol, equal_nan=equal_nan)
+
+
+@_implements(np.allclose)
+def _allclose(a, b, rtol: float = 1e-05, atol: float = 1e-08, equal_nan: bool = False):
+    return bool(np.all(_isclose(a, b, rtol=rtol, atol=atol, equal_nan=equal_nan)))
+
+
+def _unit_preserving(np_function: Callable) -> Callable:
+    """NumPy function applied to the values of `a`, the result keeps the unit of `a`."""
+
+    method = _MAPPED_METHODS.get(np_function)
+
+    def implementation(a: _DimensionUnitBase, *args, **kwargs):
+        if isinstance(a.value, np.memmap) is True:
+            if method is not None:
+                # memory-mapped values are streamed by the methods
+                return getattr(a, method)(*args, **kwargs)
+            if np_function in _ORDER_STATISTICS:
+                _reject_mapped(a.value, np_function.__name__)
+        return _as_quantity(np_function(a.value, *args, **kwargs), a.unit_type, a)
+
+    return implementation
+
+
+# reductions of the numpy functions that stream memory-mapped values in chunks
+_MAPPED_METHODS = {
+    np.sum: "sum",
+    np.mean: "mean",
+    np.min: "min",
+    np.max: "max",
+    np.amin: "min",
+    np.amax: "max",
+    np.cumsum: "cumsum",
+    np.std: "std",
+}
+_ORDER_STATISTICS = frozenset(
+    (np.median, np.percentile, np.nanmedian, np.nanpercentile)
+)
+
+
+for _np_function in (
+    np.sum,
+    np.mean,
+    np.min,
+    np.max,
+    np.amin,
+    np.amax,
+    np.cumsum,
+    np.median,
+    np.percentile,
+    np.std,
+    np.nansum,
+    np.nanmean,
+    np.nanmin,
+    np.nanmax,
+    np.nancumsum,
+    np.nanmedian,
+    np.nanpercentile,
+    np.nanstd,
+):
+    _implements(_np_function)(_unit_preserving(_np_function))
+
+
+for _np_function in (np.reshape, np.transpose, np.squeeze, np.broadcast_to, np.ravel):
+    _implements(_np_function)(_unit_preserving(_np_function))
+
+
+def _joined(np_function: Callable) -> Callable:
+    """NumPy function joining a sequence of quantities, converted once to the unit of
+    the first one, e.g. `np.concatenate`."""
+
+    def implementation(arrays, *args, **kwargs):
+        values, unit_type = _same_unit_rule(tuple(arrays))
+        return _as_quantity(
+            np_function(values, *args, **kwargs), unit_type, arrays[0]
+        )
+
+    return implementation
+
+
+for _np_function in (np.concatenate, np.stack, np.vstack, np.hstack):
+    _implements(_np_function)(_joined(_np_function))
+
+
+@_implements(np.where)
+def _where(condition, x=None, y=None):
+    # `x` and `y` are quantities of the same dimension, `y` is converted to `x`'s unit
+    (x_value, y_value), unit_type = _same_unit_rule((x, y))
+    return _as_quantity(np.where(condition, x_value, y_value), unit_type, x)
+
+
+@_implements(np.clip)
+def _clip(a, a_min=None, a_max=None, out=None, **kwargs):
+    if out is not None:
+        return NotImplemented
+
+    a_min = kwargs.pop("min", a_min)
+    a_max = kwargs.pop("max", a_max)
+    bounds = tuple(bound for bound in (a_min, a_max) if bound is not None)
+    (value, *bound_values), unit_type = _same_unit_rule((a, *bounds))
+    bound_values = iter(bound_values)
+    low = None if a_min is None else next(bound_values)
+    high = None if a_max is None else next(bound_values)
+    return _as_quantity(np.clip(value, low, high), unit_type, a)
@@ -43,3 +43,15 @@ class OperationNotAvailable(Exception):
     """Operation is not available in this version"""
 
     pass
+
+
+class SnapshotError(Exception):
+    """Base class for registry snapshot errors"""
+
+    pass
+
+
+class UnitParseError(ValueError):
+    """Base class for unit expression parsing errors"""
+
+    pass
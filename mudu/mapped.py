@@ -0,0 +1,241 @@
+"""
+=========================
+mudu.mapped
+=========================
+
+mudu module, memory-mapped (out-of-core) quantity arrays.
+
+A raw binary file of native `float32` or `float64` values is opened as a quantity
+(`Length`, `Pressure`, `Speed`, ...) whose value is an `np.memmap`; nothing is read
+until it is used. Slices and views (`reshape`, `T`) of a memory-mapped quantity stay
+mapped in the dtype of the file, while arithmetic results are `float64` arrays.
+Conversions (`convert_to`) and the reductions `sum`, `mean`, `min`, `max`, `std` and
+`cumsum` (along any axis) stream through the mapped pages in chunks; `percentile` and
+`median`, which need the whole value in memory, raise `OperationNotAvailable`.
+
+The unit, dtype, shape and offset of a file are either given by the caller or read
+from a small JSON sidecar header stored next to it, `<path>.mudu.json`. The header
+refers to the unit by its name in `mudu.units`, or by its prefix and base unit, its
+factors, or (for a user defined unit, which must be registered again before the file
+is reopened) its name, symbol and dimension.
+
+For more information, read the documenation using
+
+.. code-block:: shell
+    mudu --doc
+
+in your cli
+
+"""
+
+import fractions
+import json
+import os
+
+import numpy as np
+
+from .base import _UnitType
+from . import base, units
+from .dimensions import _DimensionUnitBase, DerivedQuantity
+
+HEADER_SUFFIX = ".mudu.json"
+
+
+def _header_path(path: str | os.PathLike) -> str:
+    return os.fspath(path) + HEADER_SUFFIX
+
+
+def _unit_reference(unit: _UnitType) -> str | dict:
+    """JSON reference of `unit` for the header: its name in `mudu.units`, its prefix
+    and base unit, its factors, or (for a user defined unit) its name, symbol and
+    dimension."""
+
+    units._load_all_families()
+    for name, value in vars(units).items():
+        if value is unit:
+            return name
+
+    if unit._factors is not None:
+        return {
+            "factors": [
+                [_unit_reference(factor), str(exponent)]
+                for factor, exponent in unit._factors
+            ]
+        }
+
+    if unit._order is not None:
+        for name, value in vars(base).items():
+            if value is unit._order:
+                return {"order": name, "base": _unit_reference(unit._base)}
+        raise ValueError(f"the prefix of {unit._unit_name!r} is not a mudu prefix")
+
+    return {
+        "name": unit._unit_name,
+        "symbol": str(unit._unit_symbol),
+        "dimension": [str(exponent) for exponent in unit._dimension],
+    }
+
+
+def _exponent(text: str) -> int | fractions.Fraction:
+    return base._as_exponent(fractions.Fraction(text))
+
+
+def _resolve_reference(reference: str | dict) -> _UnitType:
+    """The unit of a reference written by `_unit_reference`."""
+
+    if isinstance(reference, str) is True:
+        unit = getattr(units, reference, None)
+        if isinstance(unit, _UnitType) is False:
+            raise ValueError(f"unknown unit {reference!r} in header")
+        return unit
+
+    if "factors" in reference:
+        return base._intern_unit(
+            tuple(
+                (_resolve_reference(factor), _exponent(exponent))
+                for factor, exponent in reference["factors"]
+            )
+        )
+
+    if "order" in reference:
+        order = getattr(base, reference["order"], None)
+        if isinstance(order, base._OrderType) is False:
+            raise ValueError(f"unknown prefix {reference['order']!r} in header")
+        return base.OrderUnit(order, _resolve_reference(reference["base"]))
+
+    # a user defined unit, found among the units registered in the conversion tables
+    dimension = tuple(_exponent(exponent) for exponent in reference["dimension"])
+    units._load_all_families()
+    for conversion_standards in units._CONVERSION_TABLES:
+        for unit in conversion_standards.units():
+            if (
+                unit._unit_name == reference["name"]
+                and str(unit._unit_symbol) == reference["symbol"]
+                and tuple(unit._dimension) == dimension
+            ):
+                return unit
+    raise ValueError(
+        f"unit {reference['name']!r} in header is not registered, extend its "
+        "conversion table first or pass `unit`"
+    )
+
+
+def write_header(
+    path: str | os.PathLike,
+    unit: _UnitType,
+    dtype=np.float64,
+    shape: tuple | None = None,
+    offset: int = 0,
+) -> None:
+    """Writes the sidecar header of the binary file at `path`.
+
+    Parameters
+    ----------
+    path: str | os.PathLike
+        Path of the binary file (not of the header).
+    unit: _UnitType
+        Unit of the values stored in the file.
+    dtype: np.dtype
+        Native type of the stored values, `float32` or `float64`.
+    shape: tuple | None
+        Shape of the stored array, None for a flat array spanning the whole file.
+    offset: int
+        Offset in bytes of the first value in the file.
+    """
+
+    header = {
+        "unit": _unit_reference(unit),
+        "dtype": np.dtype(dtype).str,
+        "shape": None if shape is None else list(shape),
+        "offset": offset,
+    }
+    with open(_header_path(path), "w") as file:
+        json.dump(header, file)
+
+
+def read_header(path: str | os.PathLike) -> dict:
+    """Reads the sidecar header of the binary file at `path`.
+
+    return: dict with the `unit` (_UnitType), `dtype`, `shape` and `offset` of the file.
+    """
+
+    with open(_header_path(path)) as file:
+        header = json.load(file)
+
+    return {
+        "unit": _resolve_reference(header["unit"]),
+        "dtype": np.dtype(header["dtype"]),
+        "shape": None if header["shape"] is None else tuple(header["shape"]),
+        "offset": header["offset"],
+    }
+
+
+def _wrap(quantity_type: type, mapped: np.memmap, unit: _UnitType) -> _DimensionUnitBase:
+    # a scalar prototype runs the unit validation of the public constructor,
+    # the mapped buffer itself is then wrapped as is (it may be `float32`)
+    prototype = quantity_type(0.0, unit)
+    if isinstance(prototype, DerivedQuantity) is True:
+        return type(prototype)._create_trusted(mapped, unit, prototype.quantity)
+    return type(prototype)._create_trusted(mapped, unit)
+
+
+def open_mapped(
+    path: str | os.PathLike,
+    quantity_type: type,
+    unit: _UnitType = None,
+    dtype=None,
+    shape: tuple | None = None,
+    offset: int | None = None,
+    mode: str = "r",
+) -> _DimensionUnitBase:
+    """Opens the binary file at `path` as a memory-mapped quantity.
+
+    Parameters
+    ----------
+    path: str | os.PathLike
+        Path of the binary file.
+    quantity_type: type
+        The quantity class, e.g. `Length` or `Pressure`.
+    unit: _UnitType
+        Unit of the stored values, read from the sidecar header when not given.
+    dtype, shape, offset:
+        Layout of the file, read from the sidecar header (if any) when not given;
+        defaults to a flat `float64` array spanning the whole file.
+    mode: str
+        `np.memmap` mode, "r" (read only), "r+" (read and write) or "c" (copy on write).
+
+    return: a quantity of `quantity_type` whose value is an `np.memmap`.
+    """
+
+    header = {}
+    missing = any(x is None for x in (unit, dtype, shape, offset))
+    if missing is True and os.path.exists(_header_path(path)):
+        header = read_header(path)
+    if unit is None and "unit" not in header:
+        raise ValueError(f"no unit given and no header found for {path}")
+    # only the layout that is not given is taken from the header
+    unit = header["unit"] if unit is None else unit
+    dtype = header.get("dtype", np.float64) if dtype is None else dtype
+    shape = header.get("shape") if shape is None else shape
+    offset = header.get("offset", 0) if offset is None else offset
+
+    mapped = np.memmap(path, dtype=dtype, mode=mode, shape=shape, offset=offset)
+    return _wrap(quantity_type, mapped, unit)
+
+
+def create_mapped(
+    path: str | os.PathLike,
+    quantity_type: type,
+    shape: int | tuple,
+    unit: _UnitType,
+    dtype=np.float64,
+) -> _DimensionUnitBase:
+    """Creates (or overwrites) the binary file at `path` and its sidecar header, and
+    opens it as a writable memory-mapped quantity. Its `value` can be passed as the
+    `out` buffer of `convert_to` to convert a mapped quantity from file to file.
+    """
+
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    mapped = np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+    write_header(path, unit, dtype=dtype, shape=shape)
+    return _wrap(quantity_type, mapped, unit)
@@ -0,0 +1,260 @@
+"""
+=========================
+mudu.parsing
+=========================
+
+mudu module, parsing of unit expressions.
+
+`parse_unit` resolves a unit expression such as `"kN*m/s^2"` into a `_UnitType`.
+The expression is made of:
+
+- unit symbols and names (`_unit_symbol`, `_unit_name`), e.g. `m`, `meter`, `lbf`;
+- SI prefixes (`GIGA` ... `ATTO`) before a symbol or a name, e.g. `kN`, `kilonewton`;
+- `*`, `/`, `^` or `**` and parentheses, e.g. `kg/(m*s^2)`, `m^(1/2)`, `1/s`.
+
+Products, quotients and powers are computed with unit algebra, so the result is the
+canonical (interned) unit of the expression. Results are memoized in an LRU keyed by
+the raw string: resolving a string seen before is a dictionary lookup. So are the
+errors of strings that fail to parse, until a conversion table is extended.
+
+- **Usage example**
+
+    .. code-block:: python
+
+        from mudu import Force, parse_unit
+
+        force = Force(12, parse_unit("kN"))
+        torque_unit = parse_unit("kN*m")
+
+For more information, read the documenation using
+
+.. code-block:: shell
+    mudu --doc
+
+in your cli
+
+"""
+
+import re
+
+from . import base, units, exceptions
+from .base import _OrderType, _UnitType, _UnitAlgebraCache, OrderUnit
+
+# raw string -> unit, least recently used dropped first
+_PARSED_UNITS = _UnitAlgebraCache(maxsize=4096)
+
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<operator>\*\*|[*/^()·-])"
+    r"|(?P<number>\d+(?:\.\d+)?)"
+    r"|(?P<name>[^\W\d]\w*)"
+    r")"
+)
+
+# (text, generation of the tables) -> message of the `UnitParseError` it raised
+_FAILED_PARSES = _UnitAlgebraCache(maxsize=4096)
+
+# (generation, symbol or name -> unit, prefixes with the longest first), built on
+# first use and replaced as a whole when the conversion tables change
+_TABLES = None
+
+
+def _build_tables() -> tuple:
+    global _TABLES
+
+    generation = base._TABLES_GENERATION
+    units._load_all_families()
+    found = [value for value in vars(units).values() if isinstance(value, _UnitType)]
+    for conversion_standards in units._CONVERSION_TABLES:
+        # user defined units registered with `extend`
+        found.extend(conversion_standards.units())
+
+    known = {}
+    for unit in found:
+        if unit._factors is None:
+            # the first unit defined with a symbol (or name) keeps it
+            known.setdefault(str(unit._unit_symbol), unit)
+            known.setdefault(unit._unit_name, unit)
+
+    prefixes = []
+    for order in vars(base).values():
+        if isinstance(order, _OrderType) is True:
+            prefixes += [(order.name, order), (order.symbol, order)]
+    prefixes += [("µ", base.MICRO), ("μ", base.MICRO)]
+    prefixes.sort(key=lambda prefix: -len(prefix[0]))
+
+    # swapped in at once, a concurrent parse keeps the tables it started with
+    _TABLES = (generation, known, tuple(prefixes))
+    return _TABLES
+
+
+def _current_tables() -> tuple:
+    tables = _TABLES
+    if tables is None or tables[0] != base._TABLES_GENERATION:
+        tables = _build_tables()
+    return tables
+
+
+def _resolve_name(name: str, known: dict, prefixes: tuple) -> _UnitType | None:
+
+    unit = known.get(name)
+    if unit is not None:
+        return unit
+
+    for prefix, order in prefixes:
+        if name.startswith(prefix) is True and len(name) > len(prefix):
+            unit = known.get(name[len(prefix) :])
+            if unit is not None and unit._order is None:
+                return OrderUnit(order, unit)
+    return None
+
+
+class _UnitParser:
+    """Internal recursive descent parser of a unit expression.
+
+    expression := term (("*" | "·" | "/") term)*
+    term := factor (("^" | "**") exponent)?
+    factor := name | "1" | "(" expression ")"
+    exponent := ["-"] number | "(" ["-"] number ["/" number] ")"
+    """
+
+    def __init__(self, text: str, known: dict, prefixes: tuple) -> None:
+        self.text = text
+        self.known, self.prefixes = known, prefixes
+        self.tokens = self._tokenize(text)
+        self.position = 0
+
+    def _tokenize(self, text: str) -> list:
+
+        tokens, position, text = [], 0, text.rstrip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None:
+                raise exceptions.UnitParseError(
+                    f"unexpected character {text[position:].lstrip()[0]!r} in {text!r}"
+                )
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        return tokens
+
+    def _peek(self) -> tuple:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def _next(self) -> tuple:
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _expect(self, value: str) -> None:
+        if self._next()[1] != value:
+            raise exceptions.UnitParseError(f"expected {value!r} in {self.text!r}")
+
+    def parse(self) -> _UnitType:
+
+        unit = self._expression()
+        if self.position != len(self.tokens):
+            raise exceptions.UnitParseError(
+                f"unexpected {self._peek()[1]!r} in {self.text!r}"
+            )
+        return unit
+
+    def _expression(self):
+
+        unit = self._term()
+        while self._peek()[1] in ("*", "·", "/"):
+            operator = self._next()[1]
+            if operator == "/":
+                unit = unit / self._term()
+            else:
+                unit = unit * self._term()
+        return unit
+
+    def _term(self):
+
+        unit = self._factor()
+        if self._peek()[1] in ("^", "**"):
+            self._next()
+            exponent = self._exponent()
+            if isinstance(unit, _UnitType) is False:
+                raise exceptions.UnitParseError(
+                    f"cannot raise 1 to a power in {self.text!r}"
+                )
+            unit = unit**exponent
+        return unit
+
+    def _factor(self):
+
+        kind, value = self._next()
+        if kind == "name":
+            unit = _resolve_name(value, self.known, self.prefixes)
+            if unit is None:
+                raise exceptions.UnitParseError(
+                    f"unknown unit {value!r} in {self.text!r}"
+                )
+            return unit
+        if kind == "number" and value == "1":
+            return 1
+        if value == "(":
+            unit = self._expression()
+            self._expect(")")
+            return unit
+        raise exceptions.UnitParseError(f"expected a unit in {self.text!r}")
+
+    def _number(self) -> int | float:
+
+        sign = -1 if self._peek()[1] == "-" else 1
+        if sign == -1:
+            self._next()
+        kind, value = self._next()
+        if kind != "number":
+            raise exceptions.UnitParseError(f"expected an exponent in {self.text!r}")
+        return sign * (float(value) if "." in value else int(value))
+
+    def _exponent(self) -> int | float:
+
+        if self._peek()[1] != "(":
+            return self._number()
+
+        self._next()
+        exponent = self._number()
+        if self._peek()[1] == "/":
+            self._next()
+            exponent = exponent / self._number()
+        self._expect(")")
+        return exponent
+
+
+def parse_unit(text: str) -> _UnitType:
+    """Resolves a unit expression, e.g. `"kN*m/s^2"`, into its canonical `_UnitType`.
+
+    A string that is exactly the symbol or name of a unit, such as `"m/s"` or
+    `"lb/ft2"`, is that unit. Unknown units and malformed expressions raise
+    `exceptions.UnitParseError`.
+
+    return: _UnitType
+    """
+
+    unit = _PARSED_UNITS.get(text)
+    if unit is not None:
+        return unit
+
+    generation, known, prefixes = _current_tables()
+    failure = _FAILED_PARSES.get((text, generation))
+    if failure is not None:
+        raise exceptions.UnitParseError(failure)
+
+    try:
+        unit = known.get(text.strip())
+        if unit is None:
+            unit = _UnitParser(text, known, prefixes).parse()
+        if isinstance(unit, _UnitType) is False:
+            raise exceptions.UnitParseError(f"{text!r} is not a unit")
+    except exceptions.UnitParseError as error:
+        # until a conversion table changes, the same string fails the same way
+        _FAILED_PARSES.put((text, generation), (), str(error))
+        raise
+
+    _PARSED_UNITS.put(text, (), unit)
+    return unit
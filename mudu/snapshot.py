@@ -0,0 +1,396 @@
+"""
+=========================
+mudu.snapshot
+=========================
+
+mudu module, on-disk snapshots of the unit registry.
+
+A snapshot freezes the state of the unit registry that a process has built up into
+one compact binary file: the standards added to the conversion tables by
+`_ConversionTableType.extend`, the conversions resolved so far, the units interned
+by unit algebra and `OrderUnit`, the unit algebra memo and the reference (base
+unit) scales computed so far. Only the unit families loaded when it is saved are
+stored, and loading it (after checking that it was written by the installed mudu
+version) does not load any: the state of a family is restored when the family is
+first used.
+
+Units of `mudu.units`, multiple prefixes and interned units are stored by reference
+and resolved on load, so they keep their identity; user defined units are stored
+once by value and returned by `load_snapshot`.
+
+**NOTE** A snapshot is a pickle, only load snapshots you wrote yourself.
+
+- **Usage example**
+
+    .. code-block:: python
+
+        from mudu.snapshot import save_snapshot, load_snapshot
+
+        # once, after the custom units are registered
+        save_snapshot("registry.mudu")
+
+        # on every (worker) start
+        custom_units = load_snapshot("registry.mudu")
+        ME_UNIT = custom_units["me_unit"]
+
+For more information, read the documenation using
+
+.. code-block:: shell
+    mudu --doc
+
+in your cli
+
+"""
+
+import io
+import os
+import pickle
+from collections import abc
+
+from . import base, units, dimensions, exceptions, __version__
+from .base import _OrderType, _UnitType, _ConversionTableType, OrderUnit
+
+MAGIC = b"MUDUSNAP"
+# version of the layout of the snapshot, independent of the mudu version
+FORMAT = 2
+
+# raised by pickle for e.g. a lambda or a local function
+_PICKLING_ERRORS = (pickle.PicklingError, AttributeError, TypeError)
+
+# (unit families, pickled records, user defined units) of the loaded snapshots whose
+# unit families are not loaded yet, restored when they are
+_pending = []
+# the interned units restored by `load_snapshot`, which the unit registry only holds
+# weakly
+_restored_units = []
+
+
+def _module_objects(module, kind: type) -> dict:
+    """`id(object) -> name` of the module level objects of type `kind`."""
+
+    return {
+        id(value): name
+        for name, value in vars(module).items()
+        if isinstance(value, kind) is True
+    }
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Stores units of `mudu.units`, multiple prefixes, interned and multiple prefix
+    units and conversion tables by reference, and user defined units by their
+    position in `custom_units` (by value when it is None). The unit families of the
+    references are collected in `families`."""
+
+    def __init__(self, file, custom_units: list | None) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.unit_names = _module_objects(units, _UnitType)
+        self.table_names = _module_objects(units, _ConversionTableType)
+        self.order_names = _module_objects(base, _OrderType)
+        self.custom_units = custom_units
+        if custom_units is not None:
+            self.custom_index = {id(unit): i for i, unit in enumerate(custom_units)}
+        self.families = set()
+
+    def _refer(self, name: str) -> None:
+        loader = units._LAZY_UNITS.get(name)
+        if loader is not None:
+            self.families.add(loader.names[0])
+
+    def persistent_id(self, obj):
+
+        if isinstance(obj, _UnitType) is True:
+            name = self.unit_names.get(id(obj))
+            if name is not None:
+                self._refer(name)
+                return ("unit", name, obj._reference_scale)
+            if obj._factors is not None:
+                return (
+                    "composite",
+                    obj._factors,
+                    obj._dimension,
+                    obj._unit_symbol,
+                    obj._reference_scale,
+                )
+            if obj._order is not None and OrderUnit._units.get(
+                (id(obj._order), id(obj._base))
+            ) is obj:
+                return ("order_unit", obj._order, obj._base, obj._reference_scale)
+            if self.custom_units is not None:
+                index = self.custom_index.get(id(obj))
+                if index is None:
+                    index = self.custom_index[id(obj)] = len(self.custom_units)
+                    self.custom_units.append(obj)
+                return ("custom", index)
+
+        elif isinstance(obj, _OrderType) is True:
+            name = self.order_names.get(id(obj))
+            if name is not None:
+                return ("order", name)
+
+        elif isinstance(obj, _ConversionTableType) is True:
+            name = self.table_names.get(id(obj))
+            if name is not None:
+                self._refer(name)
+                return ("table", name)
+
+        return None
+
+
+def _with_scale(unit: _UnitType, scale: float | None) -> _UnitType:
+    if unit._reference_scale is None and scale is not None:
+        unit._reference_scale = scale
+    return unit
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Resolves the references written by `_SnapshotPickler`."""
+
+    def __init__(self, file, custom_units: list = ()) -> None:
+        super().__init__(file)
+        self.custom_units = custom_units
+
+    def persistent_load(self, pid):
+
+        kind = pid[0]
+        if kind == "unit":
+            return _with_scale(getattr(units, pid[1]), pid[2])
+
+        if kind == "composite":
+            _, factors, dimension, symbol, scale = pid
+            return _with_scale(_intern(factors, dimension, symbol), scale)
+
+        if kind == "order_unit":
+            return _with_scale(OrderUnit(pid[1], pid[2]), pid[3])
+
+        if kind == "custom":
+            return self.custom_units[pid[1]]
+
+        if kind == "order":
+            return getattr(base, pid[1])
+
+        if kind == "table":
+            return getattr(units, pid[1])
+
+        raise pickle.UnpicklingError(f"unknown snapshot reference {kind!r}")
+
+
+def _intern(factors: tuple, dimension, symbol) -> _UnitType:
+    """The interned unit of `factors`, created from its stored dimension and symbol
+    (rather than recombined) if it is not interned yet."""
+
+    key = tuple(sorted((id(unit), exponent) for unit, exponent in factors))
+    unit = base._UNIT_REGISTRY.get(key)
+    if unit is None:
+        unit = _UnitType.create_unit(
+            _dimension=dimension,
+            _unit_name=base.GENERIC_DIMENSION,
+            _unit_symbol=symbol,
+            _factors=factors,
+        )
+        base._UNIT_REGISTRY[key] = unit
+    return unit
+
+
+def _pickling_failure(error: Exception) -> str:
+    """Message naming the conversion standard that cannot be pickled, typically one
+    whose converter is a lambda."""
+
+    for conversion_standards in units._CONVERSION_TABLES:
+        for (unit, to_unit), converter in conversion_standards.conversion_table:
+            try:
+                _SnapshotPickler(io.BytesIO(), None).dump(converter)
+            except _PICKLING_ERRORS:
+                return (
+                    f"the conversion standard from {unit._unit_name} to "
+                    f"{to_unit._unit_name} cannot be stored in a snapshot ({error}), "
+                    "define its converter with `_ConverterType` or a module level "
+                    "function"
+                )
+    return f"the unit registry cannot be stored in a snapshot ({error})"
+
+
+def _records() -> list:
+    """The state of the unit registry in use, as records restored by `_restore`.
+    The standards added with `extend` come first, as they reset resolved
+    conversions."""
+
+    records = [
+        ("standard", conversion_standards, seq)
+        for conversion_standards in units._CONVERSION_TABLES
+        for seq in conversion_standards._extensions
+    ]
+    records += [
+        ("resolved", conversion_standards, resolved)
+        for conversion_standards in units._CONVERSION_TABLES
+        for resolved in conversion_standards._resolved.values()
+    ]
+    records += [
+        ("algebra", key[0], operands, key[3], result)
+        for key, (operands, result) in base._UNIT_ALGEBRA_CACHE._entries.items()
+    ]
+    records += [
+        ("decomposed", operands, result)
+        for key, (operands, result) in (
+            dimensions._DECOMPOSED_CONVERSIONS._entries.items()
+        )
+        if key[2] == base._TABLES_GENERATION
+    ]
+    interned = (*base._UNIT_REGISTRY.values(), *OrderUnit._units.values())
+    records += [("interned", unit) for unit in interned]
+    return records
+
+
+def _restore(record: tuple) -> None:
+
+    kind = record[0]
+    if kind == "standard":
+        _, conversion_standards, seq = record
+        units_pair = tuple(seq[0])
+        # the standard may have been added again before the snapshot was loaded
+        if all(
+            tuple(standard[0]) != units_pair
+            for standard in conversion_standards.conversion_table
+        ):
+            conversion_standards.extend(seq)
+
+    elif kind == "resolved":
+        _, conversion_standards, (unit, to_unit, converter, hops) = record
+        conversion_standards._resolved[(id(unit), id(to_unit))] = (
+            unit,
+            to_unit,
+            converter,
+            hops,
+        )
+
+    elif kind == "algebra":
+        _, _operator, (left, right), exponent, result = record
+        base._UNIT_ALGEBRA_CACHE.put(
+            (_operator, id(left), id(right), exponent), (left, right), result
+        )
+
+    elif kind == "decomposed":
+        _, (unit, to_unit), converter = record
+        dimensions._DECOMPOSED_CONVERSIONS.put(
+            (id(unit), id(to_unit), base._TABLES_GENERATION),
+            (unit, to_unit),
+            converter,
+        )
+
+    elif kind == "interned":
+        _restored_units.append(record[1])
+
+
+def _restore_pending() -> None:
+    """Restores the records of the loaded snapshots whose unit families are loaded,
+    called by `mudu.units` after a unit family is loaded."""
+
+    loaded = vars(units)
+    ready, waiting = [], []
+    for group in _pending:
+        families = group[0]
+        (ready if all(f in loaded for f in families) else waiting).append(group)
+    if not ready:
+        return
+
+    _pending[:] = waiting
+    for _families, data, custom_units in ready:
+        for record in _SnapshotUnpickler(io.BytesIO(data), custom_units).load():
+            _restore(record)
+
+
+def save_snapshot(
+    path: str | os.PathLike, extra_units: abc.Iterable[_UnitType] = ()
+) -> None:
+    """Freezes the state of the unit registry in use into a snapshot file at `path`.
+
+    Only the unit families loaded so far are stored, with the standards added to
+    their tables, the conversions resolved so far, the interned units and the unit
+    algebra memo; nothing is loaded or resolved to be stored.
+
+    Parameters
+    ----------
+    path: str | os.PathLike
+        Path of the snapshot file, overwritten if it exists.
+    extra_units: Iterable[_UnitType]
+        User defined units to store that are in no conversion table.
+    """
+
+    custom_units = list(extra_units)
+    groups = {}
+    try:
+        # group the records by the unit families they need, each group is restored
+        # once its families are loaded
+        for record in _records():
+            pickler = _SnapshotPickler(io.BytesIO(), custom_units)
+            pickler.dump(record)
+            groups.setdefault(tuple(sorted(pickler.families)), []).append(record)
+
+        pickled_groups = []
+        for families, records in groups.items():
+            buffer = io.BytesIO()
+            _SnapshotPickler(buffer, custom_units).dump(records)
+            pickled_groups.append((families, buffer.getvalue()))
+
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, None).dump(
+            {"custom_units": custom_units, "groups": pickled_groups}
+        )
+    except _PICKLING_ERRORS as error:
+        raise exceptions.SnapshotError(_pickling_failure(error)) from error
+
+    header = pickle.dumps({"format": FORMAT, "version": __version__})
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(header)
+        file.write(buffer.getbuffer())
+
+
+def read_snapshot_header(path: str | os.PathLike) -> dict:
+    """Reads the header of the snapshot file at `path`.
+
+    return: dict with the `format` and the mudu `version` of the snapshot.
+    """
+
+    with open(path, "rb") as file:
+        return _read_header(file, path)
+
+
+def _read_header(file, path) -> dict:
+    if file.read(len(MAGIC)) != MAGIC:
+        raise exceptions.SnapshotError(f"{path} is not a mudu snapshot")
+    return pickle.load(file)
+
+
+def load_snapshot(path: str | os.PathLike) -> dict[str, _UnitType]:
+    """Restores the unit registry from the snapshot file at `path`.
+
+    The standards of the snapshot are added to the tables (unless already there),
+    and its resolved conversions, interned units and unit algebra memo are added.
+    The state of a unit family that is not loaded yet is restored when it is loaded.
+
+    return: dict of the user defined units of the snapshot (the units of its tables
+    that are not in `mudu.units`, and its `extra_units`), by `_unit_name`.
+    """
+
+    with open(path, "rb") as file:
+        header = _read_header(file, path)
+        if header["format"] != FORMAT or header["version"] != __version__:
+            raise exceptions.SnapshotError(
+                f"{path} was written by mudu {header['version']} (snapshot format "
+                f"{header['format']}), mudu {__version__} (format {FORMAT}) is installed"
+            )
+        payload = _SnapshotUnpickler(file).load()
+
+    custom_units = payload["custom_units"]
+    with units._FAMILY_LOCK:
+        _pending.extend(
+            (families, data, custom_units) for families, data in payload["groups"]
+        )
+        _restore_pending()
+        if _pending and _restore_pending not in units._FAMILY_HOOKS:
+            units._FAMILY_HOOKS.append(_restore_pending)
+
+    found = {}
+    for unit in custom_units:
+        found.setdefault(unit._unit_name, unit)
+    return found
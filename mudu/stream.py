@@ -0,0 +1,120 @@
+"""
+=========================
+mudu.stream
+=========================
+
+mudu module, chunked conversion of streams of values.
+
+Values arriving from an iterable or a generator, as raw numbers or as
+`(value, unit)` tuples, are batched into native arrays and converted a chunk at a
+time, so an unbounded stream is converted with bounded memory and without a
+quantity object per value.
+
+- **Usage example**
+
+    .. code-block:: python
+
+        from mudu import FEET, METER, stream
+
+        for meters in stream.convert(read_altitudes(), FEET, METER):
+            ...
+
+For more information, read the documenation using
+
+.. code-block:: shell
+    mudu --doc
+
+in your cli
+
+"""
+
+import itertools
+from collections import abc
+
+import numpy as np
+
+from .base import _UnitType
+from .dimensions import _resolve_units
+
+DEFAULT_CHUNK = 65536
+
+
+def _batches(iterable: abc.Iterable, chunk: int):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, chunk)):
+        yield batch
+
+
+def _converter(unit: _UnitType, to_unit: _UnitType, converters: dict):
+    if unit is None:
+        raise ValueError("raw values need a from_unit")
+
+    converter = converters.get(id(unit))
+    if converter is None:
+        converter = converters[id(unit)] = _resolve_units(unit, to_unit)
+    return converter
+
+
+def _convert_batch(
+    batch: list, from_unit: _UnitType, to_unit: _UnitType, converters: dict
+) -> np.ndarray:
+    """Converts a batch of raw values (in `from_unit`) and `(value, unit)` tuples."""
+
+    if any(isinstance(item, tuple) for item in batch) is False:
+        values = np.fromiter(batch, dtype=np.float64, count=len(batch))
+        return _converter(from_unit, to_unit, converters).apply(values, out=values)
+
+    values = np.fromiter(
+        (item[0] if isinstance(item, tuple) else item for item in batch),
+        dtype=np.float64,
+        count=len(batch),
+    )
+    units = [item[1] if isinstance(item, tuple) else from_unit for item in batch]
+
+    # one whole-array conversion per distinct unit of the batch
+    codes, distinct = [], {}
+    for unit in units:
+        codes.append(distinct.setdefault(id(unit), (len(distinct), unit))[0])
+    if len(distinct) == 1:
+        return _converter(units[0], to_unit, converters).apply(values, out=values)
+
+    codes = np.array(codes)
+    for code, unit in distinct.values():
+        rows = codes == code
+        values[rows] = _converter(unit, to_unit, converters).apply(values[rows])
+    return values
+
+
+def convert(
+    iterable: abc.Iterable,
+    from_unit: _UnitType | None,
+    to_unit: _UnitType,
+    chunk: int = DEFAULT_CHUNK,
+    chunks: bool = False,
+):
+    """Converts a stream of values to `to_unit`, `chunk` values at a time.
+
+    Parameters
+    ----------
+    iterable: Iterable
+        Raw numbers (in `from_unit`) and/or `(value, unit)` tuples.
+    from_unit: _UnitType | None
+        Unit of the raw numbers, may be None if every item is a `(value, unit)` tuple.
+    to_unit: _UnitType
+        The unit to convert to.
+    chunk: int
+        Number of items batched into one array, bounds the memory in use.
+    chunks: bool
+        Yield one `float64` `np.ndarray` per batch instead of one float per item.
+
+    return: generator of the converted values (float | np.ndarray).
+    """
+
+    # the conversion of each unit is resolved once for the whole stream
+    converters = {}
+    for batch in _batches(iterable, chunk):
+        values = _convert_batch(batch, from_unit, to_unit, converters)
+        if chunks is True:
+            yield values
+        else:
+            yield from values.tolist()
@@ -15,8 +15,9 @@ in your cli
 
 """
 
-import functools
 import math
+import threading
+from typing import Callable
 
 from .base import (
     SOLID_ANGLE,
@@ -49,6 +50,8 @@ from .base import (
     OrderUnit,
     KILO,
     _ConversionTableType,
+    _ConverterType,
+    _basic_unit_converter,
 )
 
 # ================================ UNIT TYPE DEFINITIONS ===========================================
@@ -258,584 +261,777 @@ CANDELA = _UnitType(
 KILOGRAM = OrderUnit(KILO, GRAM)
 KILOMETER = OrderUnit(KILO, METER)
 
-# ============
-# Force Units
-# ============
-__force_dimension = (KILOGRAM * (METER / SECOND**2))._dimension
-NEWTON = _UnitType(
-    _quantity=FORCE,
-    _dimension=__force_dimension,
-    _unit_name="newton",
-    _unit_symbol="N",
-    _order=None,
+# ============================ CONVERSION TABLES =====================================
+_LENGTH_CONVERSION_TABLE = _ConversionTableType(
+    dimension=LENGTH,
+    conversion_table=[
+        ((INCH, METER), _ConverterType(scale=0.0254)),
+        ((FEET, METER), _ConverterType(scale=0.3048)),
+        ((YARD, METER), _ConverterType(scale=0.9144)),
+        ((MILE, METER), _ConverterType(scale=1609.344)),
+        ((NAUTICAL_MILE, METER), _ConverterType(scale=1852)),
+        ((INCH, FEET), _ConverterType(scale=1 / 12)),
+    ],
 )
 
-POUND_FORCE = _UnitType(
-    _quantity=FORCE,
-    _dimension=__force_dimension,
-    _unit_name="pound",
-    _unit_symbol="lbf",
-    _order=None,
+_MASS_CONVERSION_TABLE = _ConversionTableType(
+    dimension=MASS,
+    conversion_table=[
+        ((POUND, GRAM), _ConverterType(scale=453.59237)),
+        ((OUNCE, GRAM), _ConverterType(scale=28.3495)),
+        ((POUND, OUNCE), _ConverterType(scale=16)),
+        ((SLUG, GRAM), _ConverterType(scale=14593.903)),
+        ((SHORT_TON, GRAM), _ConverterType(scale=907000)),
+        ((LONG_TON, GRAM), _ConverterType(scale=1016000)),
+        ((METRIC_TON, GRAM), _ConverterType(scale=1000000)),
+    ],
 )
 
-POUNDAL = _UnitType(
-    _quantity=FORCE,
-    _dimension=__force_dimension,
-    _unit_name="poundal",
-    _unit_symbol="pdl",
-    _order=None,
+_TIME_CONVERSION_TABLE = _ConversionTableType(
+    dimension=TIME,
+    conversion_table=(
+        ((MINUTE, SECOND), _ConverterType(scale=60)),
+        ((HOUR, SECOND), _ConverterType(scale=3600)),
+        ((HOUR, MINUTE), _ConverterType(scale=60)),
+    ),
 )
 
-DYNE = _UnitType(
-    _quantity=FORCE,
-    _dimension=__force_dimension,
-    _unit_name="dyne",
-    _unit_symbol="dyn",
-    _order=None,
+_TEMPERATURE_CONVERSION_TABLE = _ConversionTableType(
+    dimension=THERMODYNAMIC_TEMPERATURE,
+    conversion_table=(
+        ((KELVIN, RANKINE), _ConverterType(scale=1.8)),
+        ((KELVIN, CELSIUS), _ConverterType(offset=-273.15)),
+        ((KELVIN, FARENHEIT), _ConverterType(scale=1.8, offset=-459.67)),
+    ),
 )
 
-# ==============
-# Speed Units
-# ==============
-__speed_dimension = (METER / SECOND)._dimension
-METER_PER_SECOND = _UnitType(
-    _quantity=SPEED,
-    _dimension=__speed_dimension,
-    _unit_name="meter_per_second",
-    _unit_symbol="m/s",
-    _order=None,
+_ANGLE_CONVERSION_TABLE = _ConversionTableType(
+    dimension=PLANE_ANGLE,
+    conversion_table=(((DEGREE, RADIAN), _ConverterType(scale=math.pi / 180)),),
 )
 
-KM_PER_HOUR = _UnitType(
-    _quantity=SPEED,
-    _dimension=__speed_dimension,
-    _unit_name="km_per_hour",
-    _unit_symbol="km/h",
-    _order=None,
+# reference unit of each base dimension: every unit decomposes into a scale times
+# a product of reference units, which converts composite units without a table
+_REFERENCE_UNITS = (
+    METER,
+    GRAM,
+    SECOND,
+    KELVIN,
+    AMPERE,
+    MOLE,
+    CANDELA,
+    RADIAN,
+    STERADIAN,
 )
 
-FOOT_PER_SECOND = _UnitType(
-    _quantity=SPEED,
-    _dimension=__speed_dimension,
-    _unit_name="foot_per_second",
-    _unit_symbol="ft/s",
-    _order=None,
-)
+# definitions of named derived units in terms of base units, added by their unit
+# family when it is loaded; the other units of their conversion table decompose
+# through them
+_UNIT_DEFINITIONS = []
 
-MILE_PER_HOUR = _UnitType(
-    _quantity=SPEED,
-    _dimension=__speed_dimension,
-    _unit_name="mile_per_hour",
-    _unit_symbol="mph",
-    _order=None,
-)
+# the conversion tables of the loaded unit families, searched in this order for the
+# table of a unit
+_CONVERSION_TABLES = [
+    _LENGTH_CONVERSION_TABLE,
+    _MASS_CONVERSION_TABLE,
+    _TIME_CONVERSION_TABLE,
+    _TEMPERATURE_CONVERSION_TABLE,
+    _ANGLE_CONVERSION_TABLE,
+]
 
-KNOT = _UnitType(
-    _quantity=SPEED,
-    _dimension=__speed_dimension,
-    _unit_name="knot",
-    _unit_symbol="kn",
-    _order=None,
-)
+# ============================ LAZY UNIT FAMILIES ====================================
+# The units of the base dimensions above are defined on import. The derived unit
+# families below (and their conversion tables) are only defined when one of their
+# names is first accessed, e.g. `from mudu.units import NEWTON` or `units.SIEVERT`,
+# through the module `__getattr__`.
 
-# ===============
-# Pressure Units
-# ===============
-__pressure_dimension = (NEWTON / (METER * METER))._dimension
-PASCAL = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="pascal",
-    _unit_symbol="Pa",
-    _order=None,
-)
+# name -> loader of the unit family that defines it
+_LAZY_UNITS = {}
+_FAMILY_LOCK = threading.RLock()
+# called (without arguments) after a unit family is loaded, e.g. by `mudu.snapshot`
+# to restore the state of its table
+_FAMILY_HOOKS = []
 
-PSI = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="pascal",
-    _unit_symbol="psi",
-    _order=None,
-)
 
-ATM = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="atm",
-    _unit_symbol="atm",
-    _order=None,
-)
+def _unit_family(*names: str) -> Callable:
+    """Registers a unit family loader, a function returning the objects `names`
+    refer to (units and conversion table), in that order."""
 
-BAR = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="bar",
-    _unit_symbol="bar",
-    _order=None,
-)
+    def register(loader: Callable) -> Callable:
+        loader.names = names
+        for name in names:
+            _LAZY_UNITS[name] = loader
+        return loader
 
-mmHg = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="mmHg",
-    _unit_symbol="mmHg",
-    _order=None,
-)
+    return register
 
-inHg = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="inHg",
-    _unit_symbol="inHg",
-    _order=None,
-)
 
-POUND_PER_SQUARE_FOOT = _UnitType(
-    _quantity=PRESSURE,
-    _dimension=__pressure_dimension,
-    _unit_name="pound_per_square_foot",
-    _unit_symbol="lb/ft2",
-    _order=None,
-)
+def _load_family(loader: Callable) -> None:
 
-# =============
-# Energy Units
-# =============
-__energy_dimension = (NEWTON * METER)._dimension
-JOULE = _UnitType(
-    _quantity=ENERGY,
-    _dimension=__energy_dimension,
-    _unit_name="joule",
-    _unit_symbol="J",
-    _order=None,
-)
+    with _FAMILY_LOCK:
+        # the family may have been loaded by another thread meanwhile
+        if loader.names[0] in globals():
+            return
 
-CALORIE = _UnitType(
-    _quantity=ENERGY,
-    _dimension=__energy_dimension,
-    _unit_name="calorie",
-    _unit_symbol="cal",
-    _order=None,
-)
+        values = loader()
+        for value in values:
+            if isinstance(value, _ConversionTableType) is True:
+                _CONVERSION_TABLES.append(value)
+        globals().update(zip(loader.names, values))
+        for hook in tuple(_FAMILY_HOOKS):
+            hook()
 
-WATT_HOUR = _UnitType(
-    _quantity=ENERGY,
-    _dimension=__energy_dimension,
-    _unit_name="watt_hour",
-    _unit_symbol="Wh",
-    _order=None,
-)
 
-ELECTRON_VOLT = _UnitType(
-    _quantity=ENERGY,
-    _dimension=__energy_dimension,
-    _unit_name="electron_volt",
-    _unit_symbol="eV",
-    _order=None,
-)
+def _load_all_families() -> None:
+    """Loads every unit family, e.g. to search all the units by name."""
 
-BRITISH_THERMAL_UNIT = _UnitType(
-    _quantity=ENERGY,
-    _dimension=__energy_dimension,
-    _unit_name="british_thermal_unit",
-    _unit_symbol="BTU",
-    _order=None,
-)
+    # in order of definition, which is also the order of the names in the module
+    for loader in dict.fromkeys(_LAZY_UNITS.values()):
+        _load_family(loader)
 
-# ==============
-# Density Units
-# ==============
-__density_dimension = (KILOGRAM / (METER * METER * METER))._dimension
-KILOGRAM_PER_CUBIC_METER = _UnitType(
-    _quantity=DENSITY,
-    _dimension=__density_dimension,
-    _unit_name="kilogram_per_cubic_meter",
-    _unit_symbol="kg/m3",
-    _order=None,
-)
 
-GRAM_PER_CUBIC_CENTIMETER = _UnitType(
-    _quantity=DENSITY,
-    _dimension=__density_dimension,
-    _unit_name="gram_per_cubic_centimeter",
-    _unit_symbol="g/cm3",
-    _order=None,
-)
+def __getattr__(name: str):
 
-GRAM_PER_CUBIC_MILLILITER = _UnitType(
-    _quantity=DENSITY,
-    _dimension=__density_dimension,
-    _unit_name="gram_per_cubic_centimeter",
-    _unit_symbol="g/cm3",
-    _order=None,
-)
+    loader = _LAZY_UNITS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-POUND_PER_CUBIC_FOOT = _UnitType(
-    _quantity=DENSITY,
-    _dimension=__density_dimension,
-    _unit_name="pound_per_cubic_foot",
-    _unit_symbol="lb/ft3",
-    _order=None,
-)
+    _load_family(loader)
+    return globals()[name]
 
-POUND_PER_CUBIC_INCH = _UnitType(
-    _quantity=DENSITY,
-    _dimension=__density_dimension,
-    _unit_name="pound_per_cubic_inch",
-    _unit_symbol="lb/in3",
-    _order=None,
-)
 
-SLUG_PER_CUBIC_FOOT = _UnitType(
-    _quantity=DENSITY,
-    _dimension=__density_dimension,
-    _unit_name="slug_per_cubic_foot",
-    _unit_symbol="slug/ft3",
-    _order=None,
-)
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_UNITS))
+
 
 # ============
-# Power Units
+# Force Units
 # ============
-__power_dimension = (JOULE / SECOND)._dimension
-WATT = _UnitType(
-    _quantity=POWER,
-    _dimension=__power_dimension,
-    _unit_name="watt",
-    _unit_symbol="W",
-    _order=None,
-)
+@_unit_family("NEWTON", "POUND_FORCE", "POUNDAL", "DYNE", "_FORCE_CONVERSION_TABLE")
+def _force_units() -> tuple:
+    dimension = (KILOGRAM * (METER / SECOND**2))._dimension
+    NEWTON = _UnitType(
+        _quantity=FORCE,
+        _dimension=dimension,
+        _unit_name="newton",
+        _unit_symbol="N",
+        _order=None,
+    )
+
+    POUND_FORCE = _UnitType(
+        _quantity=FORCE,
+        _dimension=dimension,
+        _unit_name="pound",
+        _unit_symbol="lbf",
+        _order=None,
+    )
+
+    POUNDAL = _UnitType(
+        _quantity=FORCE,
+        _dimension=dimension,
+        _unit_name="poundal",
+        _unit_symbol="pdl",
+        _order=None,
+    )
+
+    DYNE = _UnitType(
+        _quantity=FORCE,
+        _dimension=dimension,
+        _unit_name="dyne",
+        _unit_symbol="dyn",
+        _order=None,
+    )
+
+    _FORCE_CONVERSION_TABLE = _ConversionTableType(
+        dimension=FORCE,
+        conversion_table=(
+            ((DYNE, NEWTON), _ConverterType(scale=0.00001)),
+            ((POUND_FORCE, NEWTON), _ConverterType(scale=4.44822)),
+            ((POUNDAL, NEWTON), _ConverterType(scale=0.138255)),
+        ),
+    )
+    _UNIT_DEFINITIONS.append((NEWTON, KILOGRAM * METER / SECOND**2))
 
-HORSEPOWER = _UnitType(
-    _quantity=POWER,
-    _dimension=__power_dimension,
-    _unit_name="horsepower",
-    _unit_symbol="hp",
-    _order=None,
-)
+    return NEWTON, POUND_FORCE, POUNDAL, DYNE, _FORCE_CONVERSION_TABLE
 
-BTU_PER_HOUR = _UnitType(
-    _quantity=POWER,
-    _dimension=__power_dimension,
-    _unit_name="btu_per_hour",
-    _unit_symbol="BTU/h",
-    _order=None,
-)
 
-# =================
-# Electrical Units
-# =================
-VOLT = _UnitType(
-    _quantity=VOLTAGE,
-    _dimension=(KILOGRAM * (METER**2) / (SECOND**3) * AMPERE)._dimension,
-    _unit_name="volt",
-    _unit_symbol="V",
-    _order=None,
-)
+# ==============
+# Speed Units
+# ==============
+@_unit_family(
+    "METER_PER_SECOND",
+    "KM_PER_HOUR",
+    "FOOT_PER_SECOND",
+    "MILE_PER_HOUR",
+    "KNOT",
+    "_SPEED_CONVERSION_TABLE",
+)
+def _speed_units() -> tuple:
+    dimension = (METER / SECOND)._dimension
+    METER_PER_SECOND = _UnitType(
+        _quantity=SPEED,
+        _dimension=dimension,
+        _unit_name="meter_per_second",
+        _unit_symbol="m/s",
+        _order=None,
+    )
+
+    KM_PER_HOUR = _UnitType(
+        _quantity=SPEED,
+        _dimension=dimension,
+        _unit_name="km_per_hour",
+        _unit_symbol="km/h",
+        _order=None,
+    )
+
+    FOOT_PER_SECOND = _UnitType(
+        _quantity=SPEED,
+        _dimension=dimension,
+        _unit_name="foot_per_second",
+        _unit_symbol="ft/s",
+        _order=None,
+    )
+
+    MILE_PER_HOUR = _UnitType(
+        _quantity=SPEED,
+        _dimension=dimension,
+        _unit_name="mile_per_hour",
+        _unit_symbol="mph",
+        _order=None,
+    )
+
+    KNOT = _UnitType(
+        _quantity=SPEED,
+        _dimension=dimension,
+        _unit_name="knot",
+        _unit_symbol="kn",
+        _order=None,
+    )
+
+    _SPEED_CONVERSION_TABLE = _ConversionTableType(
+        dimension=SPEED,
+        conversion_table=(
+            (
+                (KM_PER_HOUR, METER_PER_SECOND),
+                _ConverterType(scale=1000 / 3600),
+            ),
+            (
+                (MILE_PER_HOUR, METER_PER_SECOND),
+                _ConverterType(scale=0.44704),
+            ),
+            (
+                (KNOT, METER_PER_SECOND),
+                _ConverterType(scale=1852 / 3600),
+            ),
+            (
+                (FOOT_PER_SECOND, METER_PER_SECOND),
+                _ConverterType(scale=0.3048),
+            ),
+        ),
+    )
+    _UNIT_DEFINITIONS.append((METER_PER_SECOND, METER / SECOND))
 
-FARAD = _UnitType(
-    _quantity=CAPACITANCE,
-    _dimension=((SECOND**4) * AMPERE**2 / (METER**2) * KILOGRAM)._dimension,
-    _unit_name="farad",
-    _unit_symbol="F",
-    _order=None,
-)
+    return (
+        METER_PER_SECOND,
+        KM_PER_HOUR,
+        FOOT_PER_SECOND,
+        MILE_PER_HOUR,
+        KNOT,
+        _SPEED_CONVERSION_TABLE,
+    )
 
-HENRY = _UnitType(
-    _quantity=INDUCTANCE,
-    _dimension=(KILOGRAM * (METER**2) / (SECOND**2) * AMPERE**2)._dimension,
-    _unit_name="henry",
-    _unit_symbol="H",
-    _order=None,
-)
 
-WEBER = _UnitType(
-    _quantity=MAGNETIC_FLUX,
-    _dimension=(KILOGRAM * (METER**2) / (SECOND**2) * AMPERE)._dimension,
-    _unit_name="weber",
-    _unit_symbol="Wb",
-    _order=None,
-)
+# ===============
+# Pressure Units
+# ===============
+@_unit_family(
+    "PASCAL",
+    "PSI",
+    "ATM",
+    "BAR",
+    "mmHg",
+    "inHg",
+    "POUND_PER_SQUARE_FOOT",
+    "_PRESSURE_CONVERSION_TABLE",
+)
+def _pressure_units() -> tuple:
+    dimension = (KILOGRAM / (METER * SECOND**2))._dimension
+    PASCAL = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="pascal",
+        _unit_symbol="Pa",
+        _order=None,
+    )
+
+    PSI = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="pascal",
+        _unit_symbol="psi",
+        _order=None,
+    )
+
+    ATM = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="atm",
+        _unit_symbol="atm",
+        _order=None,
+    )
+
+    BAR = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="bar",
+        _unit_symbol="bar",
+        _order=None,
+    )
+
+    mmHg = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="mmHg",
+        _unit_symbol="mmHg",
+        _order=None,
+    )
+
+    inHg = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="inHg",
+        _unit_symbol="inHg",
+        _order=None,
+    )
+
+    POUND_PER_SQUARE_FOOT = _UnitType(
+        _quantity=PRESSURE,
+        _dimension=dimension,
+        _unit_name="pound_per_square_foot",
+        _unit_symbol="lb/ft2",
+        _order=None,
+    )
+
+    _PRESSURE_CONVERSION_TABLE = _ConversionTableType(
+        dimension=PRESSURE,
+        conversion_table=(
+            ((PSI, PASCAL), _ConverterType(scale=6894.76)),
+            ((ATM, PASCAL), _ConverterType(scale=101325)),
+            ((BAR, PASCAL), _ConverterType(scale=100000)),
+            ((mmHg, PASCAL), _ConverterType(scale=133.322)),
+            ((inHg, PASCAL), _ConverterType(scale=3386.389)),
+            (
+                (POUND_PER_SQUARE_FOOT, PASCAL),
+                _ConverterType(scale=47.8803),
+            ),
+        ),
+    )
+    _UNIT_DEFINITIONS.append((PASCAL, KILOGRAM / (METER * SECOND**2)))
 
-OHMS = _UnitType(
-    _quantity=RESISTANCE,
-    _dimension=(KILOGRAM * (METER**2) / (SECOND**2) * AMPERE)._dimension,
-    _unit_name="ohms",
-    _unit_symbol="Ω",
-    _order=None,
-)
+    return (
+        PASCAL,
+        PSI,
+        ATM,
+        BAR,
+        mmHg,
+        inHg,
+        POUND_PER_SQUARE_FOOT,
+        _PRESSURE_CONVERSION_TABLE,
+    )
 
-SIEMENS = _UnitType(
-    _quantity=CONDUCTANCE,
-    _dimension=((SECOND**3) * AMPERE**2 / (METER**2) / KILOGRAM)._dimension,
-    _unit_name="siemens",
-    _unit_symbol="S",
-    _order=None,
-)
 
-TESLA = _UnitType(
-    _quantity=MAGNETIC_FIELD_STRENGTH,
-    _dimension=(KILOGRAM / (SECOND**2) * AMPERE)._dimension,
-    _unit_name="tesla",
-    _unit_symbol="T",
-    _order=None,
-)
+# =============
+# Energy Units
+# =============
+@_unit_family(
+    "JOULE",
+    "CALORIE",
+    "WATT_HOUR",
+    "ELECTRON_VOLT",
+    "BRITISH_THERMAL_UNIT",
+    "_ENERGY_CONVERSION_TABLE",
+)
+def _energy_units() -> tuple:
+    dimension = (KILOGRAM * METER**2 / SECOND**2)._dimension
+    JOULE = _UnitType(
+        _quantity=ENERGY,
+        _dimension=dimension,
+        _unit_name="joule",
+        _unit_symbol="J",
+        _order=None,
+    )
+
+    CALORIE = _UnitType(
+        _quantity=ENERGY,
+        _dimension=dimension,
+        _unit_name="calorie",
+        _unit_symbol="cal",
+        _order=None,
+    )
+
+    WATT_HOUR = _UnitType(
+        _quantity=ENERGY,
+        _dimension=dimension,
+        _unit_name="watt_hour",
+        _unit_symbol="Wh",
+        _order=None,
+    )
+
+    ELECTRON_VOLT = _UnitType(
+        _quantity=ENERGY,
+        _dimension=dimension,
+        _unit_name="electron_volt",
+        _unit_symbol="eV",
+        _order=None,
+    )
+
+    BRITISH_THERMAL_UNIT = _UnitType(
+        _quantity=ENERGY,
+        _dimension=dimension,
+        _unit_name="british_thermal_unit",
+        _unit_symbol="BTU",
+        _order=None,
+    )
+
+    _ENERGY_CONVERSION_TABLE = _ConversionTableType(
+        dimension=ENERGY,
+        conversion_table=(
+            ((CALORIE, JOULE), _ConverterType(scale=4.184)),
+            ((WATT_HOUR, JOULE), _ConverterType(scale=3600)),
+            (
+                (ELECTRON_VOLT, JOULE),
+                _ConverterType(scale=1.60217662e-19),
+            ),
+            (
+                (BRITISH_THERMAL_UNIT, JOULE),
+                _ConverterType(scale=1055),
+            ),
+        ),
+    )
+    _UNIT_DEFINITIONS.append((JOULE, KILOGRAM * METER**2 / SECOND**2))
+
+    return (
+        JOULE,
+        CALORIE,
+        WATT_HOUR,
+        ELECTRON_VOLT,
+        BRITISH_THERMAL_UNIT,
+        _ENERGY_CONVERSION_TABLE,
+    )
 
-# ============
-# Illuminance
-# ============
-LUX = _UnitType(
-    _quantity=ILLUMINANCE,
-    _dimension=(CANDELA * STERADIAN / METER**2)._dimension,
-    _unit_name="lux",
-    _unit_symbol="lx",
-    _order=None,
-)
 
 # ==============
-# Radioactivity
+# Density Units
 # ==============
-BECQUEREL = _UnitType(
-    _quantity=RADIOACTIVITY,
-    _dimension=(CANDELA * STERADIAN / METER**2)._dimension,
-    _unit_name="becquerel",
-    _unit_symbol="Bq",
-    _order=None,
-)
+@_unit_family(
+    "KILOGRAM_PER_CUBIC_METER",
+    "GRAM_PER_CUBIC_CENTIMETER",
+    "GRAM_PER_CUBIC_MILLILITER",
+    "POUND_PER_CUBIC_FOOT",
+    "POUND_PER_CUBIC_INCH",
+    "SLUG_PER_CUBIC_FOOT",
+    "_DENSITY_CONVERSION_TABLE",
+)
+def _density_units() -> tuple:
+    dimension = (KILOGRAM / (METER * METER * METER))._dimension
+    KILOGRAM_PER_CUBIC_METER = _UnitType(
+        _quantity=DENSITY,
+        _dimension=dimension,
+        _unit_name="kilogram_per_cubic_meter",
+        _unit_symbol="kg/m3",
+        _order=None,
+    )
+
+    GRAM_PER_CUBIC_CENTIMETER = _UnitType(
+        _quantity=DENSITY,
+        _dimension=dimension,
+        _unit_name="gram_per_cubic_centimeter",
+        _unit_symbol="g/cm3",
+        _order=None,
+    )
+
+    GRAM_PER_CUBIC_MILLILITER = _UnitType(
+        _quantity=DENSITY,
+        _dimension=dimension,
+        _unit_name="gram_per_cubic_centimeter",
+        _unit_symbol="g/cm3",
+        _order=None,
+    )
+
+    POUND_PER_CUBIC_FOOT = _UnitType(
+        _quantity=DENSITY,
+        _dimension=dimension,
+        _unit_name="pound_per_cubic_foot",
+        _unit_symbol="lb/ft3",
+        _order=None,
+    )
+
+    POUND_PER_CUBIC_INCH = _UnitType(
+        _quantity=DENSITY,
+        _dimension=dimension,
+        _unit_name="pound_per_cubic_inch",
+        _unit_symbol="lb/in3",
+        _order=None,
+    )
+
+    SLUG_PER_CUBIC_FOOT = _UnitType(
+        _quantity=DENSITY,
+        _dimension=dimension,
+        _unit_name="slug_per_cubic_foot",
+        _unit_symbol="slug/ft3",
+        _order=None,
+    )
+
+    _DENSITY_CONVERSION_TABLE = _ConversionTableType(
+        dimension=DENSITY,
+        conversion_table=(
+            (
+                (GRAM_PER_CUBIC_CENTIMETER, KILOGRAM_PER_CUBIC_METER),
+                _ConverterType(scale=1000),
+            ),
+            (
+                (GRAM_PER_CUBIC_MILLILITER, KILOGRAM_PER_CUBIC_METER),
+                _ConverterType(scale=1000),
+            ),
+            (
+                (POUND_PER_CUBIC_FOOT, KILOGRAM_PER_CUBIC_METER),
+                _ConverterType(scale=16.0185),
+            ),
+            (
+                (POUND_PER_CUBIC_INCH, KILOGRAM_PER_CUBIC_METER),
+                _ConverterType(scale=27679.9),
+            ),
+            (
+                (SLUG_PER_CUBIC_FOOT, KILOGRAM_PER_CUBIC_METER),
+                _ConverterType(scale=515.3788),
+            ),
+        ),
+    )
+    _UNIT_DEFINITIONS.append((KILOGRAM_PER_CUBIC_METER, KILOGRAM / METER**3))
 
-CURIE = _UnitType(
-    _quantity=RADIOACTIVITY,
-    _dimension=(1 / SECOND)._dimension,
-    _unit_name="curie",
-    _unit_symbol="Ci",
-    _order=None,
-)
+    return (
+        KILOGRAM_PER_CUBIC_METER,
+        GRAM_PER_CUBIC_CENTIMETER,
+        GRAM_PER_CUBIC_MILLILITER,
+        POUND_PER_CUBIC_FOOT,
+        POUND_PER_CUBIC_INCH,
+        SLUG_PER_CUBIC_FOOT,
+        _DENSITY_CONVERSION_TABLE,
+    )
 
-# ==============
-# Absorbed Dose
-# ==============
-__radioactive_dose_dimension = (JOULE / KILOGRAM)._dimension
-GRAY = _UnitType(
-    _quantity=ABSORBED_DOSE,
-    _dimension=__radioactive_dose_dimension,
-    _unit_name="gray",
-    _unit_symbol="Gy",
-    _order=None,
-)
 
-RAD = _UnitType(
-    _quantity=ABSORBED_DOSE,
-    _dimension=__radioactive_dose_dimension,
-    _unit_name="rad",
-    _unit_symbol="rad",
-    _order=None,
-)
+# ============
+# Power Units
+# ============
+@_unit_family("WATT", "HORSEPOWER", "BTU_PER_HOUR", "_POWER_CONVERSION_TABLE")
+def _power_units() -> tuple:
+    dimension = (KILOGRAM * METER**2 / SECOND**3)._dimension
+    WATT = _UnitType(
+        _quantity=POWER,
+        _dimension=dimension,
+        _unit_name="watt",
+        _unit_symbol="W",
+        _order=None,
+    )
+
+    HORSEPOWER = _UnitType(
+        _quantity=POWER,
+        _dimension=dimension,
+        _unit_name="horsepower",
+        _unit_symbol="hp",
+        _order=None,
+    )
+
+    BTU_PER_HOUR = _UnitType(
+        _quantity=POWER,
+        _dimension=dimension,
+        _unit_name="btu_per_hour",
+        _unit_symbol="BTU/h",
+        _order=None,
+    )
+
+    _POWER_CONVERSION_TABLE = _ConversionTableType(
+        dimension=POWER,
+        conversion_table=(
+            ((HORSEPOWER, WATT), _ConverterType(scale=745.7)),
+            ((BTU_PER_HOUR, WATT), _ConverterType(scale=0.293071)),
+        ),
+    )
+    _UNIT_DEFINITIONS.append((WATT, KILOGRAM * METER**2 / SECOND**3))
 
-# ================
-# Dose Equivalent
-# ================
-SIEVERT = _UnitType(
-    _quantity=DOSE_EQUIVALENT,
-    _dimension=__radioactive_dose_dimension,
-    _unit_name="sievert",
-    _unit_symbol="Sv",
-    _order=None,
-)
+    return WATT, HORSEPOWER, BTU_PER_HOUR, _POWER_CONVERSION_TABLE
 
-REM = _UnitType(
-    _quantity=DOSE_EQUIVALENT,
-    _dimension=__radioactive_dose_dimension,
-    _unit_name="rem",
-    _unit_symbol="rem",
-    _order=None,
-)
 
 # =================
-# ============================
-# utility conversion function
-# ============================
-_basic_unit_converter = lambda x, y, invert=False: x * y if invert is False else x / y
+# Electrical Units
+# =================
+@_unit_family("VOLT", "FARAD", "HENRY", "WEBER", "OHMS", "SIEMENS", "TESLA")
+def _electrical_units() -> tuple:
+    VOLT = _UnitType(
+        _quantity=VOLTAGE,
+        _dimension=(KILOGRAM * (METER**2) / (SECOND**3) * AMPERE)._dimension,
+        _unit_name="volt",
+        _unit_symbol="V",
+        _order=None,
+    )
+
+    FARAD = _UnitType(
+        _quantity=CAPACITANCE,
+        _dimension=((SECOND**4) * AMPERE**2 / (METER**2) * KILOGRAM)._dimension,
+        _unit_name="farad",
+        _unit_symbol="F",
+        _order=None,
+    )
+
+    HENRY = _UnitType(
+        _quantity=INDUCTANCE,
+        _dimension=(KILOGRAM * (METER**2) / (SECOND**2) * AMPERE**2)._dimension,
+        _unit_name="henry",
+        _unit_symbol="H",
+        _order=None,
+    )
+
+    WEBER = _UnitType(
+        _quantity=MAGNETIC_FLUX,
+        _dimension=(KILOGRAM * (METER**2) / (SECOND**2) * AMPERE)._dimension,
+        _unit_name="weber",
+        _unit_symbol="Wb",
+        _order=None,
+    )
+
+    OHMS = _UnitType(
+        _quantity=RESISTANCE,
+        _dimension=(KILOGRAM * (METER**2) / (SECOND**2) * AMPERE)._dimension,
+        _unit_name="ohms",
+        _unit_symbol="Ω",
+        _order=None,
+    )
+
+    SIEMENS = _UnitType(
+        _quantity=CONDUCTANCE,
+        _dimension=((SECOND**3) * AMPERE**2 / (METER**2) / KILOGRAM)._dimension,
+        _unit_name="siemens",
+        _unit_symbol="S",
+        _order=None,
+    )
+
+    TESLA = _UnitType(
+        _quantity=MAGNETIC_FIELD_STRENGTH,
+        _dimension=(KILOGRAM / (SECOND**2) * AMPERE)._dimension,
+        _unit_name="tesla",
+        _unit_symbol="T",
+        _order=None,
+    )
+
+    return VOLT, FARAD, HENRY, WEBER, OHMS, SIEMENS, TESLA
 
-# ============================ CONVERSION TABLES =====================================
-_LENGTH_CONVERSION_TABLE = _ConversionTableType(
-    dimension=LENGTH,
-    conversion_table=[
-        ((INCH, METER), functools.partial(_basic_unit_converter, y=0.0254)),
-        ((FEET, METER), functools.partial(_basic_unit_converter, y=0.3048)),
-        ((YARD, METER), functools.partial(_basic_unit_converter, y=0.9144)),
-        ((MILE, METER), functools.partial(_basic_unit_converter, y=1609.344)),
-        ((NAUTICAL_MILE, METER), functools.partial(_basic_unit_converter, y=1852)),
-        ((INCH, FEET), functools.partial(_basic_unit_converter, y=12)),
-    ],
-)
 
-_MASS_CONVERSION_TABLE = _ConversionTableType(
-    dimension=MASS,
-    conversion_table=[
-        ((POUND, GRAM), functools.partial(_basic_unit_converter, y=453.59237)),
-        ((OUNCE, GRAM), functools.partial(_basic_unit_converter, y=28.3495)),
-        ((POUND, OUNCE), functools.partial(_basic_unit_converter, y=16)),
-        ((SLUG, GRAM), functools.partial(_basic_unit_converter, y=14.593903)),
-        ((SHORT_TON, GRAM), functools.partial(_basic_unit_converter, y=907000)),
-        ((LONG_TON, GRAM), functools.partial(_basic_unit_converter, y=1016000)),
-        ((METRIC_TON, GRAM), functools.partial(_basic_unit_converter, y=1000000)),
-    ],
-)
+# ============
+# Illuminance
+# ============
+@_unit_family("LUX")
+def _illuminance_units() -> tuple:
+    LUX = _UnitType(
+        _quantity=ILLUMINANCE,
+        _dimension=(CANDELA * STERADIAN / METER**2)._dimension,
+        _unit_name="lux",
+        _unit_symbol="lx",
+        _order=None,
+    )
 
-_TIME_CONVERSION_TABLE = _ConversionTableType(
-    dimension=TIME,
-    conversion_table=(
-        ((MINUTE, SECOND), functools.partial(_basic_unit_converter, y=60)),
-        ((HOUR, SECOND), functools.partial(_basic_unit_converter, y=3600)),
-        ((HOUR, MINUTE), functools.partial(_basic_unit_converter, y=60)),
-    ),
-)
+    return (LUX,)
 
-_TEMPERATURE_CONVERSION_TABLE = _ConversionTableType(
-    dimension=THERMODYNAMIC_TEMPERATURE,
-    conversion_table=(
-        (
-            (KELVIN, RANKINE),
-            lambda x, invert=False: x * 1.8 if invert is False else x / 1.8,
-        ),
-        (
-            (KELVIN, CELSIUS),
-            lambda x, invert=False: x - 273.15 if invert is False else x + 273.15,
-        ),
-        (
-            (KELVIN, FARENHEIT),
-            lambda x, invert=False: (
-                (1.8 * x) - 459.67 if invert is False else (x + 459.67) / 1.8
-            ),
-        ),
-    ),
-)
 
-_ANGLE_CONVERSION_TABLE = _ConversionTableType(
-    dimension=PLANE_ANGLE,
-    conversion_table=(
-        (
-            (DEGREE, RADIAN),
-            lambda x, invert=False: (
-                math.radians(x) if invert is False else math.degrees(x)
-            ),
+# ==============
+# Radioactivity
+# ==============
+@_unit_family("BECQUEREL", "CURIE", "_RADIOACTIVITY_CONVERSION_TABLE")
+def _radioactivity_units() -> tuple:
+    BECQUEREL = _UnitType(
+        _quantity=RADIOACTIVITY,
+        _dimension=(CANDELA * STERADIAN / METER**2)._dimension,
+        _unit_name="becquerel",
+        _unit_symbol="Bq",
+        _order=None,
+    )
+
+    CURIE = _UnitType(
+        _quantity=RADIOACTIVITY,
+        _dimension=(1 / SECOND)._dimension,
+        _unit_name="curie",
+        _unit_symbol="Ci",
+        _order=None,
+    )
+
+    _RADIOACTIVITY_CONVERSION_TABLE = _ConversionTableType(
+        dimension=RADIOACTIVITY,
+        conversion_table=(
+            ((CURIE, BECQUEREL), _ConverterType(scale=3.7e10)),
         ),
-    ),
-)
+    )
 
-_FORCE_CONVERSION_TABLE = _ConversionTableType(
-    dimension=FORCE,
-    conversion_table=(
-        ((DYNE, NEWTON), functools.partial(_basic_unit_converter, y=0.00001)),
-        ((POUND_FORCE, NEWTON), functools.partial(_basic_unit_converter, y=4.44822)),
-        ((POUNDAL, NEWTON), functools.partial(_basic_unit_converter, y=0.138255)),
-    ),
-)
+    return BECQUEREL, CURIE, _RADIOACTIVITY_CONVERSION_TABLE
 
-_SPEED_CONVERSION_TABLE = _ConversionTableType(
-    dimension=SPEED,
-    conversion_table=(
-        (
-            (KM_PER_HOUR, METER_PER_SECOND),
-            functools.partial(_basic_unit_converter, y=1000 / 3600),
-        ),
-        (
-            (MILE_PER_HOUR, METER_PER_SECOND),
-            functools.partial(_basic_unit_converter, y=0.44704),
-        ),
-        (
-            (KNOT, METER_PER_SECOND),
-            functools.partial(_basic_unit_converter, y=1852 / 3600),
-        ),
-        (
-            (FOOT_PER_SECOND, METER_PER_SECOND),
-            functools.partial(_basic_unit_converter, y=0.3048),
-        ),
-    ),
-)
 
-_PRESSURE_CONVERSION_TABLE = _ConversionTableType(
-    dimension=PRESSURE,
-    conversion_table=(
-        ((PSI, PASCAL), functools.partial(_basic_unit_converter, y=6894.76)),
-        ((ATM, PASCAL), functools.partial(_basic_unit_converter, y=101325)),
-        ((BAR, PASCAL), functools.partial(_basic_unit_converter, y=100000)),
-        ((mmHg, PASCAL), functools.partial(_basic_unit_converter, y=133.322)),
-        ((inHg, PASCAL), functools.partial(_basic_unit_converter, y=3386.389)),
-        (
-            (POUND_PER_SQUARE_FOOT, PASCAL),
-            functools.partial(_basic_unit_converter, y=47.8803),
-        ),
-    ),
-)
+# ==============
+# Absorbed Dose
+# ==============
+@_unit_family("GRAY", "RAD", "_ABSORBED_DOSE_CONVERSION_TABLE")
+def _absorbed_dose_units() -> tuple:
+    dimension = (METER**2 / SECOND**2)._dimension
+    GRAY = _UnitType(
+        _quantity=ABSORBED_DOSE,
+        _dimension=dimension,
+        _unit_name="gray",
+        _unit_symbol="Gy",
+        _order=None,
+    )
+
+    RAD = _UnitType(
+        _quantity=ABSORBED_DOSE,
+        _dimension=dimension,
+        _unit_name="rad",
+        _unit_symbol="rad",
+        _order=None,
+    )
+
+    _ABSORBED_DOSE_CONVERSION_TABLE = _ConversionTableType(
+        dimension=ABSORBED_DOSE,
+        conversion_table=(((GRAY, RAD), _ConverterType(scale=100)),),
+    )
+    _UNIT_DEFINITIONS.append((GRAY, METER**2 / SECOND**2))
+
+    return GRAY, RAD, _ABSORBED_DOSE_CONVERSION_TABLE
 
-_ENERGY_CONVERSION_TABLE = _ConversionTableType(
-    dimension=ENERGY,
-    conversion_table=(
-        ((CALORIE, JOULE), functools.partial(_basic_unit_converter, y=4.184)),
-        ((WATT_HOUR, JOULE), functools.partial(_basic_unit_converter, y=3600)),
-        (
-            (ELECTRON_VOLT, JOULE),
-            functools.partial(_basic_unit_converter, y=1.60217662e-19),
-        ),
-        (
-            (BRITISH_THERMAL_UNIT, JOULE),
-            functools.partial(_basic_unit_converter, y=1055),
-        ),
-    ),
-)
 
-_DENSITY_CONVERSION_TABLE = _ConversionTableType(
-    dimension=DENSITY,
-    conversion_table=(
-        (
-            (GRAM_PER_CUBIC_CENTIMETER, KILOGRAM_PER_CUBIC_METER),
-            functools.partial(_basic_unit_converter, y=1000),
-        ),
-        (
-            (GRAM_PER_CUBIC_MILLILITER, KILOGRAM_PER_CUBIC_METER),
-            functools.partial(_basic_unit_converter, y=1000),
-        ),
-        (
-            (POUND_PER_CUBIC_FOOT, KILOGRAM_PER_CUBIC_METER),
-            functools.partial(_basic_unit_converter, y=16.0185),
-        ),
-        (
-            (POUND_PER_CUBIC_INCH, KILOGRAM_PER_CUBIC_METER),
-            functools.partial(_basic_unit_converter, y=27679.9),
-        ),
-        (
-            (SLUG_PER_CUBIC_FOOT, KILOGRAM_PER_CUBIC_METER),
-            functools.partial(_basic_unit_converter, y=515.3788),
+# ================
+# Dose Equivalent
+# ================
+@_unit_family("SIEVERT", "REM", "_DOSE_EQUIVALENT_TABLE")
+def _dose_equivalent_units() -> tuple:
+    dimension = (METER**2 / SECOND**2)._dimension
+    SIEVERT = _UnitType(
+        _quantity=DOSE_EQUIVALENT,
+        _dimension=dimension,
+        _unit_name="sievert",
+        _unit_symbol="Sv",
+        _order=None,
+    )
+
+    REM = _UnitType(
+        _quantity=DOSE_EQUIVALENT,
+        _dimension=dimension,
+        _unit_name="rem",
+        _unit_symbol="rem",
+        _order=None,
+    )
+
+    _DOSE_EQUIVALENT_TABLE = _ConversionTableType(
+        dimension=DOSE_EQUIVALENT,
+        conversion_table=(
+            ((SIEVERT, REM), _ConverterType(scale=100)),
         ),
-    ),
-)
-
-_POWER_CONVERSION_TABLE = _ConversionTableType(
-    dimension=POWER,
-    conversion_table=(
-        ((HORSEPOWER, WATT), functools.partial(_basic_unit_converter, y=745.7)),
-        ((BTU_PER_HOUR, WATT), functools.partial(_basic_unit_converter, y=0.293071)),
-    ),
-)
-
-_RADIOACTIVITY_CONVERSION_TABLE = _ConversionTableType(
-    dimension=RADIOACTIVITY,
-    conversion_table=(
-        ((CURIE, BECQUEREL), functools.partial(_basic_unit_converter, y=3.7e10)),
-    ),
-)
-
-_ABSORBED_DOSE_CONVERSION_TABLE = _ConversionTableType(
-    dimension=ABSORBED_DOSE,
-    conversion_table=(((GRAY, RAD), functools.partial(_basic_unit_converter, y=100)),),
-)
-
-_DOSE_EQUIVALENT_TABLE = _ConversionTableType(
-    dimension=DOSE_EQUIVALENT,
-    conversion_table=(
-        ((SIEVERT, REM), functools.partial(_basic_unit_converter, y=100)),
-    ),
-)
+    )
+    _UNIT_DEFINITIONS.append((SIEVERT, METER**2 / SECOND**2))
 
-# =========================================================================================
+    return SIEVERT, REM, _DOSE_EQUIVALENT_TABLE
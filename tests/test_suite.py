@@ -1,6 +1,7 @@
 import sys
 import os
 import math
+import operator
 import pytest
 from hypothesis import given, strategies as st
 import numpy as np
@@ -101,6 +102,65 @@ def test_vectorized_division(values):
         assert math.isclose(vi, li, rel_tol=1e-12)
 
 
+def test_sequence_value_is_native_buffer():
+    l = Length([1, 2, 3], METER)
+    assert isinstance(l.value, np.ndarray)
+    assert l.value.dtype == np.float64
+    doubled = l * 2
+    assert doubled.value.tolist() == [2.0, 4.0, 6.0]
+    assert get_unit_str(doubled) == "m"
+
+
+def test_sequence_conversion_whole_buffer():
+    l = Length([1, 2], METER)
+    inches = l.convert_to(INCH)
+    assert isinstance(inches.value, np.ndarray)
+    for a, b in zip(inches.value, [1 / 0.0254, 2 / 0.0254]):
+        assert math.isclose(a, b, rel_tol=1e-12)
+
+
+def test_conversion_into_out_buffer():
+    l = Length([1, 2, 3], METER)
+    out = np.empty(3)
+    result = l.convert_to(INCH, out=out)
+    assert result.value is out
+    for a, b in zip(out, [1 / 0.0254, 2 / 0.0254, 3 / 0.0254]):
+        assert math.isclose(a, b, rel_tol=1e-12)
+
+
+def test_conversion_table_lookup_and_extend():
+    from mudu.base import _UnitType, LENGTH, _ConversionTableType, _ConverterType
+
+    me_unit = _UnitType(_dimension=LENGTH, _unit_name="me_unit", _unit_symbol="m_u")
+    table = _ConversionTableType(dimension=LENGTH, conversion_table=())
+    assert table.lookup(me_unit, METER) is None
+    table.extend(((me_unit, METER), _ConverterType(scale=0.001)))
+    assert table.lookup(me_unit, METER) == _ConverterType(scale=0.001)
+    assert math.isclose(table.lookup(METER, me_unit).scale, 1000, rel_tol=1e-12)
+
+
+def test_converter_type_compose_and_invert():
+    from mudu.base import _ConverterType
+
+    kelvin_to_farenheit = _ConverterType(scale=1.8, offset=-459.67)
+    kelvin_to_celsius = _ConverterType(offset=-273.15)
+    farenheit_to_celsius = kelvin_to_farenheit.invert().compose(kelvin_to_celsius)
+    assert farenheit_to_celsius.is_affine
+    assert math.isclose(farenheit_to_celsius.apply(212), 100, rel_tol=1e-12)
+    values = farenheit_to_celsius.apply(np.array([32.0, 212.0]))
+    assert np.allclose(values, [0, 100])
+
+
+def test_multi_hop_conversion():
+    from mudu import MILE, FEET, NAUTICAL_MILE, YARD
+
+    assert math.isclose(Length(1, MILE).convert_to(FEET).value, 5280, rel_tol=1e-12)
+    assert math.isclose(
+        Length(1, NAUTICAL_MILE).convert_to(YARD).value, 1852 / 0.9144, rel_tol=1e-12
+    )
+    assert math.isclose(Length(12, INCH).convert_to(FEET).value, 1, rel_tol=1e-12)
+
+
 # ---------------------------
 # Force Tests
 # ---------------------------
@@ -146,6 +206,711 @@ def test_velocity_creation():
     assert get_dimension_str(v) == "L/T"
 
 
+def test_dimension_vectors():
+    from mudu import LENGTH, TIME, PLANE_ANGLE, SOLID_ANGLE, THERMODYNAMIC_TEMPERATURE
+
+    assert LENGTH / TIME == (METER / SECOND)._dimension
+    assert (LENGTH**2) ** 0.5 == LENGTH
+    assert len({PLANE_ANGLE, SOLID_ANGLE, THERMODYNAMIC_TEMPERATURE}) == 3
+    assert str(NEWTON._dimension) == "L*M/T**2"
+
+
+def test_generated_units_are_interned():
+    import gc
+    from mudu import OrderUnit, MILLI
+    from mudu.base import _UNIT_REGISTRY, _UNIT_ALGEBRA_CACHE
+
+    acceleration = METER / SECOND**2
+    assert acceleration is METER / (SECOND * SECOND)
+    assert (METER * SECOND) / SECOND is METER
+    assert OrderUnit(MILLI, METER) is OrderUnit(MILLI, METER)
+
+    key = next(k for k, v in _UNIT_REGISTRY.items() if v is acceleration)
+    del acceleration
+    _UNIT_ALGEBRA_CACHE.cache_clear()
+    gc.collect()
+    assert key not in _UNIT_REGISTRY
+
+
+def test_unit_algebra_memo_counts_hits():
+    from mudu.base import _UNIT_ALGEBRA_CACHE
+
+    _UNIT_ALGEBRA_CACHE.cache_clear()
+    first = NEWTON * METER
+    second = NEWTON * METER
+    assert first is second
+    info = _UNIT_ALGEBRA_CACHE.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_quantities_are_slotted_and_set_once():
+    l = Length([1.0, 2.0], METER)
+    f = Force(3.0, NEWTON)
+    assert not hasattr(l, "__dict__") and not hasattr(f, "__dict__")
+    with pytest.raises(ValueError):
+        l.value = 5.0
+    with pytest.raises(ValueError):
+        f.unit_type = DYNE
+    with pytest.raises(TypeError):
+        Length(None, METER)
+
+
+def test_operators_use_trusted_constructor(monkeypatch):
+    from mudu import SolidAngle, STERADIAN
+
+    def _validating_init(*args, **kwargs):
+        raise AssertionError("public constructor used on the arithmetic path")
+
+    a = Length([1.0, 2.0], METER)
+    b = Length(3.0, INCH)
+    f = Force(2.0, NEWTON)
+    monkeypatch.setattr(Length, "__init__", _validating_init)
+    monkeypatch.setattr(Force, "__init__", _validating_init)
+
+    total = a + b
+    assert type(total) is Length and total.unit == "meter"
+    assert np.allclose(total.value, [1.0762, 2.0762])
+    converted = f.convert_to(DYNE)
+    assert type(converted) is Force and converted.quantity == f.quantity
+    assert (SolidAngle(2.0) * 2).dimension == STERADIAN._dimension
+
+
+# ---------------------------
+# NumPy Protocol Tests
+# ---------------------------
+
+
+def test_ufuncs_follow_dimension_rules():
+    from mudu import DEGREE, DimensionError
+    from mudu.dimensions import Angle
+
+    l = Length([1.0, 4.0, 9.0], METER)
+    total = np.add(l, Length([12.0, 24.0, 36.0], INCH))
+    assert type(total) is Length and total.unit_type is METER
+    assert np.allclose(total.value, [1.3048, 4.6096, 9.9144])
+
+    root = np.sqrt(l * l)
+    assert type(root) is Length and np.allclose(root.value, l.value)
+    assert np.multiply(l, Time(2.0, SECOND)).unit_type is METER * SECOND
+    assert np.allclose(np.sin(Angle([0.0, 90.0], DEGREE)), [0.0, 1.0])
+    assert np.less(l, Length(100.0, INCH)).tolist() == [True, False, False]
+    with pytest.raises(DimensionError):
+        np.add(l, Time(1.0, SECOND))
+    with pytest.raises(DimensionError):
+        np.cos(l)
+    with pytest.raises(TypeError):
+        np.exp(l)
+
+
+def test_unit_preserving_reductions():
+    from mudu import FEET
+
+    grid = Length(np.arange(12.0).reshape(3, 4), METER)
+    assert type(grid.sum()) is Length and grid.sum().value == 66.0
+    assert np.allclose(grid.mean(axis=1).value, [1.5, 5.5, 9.5])
+    assert np.allclose(grid.max(axis=0).value, [8.0, 9.0, 10.0, 11.0])
+    assert grid.cumsum(axis=1).value.shape == (3, 4)
+    assert grid.percentile(50).value == 5.5
+    assert np.isclose(grid.std().value, np.std(np.arange(12.0)))
+
+    samples = Length([1.0, np.nan, 3.0], FEET)
+    assert np.nansum(samples).value == 4.0 and np.nanmean(samples).unit_type is FEET
+    assert math.isnan(np.sum(samples).value)
+
+    series = Length([1e16, 1.0, -1e16], METER)
+    assert series.sum(compensated=True).value == 1.0
+
+
+def test_nd_quantity_arrays_views_and_broadcasting():
+    grid = Length(np.arange(24.0).reshape(2, 3, 4), METER)
+    assert grid.shape == (2, 3, 4) and grid.T.shape == (4, 3, 2)
+    assert grid.reshape(6, 4).shape == (6, 4)
+
+    view = grid[0, 1:]
+    assert type(view) is Length and view.unit_type is METER
+    assert np.shares_memory(view.value, grid.value)
+    picked = grid[[0, 1], 0, 0]
+    assert not np.shares_memory(picked.value, grid.value)
+    assert grid[1, 2, 3].value == 23.0
+    assert [row.shape for row in grid] == [(3, 4), (3, 4)]
+
+    scaled = grid * np.array([1, 2, 3, 4])
+    assert scaled.shape == (2, 3, 4) and scaled.value[0, 0, 3] == 12.0
+    shifted = grid + Length(np.full(4, 12.0), INCH)
+    assert np.isclose(shifted.value[0, 0, 0], 0.3048)
+    joined = np.concatenate([Length([1.0], METER), Length([12.0], INCH)])
+    assert np.allclose(joined.value, [1.0, 0.3048])
+
+
+def test_vectorized_comparisons_and_masks(monkeypatch):
+    import mudu.dimensions as dimensions
+    from mudu import KNOT, METER_PER_SECOND
+    from mudu.dimensions import Speed
+
+    airspeed = Speed(np.array([100.0, 130.0, 140.0]), METER_PER_SECOND)
+    threshold = Speed(250.0, KNOT)
+
+    converted = []
+    unit_conversion = dimensions._unit_conversion
+
+    def _recording_conversion(quantity, _to, out=None):
+        converted.append(np.size(quantity.value))
+        return unit_conversion(quantity, _to, out=out)
+
+    monkeypatch.setattr(dimensions, "_unit_conversion", _recording_conversion)
+    mask = airspeed > threshold
+    assert isinstance(mask, np.ndarray) and mask.dtype == bool
+    assert mask.tolist() == [False, True, True]
+    assert (threshold < airspeed).tolist() == mask.tolist()
+    assert converted == [1, 1]
+
+    assert np.allclose(airspeed[mask].value, [130.0, 140.0])
+    assert (airspeed != airspeed).tolist() == [False, False, False]
+    kept = np.where(mask, airspeed, Speed(0.0, KNOT))
+    assert kept.value.tolist() == [0.0, 130.0, 140.0]
+    assert np.allclose(airspeed.clip(max=threshold).value, [100.0, 128.6111, 128.6111])
+
+
+def test_bulk_constructors_share_buffers():
+    from mudu import FEET, FOOT_PER_SECOND
+    from mudu.dimensions import Speed, DerivedQuantity
+
+    samples = np.arange(6.0)
+    wrapped = Length.from_array(samples, METER)
+    assert np.shares_memory(wrapped.value, samples)
+    with pytest.raises(ValueError):
+        Length.from_array(np.arange(6), METER)
+    assert Length.from_array(np.arange(3), METER, copy=None).value.dtype == np.float64
+
+    buffer = bytearray(np.arange(4.0).tobytes())
+    from_buffer = Length.from_buffer(buffer, FEET)
+    buffer[:8] = np.float64(9.0).tobytes()
+    assert from_buffer.value.tolist() == [9.0, 1.0, 2.0, 3.0]
+
+    sweep = Speed.arange(300, 1600, 100, FOOT_PER_SECOND)
+    assert type(sweep) is Speed and sweep.shape == (13,)
+    assert Length.linspace(0.0, 1.0, 5, METER).value[1] == 0.25
+    assert Force.full((2, 3), 2.0, NEWTON).shape == (2, 3)
+    zeros = DerivedQuantity.zeros(4, METER / SECOND)
+    assert zeros.unit_type is METER / SECOND and not zeros.value.any()
+
+
+def test_memory_mapped_quantities_stream_in_chunks(tmp_path, monkeypatch):
+    import mudu.dimensions as dimensions
+    from mudu import FEET
+    from mudu.mapped import create_mapped, open_mapped, write_header
+
+    monkeypatch.setattr(dimensions, "_CHUNK_SIZE", 4)
+    path = tmp_path / "altitude.bin"
+    np.arange(10, dtype=np.float32).tofile(path)
+    write_header(path, FEET, dtype=np.float32)
+
+    altitude = open_mapped(path, Length)
+    assert isinstance(altitude.value, np.memmap) and altitude.unit_type is FEET
+    assert altitude.sum().value == 45.0 and altitude.max().value == 9.0
+
+    out = create_mapped(tmp_path / "altitude_m.bin", Length, 10, METER)
+    converted = altitude.convert_to(METER, out=out.value)
+    assert converted.value is out.value
+    assert np.allclose(converted.value, np.arange(10) * 0.3048)
+    reopened = open_mapped(tmp_path / "altitude_m.bin", Length)
+    assert reopened.unit_type is METER and np.isclose(reopened.value[9], 2.7432)
+
+
+def test_memory_mapped_views_and_axis_reductions(tmp_path, monkeypatch):
+    import mudu.dimensions as dimensions
+    from mudu.exceptions import OperationNotAvailable
+    from mudu.mapped import open_mapped
+
+    monkeypatch.setattr(dimensions, "_CHUNK_SIZE", 5)
+    path = tmp_path / "grid.bin"
+    grid = np.arange(21, dtype=np.float32).reshape(7, 3) ** 1.5
+    grid.tofile(path)
+    mapped = open_mapped(path, Length, METER, dtype=np.float32, shape=(7, 3))
+
+    for view in (mapped[2:5], mapped.reshape(21), mapped.T):
+        assert isinstance(view.value, np.memmap) and view.value.dtype == np.float32
+    assert (mapped * 2).value.dtype == np.float64
+
+    expected = grid.astype(np.float64)
+    for axis in (None, 0, 1):
+        assert np.allclose(mapped.sum(axis).value, expected.sum(axis))
+        assert np.allclose(mapped.T.max(axis).value, expected.T.max(axis))
+        assert np.allclose(mapped.cumsum(axis).value, expected.cumsum(axis))
+        assert np.allclose(mapped.std(axis, ddof=1).value, expected.std(axis, ddof=1))
+    with pytest.raises(OperationNotAvailable):
+        mapped.percentile(50)
+
+
+def test_mapped_header_round_trips_units(tmp_path):
+    from mudu import PSI, POUND_FORCE, MILLI, OrderUnit, Pressure
+    from mudu.mapped import open_mapped, read_header, write_header
+
+    path = tmp_path / "pressure.bin"
+    np.arange(4.0).tofile(path)
+    write_header(path, PSI)
+    assert open_mapped(path, Pressure).unit_type is PSI
+
+    # the layout that is not given is read from the header
+    grid = tmp_path / "grid.bin"
+    np.arange(67.0).tofile(grid)
+    write_header(grid, PSI, shape=(13, 5), offset=16)
+    opened = open_mapped(grid, Pressure, PSI, dtype=np.float64)
+    assert opened.shape == (13, 5) and opened.value[0, 0] == 2.0
+
+    millimeter = OrderUnit(MILLI, METER)
+    for unit in (POUND_FORCE, millimeter, METER / SECOND**2, PSI**0.5):
+        write_header(path, unit)
+        assert read_header(path)["unit"] is unit
+
+
+def test_stream_convert_in_chunks():
+    from mudu import FEET, KILOMETER, PSI, BAR, PASCAL, stream
+
+    feet = iter(range(5))
+    converted = list(stream.convert(feet, FEET, METER, chunk=2))
+    assert np.allclose(converted, np.arange(5) * 0.3048)
+
+    mixed = [(1, FEET), 3, (1, KILOMETER)]
+    batches = list(stream.convert(mixed, METER, METER, chunk=2, chunks=True))
+    assert [b.tolist() for b in batches] == [[0.3048, 3.0], [1000.0]]
+    assert list(stream.convert([(1, BAR)], None, PASCAL)) == [100000.0]
+    with pytest.raises(ValueError):
+        list(stream.convert([1.0], None, PSI))
+
+
+def test_mixed_unit_batch_conversion():
+    from mudu import Pressure, Temperature, PSI, BAR, inHg, PASCAL
+    from mudu import KILO, OrderUnit
+    from mudu import CELSIUS, FARENHEIT, KELVIN
+    from mudu.conversion import unit_codes, convert_mixed
+
+    table = Pressure._conversion_standards
+    codes = unit_codes([PSI, BAR, inHg, PSI], table)
+    assert [table.units()[code] for code in codes] == [PSI, BAR, inHg, PSI]
+    pascals = convert_mixed([14.7, 1.0, 29.92, 1.0], codes, table, PASCAL)
+    assert np.allclose(pascals, [101352.972, 100000.0, 101320.759, 6894.76])
+
+    kilopascal = OrderUnit(KILO, PASCAL)
+    codes = unit_codes([kilopascal, PSI, BAR, kilopascal], table)
+    assert table.units()[codes[0]] is kilopascal
+    assert unit_codes([kilopascal], table)[0] == codes[0]
+    pascals = convert_mixed([101.325, 14.7, 1.0, 1.0], codes, table, PASCAL)
+    assert np.allclose(pascals, [101325.0, 101352.972, 100000.0, 1000.0])
+
+    table = Temperature._conversion_standards
+    codes = unit_codes([CELSIUS, FARENHEIT, KELVIN], table)
+    out = np.empty(3)
+    kelvins = convert_mixed([100.0, 212.0, 0.0], codes, table, KELVIN, out=out)
+    assert kelvins is out and np.allclose(out, [373.15, 373.15, 0.0])
+
+
+def test_compiled_converter_is_picklable():
+    import pickle
+    from mudu import FEET, CELSIUS, FARENHEIT
+    from mudu.conversion import compile_converter
+
+    feet_to_meter = compile_converter(FEET, METER)
+    assert feet_to_meter(10.0) == 3.048
+    assert np.allclose(feet_to_meter([1, 2]), [0.3048, 0.6096])
+    out = np.empty(3)
+    assert feet_to_meter(np.arange(3.0), out=out) is out
+
+    compiled = pickle.dumps(compile_converter(CELSIUS, FARENHEIT))
+    celsius_to_farenheit = pickle.loads(compiled)
+    assert celsius_to_farenheit(100) == 212.0
+    assert np.allclose(celsius_to_farenheit(np.array([0.0, -40.0])), [32.0, -40.0])
+
+    # mismatched units raise the same error as `convert_to`
+    from mudu.exceptions import ConversionError
+
+    with pytest.raises(ConversionError):
+        Length(1, FEET).convert_to(SECOND)
+    with pytest.raises(ConversionError):
+        compile_converter(FEET, SECOND)
+    with pytest.raises(ConversionError):
+        compile_converter(METER / SECOND, FEET)
+
+
+def test_composite_units_convert_by_decomposition():
+    from mudu import (
+        FEET,
+        SLUG,
+        KILOGRAM,
+        KILOMETER,
+        HOUR,
+        METER_PER_SECOND,
+        KILOGRAM_PER_CUBIC_METER,
+        POUND_FORCE,
+        CELSIUS,
+        KELVIN,
+        ConversionError,
+        Mass,
+    )
+    from mudu.dimensions import DerivedQuantity
+
+    density = 0.00089068 * (Mass(1, SLUG) / Length(1, FEET) ** 3)
+    converted = density.convert_to(KILOGRAM_PER_CUBIC_METER)
+    assert np.isclose(converted.value, 0.00089068 * 515.3788)
+
+    speed = DerivedQuantity([36.0, 72.0], KILOMETER / HOUR)
+    assert np.allclose(speed.convert_to(METER_PER_SECOND).value, [10.0, 20.0])
+    pound_force = Force(1, POUND_FORCE).convert_to(KILOGRAM * METER / SECOND**2)
+    assert np.isclose(pound_force.value, 4.44822)
+    assert Mass(1, SLUG).convert_to(KILOGRAM).value == 14.593903
+    with pytest.raises(ConversionError):
+        DerivedQuantity(1.0, KELVIN / SECOND).convert_to(CELSIUS / SECOND)
+
+
+# budget of the cumulative `import mudu` time once numpy is imported, in seconds, as
+# measured by -X importtime: about 0.02 s, against 0.58 s when sympy was imported
+# eagerly; the headroom keeps it stable on loaded machines
+IMPORT_TIME_BUDGET = 0.25
+
+
+def _import_mudu():
+    import subprocess
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    return subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, numpy, mudu; print('sympy' in sys.modules)",
+        ],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_is_sympy_free():
+    result = _import_mudu()
+    assert result.stdout.strip() == "False"
+
+    from mudu import KILOGRAM
+    from mudu.dimensions import DerivedQuantity
+
+    force = DerivedQuantity(1, KILOGRAM * METER / SECOND**2)
+    assert str(force.symbol) == "kg*m/s**2"
+    assert str(force.dimension) == "L*M/T**2"
+
+
+@pytest.mark.timing
+def test_import_is_within_budget():
+    result = _import_mudu()
+
+    # "import time: self [us] | cumulative | mudu"
+    line = [l for l in result.stderr.splitlines() if l.endswith("| mudu")][-1]
+    cumulative = int(line.split("|")[1]) / 1e6
+    assert cumulative < IMPORT_TIME_BUDGET
+
+
+def test_as_sympy_with_symbolic_extra():
+    pytest.importorskip("sympy")
+    from mudu import KILOGRAM
+    from mudu.dimensions import DerivedQuantity
+
+    force = DerivedQuantity(1, KILOGRAM * METER / SECOND**2)
+    assert str(force.symbol.as_sympy()) == "kg*m/s**2"
+    assert str(force.dimension.as_sympy()) == "L*M/T**2"
+
+
+def test_unit_families_load_on_first_access():
+    import subprocess
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    script = (
+        "import mudu\n"
+        "from mudu import Length, METER\n"
+        "assert 'SIEVERT' not in vars(mudu.units)\n"
+        "assert len(mudu.units._CONVERSION_TABLES) == 5\n"
+        "from mudu import Force, NEWTON, DYNE\n"
+        "assert 'SIEVERT' not in vars(mudu.units)\n"
+        "assert Force(1, NEWTON).convert_to(DYNE).value == 100000\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+
+    import mudu
+    from mudu import SIEVERT, REM, DoseEquivalent, Voltage, VOLT
+    from mudu.units import _DOSE_EQUIVALENT_TABLE
+
+    assert SIEVERT is mudu.units.SIEVERT
+    assert DoseEquivalent._conversion_standards is _DOSE_EQUIVALENT_TABLE
+    assert DoseEquivalent(1, SIEVERT).convert_to(REM).value == 100
+    assert Voltage(3).unit_type is VOLT
+    assert "CURIE" in dir(mudu) and "Illuminance" in dir(mudu)
+    namespace = {}
+    exec("from mudu import *", namespace)
+    assert namespace["CURIE"] is mudu.units.CURIE and "Length" in namespace
+    with pytest.raises(AttributeError):
+        mudu.NOT_A_UNIT
+
+
+def test_registry_snapshot_round_trip(tmp_path):
+    import pickle
+    import subprocess
+    from mudu import SnapshotError
+    from mudu.snapshot import MAGIC, load_snapshot, read_snapshot_header
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    path = tmp_path / "registry.mudu"
+    save = (
+        "from mudu import Length, METER, LENGTH, SECOND\n"
+        "from mudu.base import _UnitType, _ConverterType\n"
+        "from mudu.snapshot import save_snapshot\n"
+        "ME_UNIT = _UnitType(_dimension=LENGTH, _unit_name='me_unit', _unit_symbol='m_u')\n"
+        "Length._conversion_standards.extend(((ME_UNIT, METER), _ConverterType(scale=0.001)))\n"
+        "METER / SECOND\n"
+        f"save_snapshot({str(path)!r})\n"
+    )
+    load = (
+        "import operator, mudu\n"
+        "from mudu import Length, FEET, METER, SECOND\n"
+        "from mudu.snapshot import load_snapshot\n"
+        f"ME_UNIT = load_snapshot({str(path)!r})['me_unit']\n"
+        "assert abs(Length(1000, ME_UNIT).convert_to(FEET).value - 3.28084) < 1e-5\n"
+        "key = (operator.truediv, id(METER), id(SECOND), None)\n"
+        "assert mudu.base._UNIT_ALGEBRA_CACHE.get(key) is METER / SECOND\n"
+    )
+    subprocess.run([sys.executable, "-c", save], cwd=root, check=True)
+    subprocess.run([sys.executable, "-c", load], cwd=root, check=True)
+
+    header = read_snapshot_header(path)
+    assert header["version"] == __import__("mudu").__version__
+
+    # a snapshot of another mudu version is rejected
+    stale = tmp_path / "stale.mudu"
+    stale.write_bytes(MAGIC + pickle.dumps({"format": 1, "version": "0.0.1"}))
+    with pytest.raises(SnapshotError):
+        load_snapshot(stale)
+    with pytest.raises(SnapshotError):
+        read_snapshot_header(__file__)
+
+
+def test_snapshot_restores_the_state_in_use_lazily(tmp_path):
+    import subprocess
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    path, state_path = tmp_path / "registry.mudu", tmp_path / "state.json"
+    state = (
+        "import json\n"
+        "from mudu import units\n"
+        "def state():\n"
+        "    return {\n"
+        "        str(table.dimension): sorted(\n"
+        "            f'{unit._unit_name}>{to._unit_name}:{converter.scale!r}:{hops}'\n"
+        "            for unit, to, converter, hops in table._resolved.values()\n"
+        "        )\n"
+        "        for table in units._CONVERSION_TABLES\n"
+        "    }\n"
+    )
+    save = state + (
+        "from mudu import Length, METER, FEET, LENGTH, KILO, OrderUnit\n"
+        "from mudu import Pressure, PSI, PASCAL\n"
+        "from mudu.base import _UnitType, _ConverterType\n"
+        "from mudu.snapshot import save_snapshot\n"
+        "ME_UNIT = _UnitType(_dimension=LENGTH, _unit_name='me_unit', _unit_symbol='m_u')\n"
+        "Length._conversion_standards.extend(((ME_UNIT, METER), _ConverterType(scale=0.001)))\n"
+        "Length(1, ME_UNIT).convert_to(FEET)\n"
+        "Pressure(1, PSI).convert_to(OrderUnit(KILO, PASCAL))\n"
+        f"save_snapshot({str(path)!r})\n"
+        f"json.dump(state(), open({str(state_path)!r}, 'w'))\n"
+    )
+    load = state + (
+        "from mudu.snapshot import load_snapshot\n"
+        f"ME_UNIT = load_snapshot({str(path)!r})['me_unit']\n"
+        "# the pressure family is restored when it is first used, not on load\n"
+        "assert 'PSI' not in vars(units)\n"
+        "from mudu import PSI\n"
+        f"assert state() == json.load(open({str(state_path)!r}))\n"
+        "table = units._LENGTH_CONVERSION_TABLE\n"
+        "assert any(unit is ME_UNIT for unit in table.units())\n"
+        "resolved = [u for entry in table._resolved.values() for u in entry[:2]]\n"
+        "assert any(unit is ME_UNIT for unit in resolved)\n"
+        "assert all(u is ME_UNIT for u in resolved if u._unit_name == 'me_unit')\n"
+        "assert 'SIEVERT' not in vars(units)\n"
+    )
+    subprocess.run([sys.executable, "-c", save], cwd=root, check=True)
+    subprocess.run([sys.executable, "-c", load], cwd=root, check=True)
+
+
+def test_snapshot_of_a_lambda_standard_names_it(tmp_path):
+    import subprocess
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    script = (
+        "from mudu import Length, METER, LENGTH, SnapshotError\n"
+        "from mudu.base import _UnitType\n"
+        "from mudu.snapshot import save_snapshot\n"
+        "ME_UNIT = _UnitType(_dimension=LENGTH, _unit_name='me_unit', _unit_symbol='m_u')\n"
+        "converter = lambda x, invert=False: x * 1000 if invert else x / 1000\n"
+        "Length._conversion_standards.extend(((ME_UNIT, METER), converter))\n"
+        "try:\n"
+        f"    save_snapshot({str(tmp_path / 'registry.mudu')!r})\n"
+        "except SnapshotError as error:\n"
+        "    assert 'from me_unit to meter' in str(error), error\n"
+        "else:\n"
+        "    raise AssertionError('no SnapshotError')\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+
+
+def test_unit_rendering_styles_and_summarized_reprs():
+    from mudu import KILOGRAM, set_printoptions, get_printoptions
+    from mudu.dimensions import DerivedQuantity
+
+    unit = KILOGRAM * METER / SECOND**2
+    force = DerivedQuantity(np.arange(1e6), unit)
+    options = get_printoptions()
+    try:
+        # units print as at the baseline unless another style is set
+        assert repr(unit) == "kgm/s^2" and repr(METER / SECOND**2) == "m/s^2"
+        assert unit.render("plain") == "kg*m/s**2"
+        assert unit.render("caret") == "kg*m/s^2"
+        assert unit.render("unicode") == "kg·m/s²"
+        assert unit.render("latex") == r"\frac{\mathrm{kg}\,\mathrm{m}}{\mathrm{s}^{2}}"
+        assert (METER / (KILOGRAM * SECOND**2)).render("caret") == "m/(kg*s^2)"
+        # rendered once per unit and style
+        assert unit._rendered["caret"] is unit.render("caret")
+
+        text = repr(force)
+        assert "..." in text and text.endswith(" kg*m/s**2") and len(text) < 200
+        set_printoptions(unit_style="unicode", threshold=10**7)
+        assert str(force[:3]) == "[0. 1. 2.] kg·m/s²"
+        assert str(Length(3, INCH)) == "3 in"
+        set_printoptions(unit_style="plain")
+        assert repr(unit) == "kg*m/s**2"
+        with pytest.raises(ValueError):
+            set_printoptions(unit_style="html")
+    finally:
+        set_printoptions(**options)
+
+
+def test_parse_unit_expressions():
+    from mudu import (
+        KILO,
+        MILLI,
+        KILOGRAM,
+        NEWTON,
+        POUND_FORCE,
+        FEET,
+        METER_PER_SECOND,
+        OrderUnit,
+        UnitParseError,
+        parse_unit,
+    )
+    import subprocess
+    from mudu.parsing import _FAILED_PARSES, _PARSED_UNITS
+
+    assert parse_unit("kN*m/s^2") is OrderUnit(KILO, NEWTON) * METER / SECOND**2
+    assert parse_unit("kg*m/s**2") is KILOGRAM * METER / SECOND**2
+    assert parse_unit("kg/(m*s^2)") is KILOGRAM / (METER * SECOND**2)
+    assert parse_unit("kilonewton") is parse_unit("kN")
+    assert parse_unit("lbf") is POUND_FORCE and parse_unit("meter") is METER
+    assert parse_unit("mm") is OrderUnit(MILLI, METER)
+    assert parse_unit("m/s") is METER_PER_SECOND
+    assert parse_unit("1/s") is SECOND**-1 and parse_unit("s^-1") is SECOND**-1
+    assert parse_unit("ft^(1/2)") is FEET**0.5
+
+    # repeated strings are answered by the memo
+    hits = _PARSED_UNITS.hits
+    assert parse_unit("kN*m/s^2") is parse_unit("kN*m/s^2")
+    assert _PARSED_UNITS.hits == hits + 2
+
+    for text in ("furlong", "m/", "(m", "2*m", "m^x", ""):
+        with pytest.raises(UnitParseError):
+            parse_unit(text)
+
+    # so are failures, until a conversion table is extended
+    hits = _FAILED_PARSES.hits
+    with pytest.raises(UnitParseError):
+        parse_unit("furlong")
+    assert _FAILED_PARSES.hits == hits + 1
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    script = (
+        "from mudu import Length, METER, LENGTH, UnitParseError, parse_unit\n"
+        "from mudu.base import _UnitType, _ConverterType\n"
+        "try:\n"
+        "    parse_unit('fur')\n"
+        "except UnitParseError:\n"
+        "    pass\n"
+        "FURLONG = _UnitType(_dimension=LENGTH, _unit_name='furlong', _unit_symbol='fur')\n"
+        "Length._conversion_standards.extend(((FURLONG, METER), _ConverterType(scale=201.168)))\n"
+        "assert parse_unit('fur') is FURLONG\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+
+
+def test_numpy_scalars_and_lists_as_operands():
+    from mudu.dimensions import DerivedQuantity
+
+    length = Length(2.0, METER)
+    speed = DerivedQuantity(4.0, METER / SECOND)
+    assert (length * np.int64(3)).value == 6.0 and (length / np.int32(2)).value == 1.0
+    assert np.allclose((length * [1, 2]).value, [2.0, 4.0])
+    assert (speed * np.float32(0.5)).value == 2.0
+    assert np.allclose((speed / (1, 2)).value, [4.0, 2.0])
+    assert (np.int64(1) / length).unit_type == METER**-1
+    for operand in ("2", object()):
+        for operation in (operator.mul, operator.truediv):
+            with pytest.raises(TypeError):
+                operation(length, operand)
+            with pytest.raises(TypeError):
+                operation(speed, operand)
+
+
+def test_sequence_values_keep_shape_and_reject_quantities():
+    from mudu import FEET
+
+    assert Length(np.array(5.0), METER).shape == ()
+    with pytest.raises(TypeError):
+        Length([Length(1, FEET), Length(2, FEET)], METER)
+
+
+def test_generated_units_equal_after_copying():
+    import copy
+    import pickle
+
+    speed = METER / SECOND
+    assert pickle.loads(pickle.dumps(speed)) == speed
+    assert copy.deepcopy(speed) == speed
+    assert copy.deepcopy(speed) != SECOND / METER
+    assert copy.deepcopy(speed) != METER
+
+
+def test_decomposed_conversions_skip_the_table_search(monkeypatch):
+    import subprocess
+    import mudu.dimensions as dimensions
+    from mudu import FEET
+
+    acceleration, to_unit = METER / SECOND**2, FEET / SECOND**2
+    converter = dimensions._resolve_units(acceleration, to_unit)
+
+    def no_search(unit_type):
+        raise AssertionError("the conversion tables were searched again")
+
+    monkeypatch.setattr(dimensions, "_conversion_table_of", no_search)
+    assert dimensions._resolve_units(acceleration, to_unit) is converter
+
+    # a standard added since then for the pair is used instead
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    script = (
+        "from mudu import Length, METER, FEET, SECOND\n"
+        "from mudu.base import _ConverterType\n"
+        "from mudu.dimensions import _resolve_units\n"
+        "pair = (METER / SECOND**2, FEET / SECOND**2)\n"
+        "assert abs(_resolve_units(*pair).scale - 3.28084) < 1e-5\n"
+        "Length._conversion_standards.extend((pair, _ConverterType(scale=3.0)))\n"
+        "assert _resolve_units(*pair).scale == 3.0\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+
+
 # ---------------------------
 # Unit Registration (Optional)
 # ---------------------------